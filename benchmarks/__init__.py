@@ -0,0 +1,5 @@
+"""
+Reproducible performance benchmarks for the hot views, PDFs and APIs.
+
+Run with `python manage.py run_benchmarks` (see README, "Benchmarks").
+"""
@@ -0,0 +1,140 @@
+"""
+Benchmark cases.
+
+A case is a callable taking a BenchmarkContext and doing one unit of work
+(usually one request through the test client). Cases are timed by the runner.
+"""
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.forms import JobEntryForm
+from jobs.models import JobEntry
+from jobs.pdf_generator import generate_job_pdf, generate_statistics_pdf, generate_monthly_report_pdf
+from jobs.utils import get_statistics_data
+from jobs.views.view_statistics import _query_monthly_report_job_entries
+
+
+@dataclass
+class BenchmarkContext:
+    """Everything a case needs: the dataset user, a logged-in client and a sample job"""
+    user: User
+    client: Client
+    job: JobEntry
+    year: int
+    month: int
+    extra: dict = field(default_factory=dict)
+
+
+def _check(response, expected=200):
+    if response.status_code != expected:
+        raise AssertionError(f'{response.request["PATH_INFO"]} returned {response.status_code}')
+    return response
+
+
+def _edit_job_post_data(context):
+    """Valid edit_job POST data for the sample job, with a changed note"""
+    form = JobEntryForm(instance=context.job, user=context.user)
+    data = {}
+    for name, form_field in form.fields.items():
+        value = form[name].value()
+        if value is None or value is False:
+            continue
+        if value is True:
+            data[name] = 'on'
+        elif isinstance(value, (list, tuple)):
+            data[name] = [str(item) for item in value]
+        else:
+            data[name] = form_field.widget.format_value(value) or ''
+    context.extra['edits'] = context.extra.get('edits', 0) + 1
+    data['notes'] = f'Benchmark edit {context.extra["edits"]}'
+    return data
+
+
+def job_list(context):
+    _check(context.client.get(reverse('jobs:job_list')))
+
+
+def job_list_filtered(context):
+    _check(context.client.get(reverse('jobs:job_list'), {'status': 'applied', 'search': 'Python'}))
+
+
+def job_detail(context):
+    _check(context.client.get(reverse('jobs:job_detail', args=[context.job.id])))
+
+
+def edit_job(context):
+    _check(context.client.post(reverse('jobs:edit_job', args=[context.job.id]), _edit_job_post_data(context)), 302)
+
+
+def statistics(context):
+    _check(context.client.get(reverse('jobs:statistics')))
+
+
+def monthly_report(context):
+    _check(context.client.get(reverse('jobs:monthly_report'), {'year': context.year, 'month': context.month}))
+
+
+def job_pdf(context):
+    generate_job_pdf(context.job, 'en')
+
+
+def statistics_pdf(context):
+    data = get_statistics_data(JobEntry.objects.filter(user=context.user), context.user)
+    generate_statistics_pdf(data, context.user.username, 'en')
+
+
+def monthly_report_pdf(context):
+    entries = _query_monthly_report_job_entries(context.user, context.year, context.month)
+    generate_monthly_report_pdf(entries, context.year, context.month, context.user.username, 'en')
+
+
+def api_calendar(context):
+    _check(context.client.get('/api/v1/calendar/'))
+
+
+def api_jobs_list(context):
+    _check(context.client.get('/api/v1/jobs/'))
+
+
+def api_jobs_search(context):
+    _check(context.client.get('/api/v1/jobs/', {'search': 'Python', 'status': 'applied'}))
+
+
+CASES = {
+    'job_list': job_list,
+    'job_list_filtered': job_list_filtered,
+    'job_detail': job_detail,
+    'edit_job': edit_job,
+    'statistics': statistics,
+    'monthly_report': monthly_report,
+    'job_pdf': job_pdf,
+    'statistics_pdf': statistics_pdf,
+    'monthly_report_pdf': monthly_report_pdf,
+    'api_calendar': api_calendar,
+    'api_jobs_list': api_jobs_list,
+    'api_jobs_search': api_jobs_search,
+}
+
+
+def make_client(user):
+    """
+    Test client logged in as `user` that passes ALLOWED_HOSTS and SECURE_SSL_REDIRECT
+    outside the test runner.
+    """
+    host = next((host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost')
+    client = Client(HTTP_HOST=host, **{'wsgi.url_scheme': 'http' if settings.DEBUG else 'https'})
+    client.force_login(user)
+    return client
+
+
+def build_context(user):
+    """Logged-in client and the most recent job (with a status history) of the dataset user"""
+    client = make_client(user)
+    job = JobEntry.objects.filter(user=user).exclude(status='not_applied').order_by('-created_at').first()
+    now = timezone.now()
+    return BenchmarkContext(user=user, client=client, job=job, year=now.year, month=now.month)
@@ -0,0 +1,51 @@
+"""
+Deterministic benchmark datasets.
+
+Each dataset belongs to its own user (bench_<size>) and holds `size` job entries
+generated by jobs.dataset_generator, so the same size and seed always produce
+the same rows, relative to the day they are seeded.
+"""
+from django.contrib.auth.models import User
+
+from jobs.caching import bump_user_generation
+from jobs.dataset_generator import DatasetGenerator
+from jobs.models import JobEntry, Notification, UserProfile
+
+
+BENCHMARK_PASSWORD = 'benchmark'
+
+
+def dataset_username(size):
+    return f'bench_{size}'
+
+
+def seed_dataset(size, seed=0, batch_size=2000):
+    """
+    Create (or reuse) the benchmark dataset of `size` job entries.
+
+    Writes to (and deletes from) the default database: run_benchmarks only
+    calls it with DEBUG on or --allow-live-db.
+
+    Args:
+        size: Number of job entries
+        seed: Random seed; the same seed always produces the same rows
+        batch_size: Rows per bulk_create batch
+
+    Returns:
+        The dataset's user
+    """
+    username = dataset_username(size)
+    user, created = User.objects.get_or_create(username=username, defaults={'email': f'{username}@example.com'})
+    if created:
+        user.set_password(BENCHMARK_PASSWORD)
+        user.save()
+    UserProfile.objects.get_or_create(user=user)
+    if not created and JobEntry.objects.filter(user=user).count() == size:
+        return user
+
+    JobEntry.objects.filter(user=user).delete()
+    Notification.objects.filter(user=user).delete()
+    DatasetGenerator(seed=seed, batch_size=batch_size).generate_jobs(user, size)
+    # Signals were bypassed - drop anything cached for the previous rows
+    bump_user_generation(user)
+    return user
@@ -0,0 +1,264 @@
+"""
+Load testing: concurrent virtual users replaying weighted sessions.
+
+Each virtual user logs in as one of the generated users (see generate_dataset)
+and keeps picking a session by weight, running its steps in order until the
+test ends. Requests go either through the Django test client in this process
+(one thread per virtual user) or over HTTP to a running server. In both modes
+the users share the database and cache, so write locks, signal work and cache
+invalidation compete the way they do in production.
+"""
+import http.cookiejar
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.urls import reverse
+
+from jobs.models import JobEntry
+
+from .cases import BenchmarkContext, _edit_job_post_data, make_client
+from .runner import _percentile
+
+
+# Steps: name -> (method, path, query or POST data); `job` is the job picked for the session
+STEPS = {
+    'dashboard': lambda vu, job: ('GET', reverse('jobs:dashboard'), None),
+    'job_list': lambda vu, job: ('GET', reverse('jobs:job_list'), None),
+    'job_list_filtered': lambda vu, job: ('GET', reverse('jobs:job_list'), {
+        'status': vu.rng.choice(['applied', 'rejected', 'interview_scheduled']),
+        'search': vu.rng.choice(['Python', 'Engineer', 'Developer', 'SAP']),
+        'sort': vu.rng.choice(['-created_at', 'employer']),
+    }),
+    'job_detail': lambda vu, job: ('GET', reverse('jobs:job_detail', args=[job.id]), None),
+    'edit_job': lambda vu, job: ('POST', reverse('jobs:edit_job', args=[job.id]), _edit_job_post_data(
+        BenchmarkContext(user=vu.user, client=None, job=job, year=0, month=0, extra=vu.extra)
+    )),
+    'statistics': lambda vu, job: ('GET', reverse('jobs:statistics'), None),
+    'job_pdf': lambda vu, job: ('GET', reverse('jobs:download_job_pdf', args=[job.id]), None),
+    'statistics_pdf': lambda vu, job: ('GET', reverse('jobs:download_statistics_pdf'), None),
+}
+
+# Session name -> (weight, steps)
+SESSIONS = {
+    'browse': (45, ['dashboard', 'job_list', 'job_list_filtered', 'job_detail']),
+    'update': (25, ['dashboard', 'job_list_filtered', 'job_detail', 'edit_job', 'job_detail']),
+    'report': (15, ['dashboard', 'statistics', 'statistics_pdf']),
+    'full': (15, ['dashboard', 'job_list_filtered', 'job_detail', 'edit_job', 'statistics', 'job_pdf']),
+}
+
+
+class InProcessTransport:
+    """Requests through the Django test client; one client (and DB connection) per thread"""
+
+    def __init__(self, user, password):
+        self.client = make_client(user)
+
+    def request(self, method, path, data):
+        if method == 'POST':
+            response = self.client.post(path, data)
+        else:
+            response = self.client.get(path, data)
+        return response.status_code
+
+    def close(self):
+        connections.close_all()
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpTransport:
+    """Requests to a running server (runserver/gunicorn) with a logged-in session cookie"""
+
+    def __init__(self, user, password, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect)
+        login = reverse('jobs:login')
+        self.request('GET', login, None)
+        status = self.request('POST', login, {'username': user.username, 'password': password})
+        if status != 302:
+            raise RuntimeError(f'Login as {user.username} failed with status {status}')
+
+    def _csrf_token(self):
+        return next((cookie.value for cookie in self.cookies if cookie.name == 'csrftoken'), '')
+
+    def request(self, method, path, data):
+        url = self.base_url + path
+        body = None
+        headers = {}
+        if method == 'POST':
+            body = urllib.parse.urlencode(
+                {**(data or {}), 'csrfmiddlewaretoken': self._csrf_token()}, doseq=True
+            ).encode()
+            headers = {'Content-Type': 'application/x-www-form-urlencoded', 'Referer': url}
+        elif data:
+            url = f'{url}?{urllib.parse.urlencode(data, doseq=True)}'
+        try:
+            with self.opener.open(urllib.request.Request(url, data=body, headers=headers, method=method)) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            error.read()
+            return error.code
+
+    def close(self):
+        # edit_job POST data is built from the database in this process
+        connections.close_all()
+
+
+@dataclass
+class VirtualUser:
+    """One simulated user: a login, its jobs and a private random generator"""
+    user: User
+    jobs: list
+    rng: random.Random
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class LoadTestResult:
+    """Samples collected by all virtual users; latencies in milliseconds"""
+    latencies: dict = field(default_factory=lambda: defaultdict(list))
+    errors: dict = field(default_factory=lambda: defaultdict(int))
+    sessions: dict = field(default_factory=lambda: defaultdict(int))
+    error_samples: list = field(default_factory=list)
+    elapsed: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, step, latency_ms, error=None):
+        with self.lock:
+            self.latencies[step].append(latency_ms)
+            if error:
+                self.errors[step] += 1
+                if len(self.error_samples) < 20:
+                    self.error_samples.append(f'{step}: {error}')
+
+    def summary(self):
+        """JSON-serializable totals and per-step throughput, latency percentiles and error rates"""
+        def stats(samples, errors):
+            return {
+                'requests': len(samples),
+                'errors': errors,
+                'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+                'throughput_rps': round(len(samples) / self.elapsed, 2) if self.elapsed else 0.0,
+                'mean_ms': round(sum(samples) / len(samples), 2) if samples else 0.0,
+                'p50_ms': round(_percentile(samples, 0.50), 2) if samples else 0.0,
+                'p95_ms': round(_percentile(samples, 0.95), 2) if samples else 0.0,
+                'p99_ms': round(_percentile(samples, 0.99), 2) if samples else 0.0,
+                'max_ms': round(max(samples), 2) if samples else 0.0,
+            }
+
+        all_samples = [sample for samples in self.latencies.values() for sample in samples]
+        return {
+            'elapsed_s': round(self.elapsed, 2),
+            'sessions': dict(self.sessions),
+            'total': stats(all_samples, sum(self.errors.values())),
+            'steps': {step: stats(samples, self.errors[step]) for step, samples in sorted(self.latencies.items())},
+            'error_samples': self.error_samples,
+        }
+
+
+def load_virtual_users(prefix, count, seed=0, jobs_per_user=50):
+    """
+    Virtual users for the generated users named <prefix>_<n>.
+
+    Users are reused round-robin when there are fewer than `count`.
+    """
+    users = list(User.objects.filter(username__startswith=f'{prefix}_').order_by('id'))
+    if not users:
+        raise ValueError(f'No users with the prefix "{prefix}_"; run generate_dataset first')
+    virtual_users = []
+    for number in range(count):
+        user = users[number % len(users)]
+        jobs = list(JobEntry.objects.filter(user=user).exclude(status='not_applied')
+                    .order_by('-created_at')[:jobs_per_user])
+        if not jobs:
+            raise ValueError(f'{user.username} has no job entries to work with')
+        virtual_users.append(VirtualUser(user=user, jobs=jobs, rng=random.Random(f'{seed}-{number}')))
+    return virtual_users
+
+
+def _run_virtual_user(virtual_user, make_transport, deadline, max_sessions, think_time, result):
+    try:
+        transport = make_transport(virtual_user.user)
+    except Exception as exc:
+        result.add('login', 0.0, repr(exc))
+        connections.close_all()
+        return
+    try:
+        names = list(SESSIONS)
+        weights = [SESSIONS[name][0] for name in names]
+        sessions = 0
+        while time.monotonic() < deadline and (not max_sessions or sessions < max_sessions):
+            name = virtual_user.rng.choices(names, weights=weights)[0]
+            job = virtual_user.rng.choice(virtual_user.jobs)
+            for step in SESSIONS[name][1]:
+                method, path, data = STEPS[step](virtual_user, job)
+                started = time.perf_counter()
+                try:
+                    status = transport.request(method, path, data)
+                    # Successful POSTs redirect; a 200 is a re-rendered invalid form
+                    expected = 302 if method == 'POST' else 200
+                    error = f'{method} {path} returned {status}' if status != expected else None
+                except Exception as exc:
+                    error = f'{method} {path} raised {exc!r}'
+                result.add(step, (time.perf_counter() - started) * 1000, error)
+                if think_time:
+                    time.sleep(virtual_user.rng.uniform(0, think_time * 2))
+            sessions += 1
+            with result.lock:
+                result.sessions[name] += 1
+    finally:
+        transport.close()
+
+
+def run_load_test(virtual_users, duration=30, max_sessions=0, think_time=0.0, base_url='', password=''):
+    """
+    Run all virtual users concurrently, one thread each.
+
+    Args:
+        virtual_users: From load_virtual_users
+        duration: Seconds to run; sessions in progress are finished
+        max_sessions: Stop each virtual user after this many sessions (0 = until duration)
+        think_time: Mean pause between steps in seconds
+        base_url: Server to test, e.g. http://127.0.0.1:8000 (empty = in-process test client)
+        password: Password of the generated users (HTTP mode only)
+
+    Returns:
+        LoadTestResult
+    """
+    if base_url:
+        def make_transport(user):
+            return HttpTransport(user, password, base_url)
+    else:
+        def make_transport(user):
+            return InProcessTransport(user, password)
+
+    result = LoadTestResult()
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=_run_virtual_user,
+            args=(virtual_user, make_transport, deadline, max_sessions, think_time, result),
+            name=f'vu-{number}', daemon=True,
+        )
+        for number, virtual_user in enumerate(virtual_users)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
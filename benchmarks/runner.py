@@ -0,0 +1,147 @@
+"""
+Benchmark runner: times each case on each dataset and reports JSON.
+"""
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+import django
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from jobs.caching import bump_user_generation, tiered_cache
+from jobs.query_budget import QueryRecorder
+
+from .cases import CASES, build_context
+from .datasets import seed_dataset
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _clear_caches(user):
+    """Drop the dataset user's cached data; other users' entries in a shared cache are kept"""
+    bump_user_generation(user)
+    tiered_cache.clear()
+
+
+def _percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def run_case(case, context, iterations):
+    """
+    Time one case: a cold run with the user's caches invalidated, then `iterations` warm runs.
+
+    Returns:
+        Timings in milliseconds and query counts of the cold and warm runs
+    """
+    _clear_caches(context.user)
+    with QueryRecorder() as recorder:
+        started = time.perf_counter()
+        case(context)
+        cold_ms = (time.perf_counter() - started) * 1000
+    cold_queries = recorder.count
+
+    samples = []
+    warm_queries = []
+    for _ in range(iterations):
+        with QueryRecorder() as recorder:
+            started = time.perf_counter()
+            case(context)
+            samples.append((time.perf_counter() - started) * 1000)
+        warm_queries.append(recorder.count)
+
+    return {
+        'cold_ms': round(cold_ms, 2),
+        'cold_queries': cold_queries,
+        'iterations': iterations,
+        'mean_ms': round(statistics.mean(samples), 2),
+        'p50_ms': round(_percentile(samples, 0.50), 2),
+        'p95_ms': round(_percentile(samples, 0.95), 2),
+        'min_ms': round(min(samples), 2),
+        'queries': max(warm_queries),
+    }
+
+
+def run_suite(sizes, case_names=None, iterations=5, seed=0, progress=None):
+    """
+    Seed each dataset size and run the selected cases against it.
+
+    Args:
+        sizes: Dataset sizes (job entries per user)
+        case_names: Names from CASES to run (all when empty)
+        iterations: Warm runs per case
+        seed: Dataset seed
+        progress: Optional callable receiving progress messages
+
+    Returns:
+        JSON-serializable report
+    """
+    progress = progress or (lambda message: None)
+    case_names = case_names or list(CASES)
+    report = {
+        'meta': {
+            'revision': _git_revision(),
+            'timestamp': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'cache': settings.CACHES['default']['BACKEND'],
+            'cpu_count': os.cpu_count(),
+            'seed': seed,
+            'iterations': iterations,
+        },
+        'results': [],
+    }
+
+    # Budget warnings would flood the output on large datasets; the query counts are in the report
+    budget_logger = logging.getLogger('jobs.query_budget')
+    previous_level = budget_logger.level
+    budget_logger.setLevel(logging.ERROR)
+    try:
+        for size in sizes:
+            progress(f'Seeding dataset of {size} job entries...')
+            started = time.perf_counter()
+            user = seed_dataset(size, seed=seed)
+            progress(f'  ready in {time.perf_counter() - started:.1f}s')
+            context = build_context(user)
+            for name in case_names:
+                result = run_case(CASES[name], context, iterations)
+                progress(f'  {name:<20} p50 {result["p50_ms"]:>9.2f} ms  '
+                         f'cold {result["cold_ms"]:>9.2f} ms  queries {result["queries"]}')
+                report['results'].append({'dataset': size, 'case': name, **result})
+    finally:
+        budget_logger.setLevel(previous_level)
+    return report
+
+
+def compare(report, baseline):
+    """
+    Compare a report with a baseline report (e.g. from the previous commit).
+
+    Returns:
+        List of (dataset, case, baseline p50, p50, change in %, baseline queries, queries)
+    """
+    previous = {(row['dataset'], row['case']): row for row in baseline.get('results', [])}
+    rows = []
+    for row in report['results']:
+        old = previous.get((row['dataset'], row['case']))
+        if old is None:
+            continue
+        change = (row['p50_ms'] - old['p50_ms']) / old['p50_ms'] * 100 if old['p50_ms'] else 0.0
+        rows.append((row['dataset'], row['case'], old['p50_ms'], row['p50_ms'], change,
+                     old['queries'], row['queries']))
+    return rows
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import JobEntry, Category, Tag, JobTemplate, JobEntryHistory, Attachment, Notification, UserProfile
+from .caching import bump_user_generation
+from .models import (JobEntry, Category, Tag, JobTemplate, JobEntryHistory, JobEvent, Attachment, Notification,
+                     UserProfile)
 
 # Create your models here.
 @admin.register(Category)
@@ -65,6 +67,14 @@ class JobEntryHistoryAdmin(admin.ModelAdmin):
     readonly_fields = ('changed_at',)
 
 
+@admin.register(JobEvent)
+class JobEventAdmin(admin.ModelAdmin):
+    list_display = ('job_entry', 'kind', 'at', 'user')
+    list_filter = ('kind', 'at')
+    search_fields = ('job_entry__job_title', 'job_entry__employer', 'user__username')
+    raw_id_fields = ('user', 'job_entry')
+
+
 @admin.register(Attachment)
 class AttachmentAdmin(admin.ModelAdmin):
     list_display = ('file_name', 'job_entry', 'file_type', 'uploaded_at')
@@ -78,6 +88,17 @@ class NotificationAdmin(admin.ModelAdmin):
     list_filter = ('notification_type', 'is_read', 'created_at')
     search_fields = ('title', 'message', 'user__username')
     readonly_fields = ('created_at',)
+    
+    # Notification deletions send no cache-invalidating signal (see jobs.signals)
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        bump_user_generation(obj.user_id)
+    
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list('user_id', flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            bump_user_generation(user_id)
 
 
 @admin.register(UserProfile)
@@ -0,0 +1,116 @@
+"""
+Conditional requests (ETag / Last-Modified) for the API.
+
+Validators are derived from cache generations instead of the data itself:
+every write to a user's data bumps the user's generation (see jobs.signals),
+so hashing the generation together with the request path, language and
+response format gives an ETag that changes whenever the response could.
+Computing it costs a few cache reads and no queries, so a poll with a
+matching If-None-Match is answered 304 before the queryset is built or
+anything is serialized.
+
+The same ETag makes writes optimistic: PUT, PATCH and DELETE with an
+If-Match that no longer matches are rejected with 412. Because the
+generation covers all of a user's data, the check is conservative - any
+change to the user's data since the client read the resource fails it.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.translation import get_language
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from jobs.caching import get_generation, get_last_modified, user_namespace
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = 'Not modified.'
+    default_code = 'not_modified'
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource has changed since it was read.'
+    default_code = 'precondition_failed'
+
+
+class ConditionalRequestMixin:
+    """
+    ETag and Last-Modified validators for API views and viewsets.
+
+    GET/HEAD requests are answered 304 when the client's copy is current.
+    Requests whose method is in `precondition_methods` honour If-Match and
+    If-Unmodified-Since and fail with 412 when the resource has changed.
+    """
+    # Generations besides the user's that the responses depend on (e.g. CATEGORIES_NAMESPACE)
+    etag_namespaces = ()
+    precondition_methods = ('PUT', 'PATCH', 'DELETE')
+
+    def get_etag_parts(self, request):
+        """Extra inputs of the ETag, e.g. the current date for date-relative responses"""
+        return ()
+
+    def get_validators(self, request):
+        """
+        Current validators of the requested resource.
+
+        Returns:
+            Tuple of (quoted strong ETag, Last-Modified as a Unix timestamp)
+        """
+        namespaces = [user_namespace(request.user), *self.etag_namespaces]
+        generations = [get_generation(namespace) for namespace in namespaces]
+        renderer = getattr(request, 'accepted_renderer', None)
+        source = ':'.join(str(part) for part in (
+            *generations,
+            request.path,
+            request.META.get('QUERY_STRING', ''),
+            get_language() or '',
+            renderer.format if renderer else '',
+            *self.get_etag_parts(request),
+        ))
+        etag = f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+        return etag, get_last_modified(namespaces, generations)
+
+    def _is_conditional(self, request):
+        return request.user.is_authenticated and (
+            request.method in ('GET', 'HEAD') or request.method in self.precondition_methods
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not self._is_conditional(request):
+            return
+        self._validators = etag, last_modified = self.get_validators(request)
+        if_match = request.META.get('HTTP_IF_MATCH')
+        if if_match:
+            # CompressionMiddleware weakens the ETags of compressed responses; they still name the same data
+            request.META['HTTP_IF_MATCH'] = if_match.replace('W/', '')
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            if response.status_code == status.HTTP_304_NOT_MODIFIED:
+                raise NotModified()
+            raise PreconditionFailed()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, '_validators', None)
+        if validators is None or response.status_code not in (200, 304):
+            return response
+        if request.method not in ('GET', 'HEAD'):
+            # The write bumped the generation; hand out the validators of the new state
+            validators = self.get_validators(request)
+        etag, last_modified = validators
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Let browsers keep the response but revalidate it on every use
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
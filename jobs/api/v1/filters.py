@@ -0,0 +1,17 @@
+from rest_framework import filters
+from jobs.search import search_job_entries, supports_full_text_search
+
+
+class JobEntrySearchFilter(filters.SearchFilter):
+    """
+    SearchFilter for job entries that uses PostgreSQL full-text search (GIN indexed)
+    when available and falls back to the default icontains search otherwise.
+    """
+    
+    def filter_queryset(self, request, queryset, view):
+        if not supports_full_text_search(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+        return search_job_entries(queryset, ' '.join(search_terms))
@@ -7,6 +7,30 @@ from jobs.models import (
 )
 
 
+class SparseFieldsMixin:
+    """
+    Output only the fields in context['fields'] and collapse the nested relations
+    in `expandable_fields` that are not in context['expand'] to primary keys.
+
+    Either context value may be None (or missing) for "no restriction".
+    Write-only fields are kept so the serializer still validates input.
+    """
+    expandable_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get('fields')
+        expand = self.context.get('expand')
+        if fields is not None:
+            for name in [name for name, field in self.fields.items() if not field.write_only and name not in fields]:
+                self.fields.pop(name)
+        if expand is not None:
+            for name in self.expandable_fields:
+                if name in self.fields and name not in expand:
+                    many = isinstance(self.fields[name], (serializers.ListSerializer, serializers.ManyRelatedField))
+                    self.fields[name] = serializers.PrimaryKeyRelatedField(many=many, read_only=True)
+
+
 class CategorySerializer(serializers.ModelSerializer):
     """Serializer for Category model"""
     class Meta:
@@ -39,8 +63,9 @@ class ResumeSubmissionStatusSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class JobEntrySerializer(serializers.ModelSerializer):
+class JobEntrySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for JobEntry model"""
+    expandable_fields = ('category', 'tags', 'resume_statuses')
     category = CategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
@@ -77,8 +102,9 @@ class JobEntrySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
 
-class JobEntryListSerializer(serializers.ModelSerializer):
+class JobEntryListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for JobEntry list view"""
+    expandable_fields = ('category', 'tags')
     category = serializers.StringRelatedField()
     tags = TagSerializer(many=True, read_only=True)
     
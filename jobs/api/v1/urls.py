@@ -4,7 +4,8 @@ from .views import (
     JobEntryViewSet, ResumeSubmissionStatusViewSet, JobEntryHistoryViewSet,
     CategoryViewSet, TagViewSet, JobTemplateViewSet,
     AttachmentViewSet, NotificationViewSet, UserProfileViewSet,
-    StatisticsView, MonthlyReportView, CalendarView
+    StatisticsView, MonthlyReportView, CalendarView, BatchView,
+    AsyncStatisticsView, AsyncMonthlyReportView, AsyncCalendarView, AsyncUnreadCountView
 )
 
 app_name = 'api_v1'
@@ -25,5 +26,11 @@ urlpatterns = [
     path('statistics/', StatisticsView.as_view(), name='statistics'),
     path('monthly-report/', MonthlyReportView.as_view(), name='monthly-report'),
     path('calendar/', CalendarView.as_view(), name='calendar'),
+    path('batch/', BatchView.as_view(), name='batch'),
+    # ASGI-native variants of the read-heavy endpoints (see views/view_async.py)
+    path('async/statistics/', AsyncStatisticsView.as_view(), name='async-statistics'),
+    path('async/monthly-report/', AsyncMonthlyReportView.as_view(), name='async-monthly-report'),
+    path('async/calendar/', AsyncCalendarView.as_view(), name='async-calendar'),
+    path('async/notifications/unread_count/', AsyncUnreadCountView.as_view(), name='async-unread-count'),
 ]
 
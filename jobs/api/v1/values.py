@@ -0,0 +1,216 @@
+"""
+Read-only fast path for list endpoints: serialize .values() rows, not model instances.
+
+Once the queries are optimized, most of a list request goes into creating model
+instances and walking DRF's per-field machinery for every row. ValuesSerializer
+is built from a regular serializer instance (so ?fields= and ?expand= apply),
+reads plain dicts from .values() and converts each column with the serializer
+field's own to_representation(), so the output is byte-identical. Related data
+is loaded with one query per relation for the whole page:
+
+- many-to-many fields (e.g. tags, nested or as ids) from the through table
+- StringRelatedField foreign keys with in_bulk()
+
+Serializers using anything else (method fields, nested foreign keys, reverse
+relations, ...) are not supported; from_serializer() returns None for them and
+the view falls back to the regular serializer.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _plain_columns(serializer):
+    """(name, lookup, field) of a serializer whose readable fields are all plain model columns, else None"""
+    model = serializer.Meta.model
+    columns = []
+    for field in serializer._readable_fields:
+        model_field = _model_field(model, field.source)
+        if (isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField, serializers.BaseSerializer))
+                or model_field is None or model_field.is_relation):
+            return None
+        columns.append((field.field_name, field.source, field))
+    return columns
+
+
+class ValuesSerializer:
+    """
+    Serializes .values() rows the way a ModelSerializer serializes instances.
+
+    Build with from_serializer(); query with `lookups`; convert with to_representation().
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.lookups = []
+        self.steps = []  # (kind, name, lookup, extra) in output order
+
+    @classmethod
+    def from_serializer(cls, serializer):
+        """ValuesSerializer for the readable fields of a ModelSerializer instance, or None if unsupported"""
+        meta = getattr(serializer, 'Meta', None)
+        if meta is None or not hasattr(meta, 'model'):
+            return None
+        values_serializer = cls(meta.model)
+        for field in serializer._readable_fields:
+            if not values_serializer._add_field(field):
+                return None
+        if 'pk' not in values_serializer.lookups:
+            values_serializer.lookups.append('pk')
+        return values_serializer
+
+    def _add_lookup(self, lookup):
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+
+    def _add_field(self, field):
+        """Plan one serializer field; False when it cannot be served from .values()"""
+        name = field.field_name
+        if field.source == '*' or isinstance(field, serializers.HiddenField):
+            return False
+        model_field = _model_field(self.model, field.source_attrs[0])
+        if model_field is None:
+            return False
+
+        if isinstance(field, (serializers.ManyRelatedField, serializers.ListSerializer)):
+            if not model_field.many_to_many or model_field.auto_created:
+                return False
+            child = field.child_relation if isinstance(field, serializers.ManyRelatedField) else field.child
+            if isinstance(child, serializers.PrimaryKeyRelatedField) and child.pk_field is None:
+                self.steps.append(('many_pks', name, model_field, None))
+                return True
+            if isinstance(child, serializers.ModelSerializer):
+                columns = _plain_columns(child)
+                if columns is None:
+                    return False
+                self.steps.append(('many_nested', name, model_field, columns))
+                return True
+            return False
+
+        if len(field.source_attrs) == 1:
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                if not model_field.many_to_one or field.pk_field is not None:
+                    return False
+                self._add_lookup(field.source)
+                self.steps.append(('value', name, field.source, None))
+                return True
+            if isinstance(field, serializers.StringRelatedField):
+                if not model_field.many_to_one:
+                    return False
+                self._add_lookup(field.source)
+                self.steps.append(('string_related', name, field.source, model_field))
+                return True
+            if isinstance(field, (serializers.RelatedField, serializers.BaseSerializer,
+                                  serializers.SerializerMethodField)) or model_field.is_relation:
+                return False
+            self._add_lookup(field.source)
+            self.steps.append(('column', name, field.source, field))
+            return True
+
+        # Dotted ReadOnlyField through a foreign key, e.g. source='user.username'
+        if (not isinstance(field, serializers.ReadOnlyField) or len(field.source_attrs) != 2
+                or not model_field.many_to_one):
+            return False
+        target = _model_field(model_field.related_model, field.source_attrs[1])
+        if target is None or target.is_relation:
+            return False
+        lookup = '__'.join(field.source_attrs)
+        self._add_lookup(model_field.name)
+        self._add_lookup(lookup)
+        self.steps.append(('follow', name, lookup, model_field.name))
+        return True
+
+    def _many_map(self, model_field, pks, columns=None):
+        """
+        Related values of a many-to-many field for all rows, in one query on the through table.
+
+        Ordered like a prefetch (the related model's default ordering).
+        Returns {row pk: [related pk or nested dict, ...]}
+        """
+        through = model_field.remote_field.through
+        source = model_field.m2m_field_name()
+        target = model_field.m2m_reverse_field_name()
+        ordering = []
+        for order in model_field.related_model._meta.ordering:
+            descending = order.startswith('-')
+            ordering.append(f'{"-" if descending else ""}{target}__{order.lstrip("-")}')
+        related = {pk: [] for pk in pks}
+        if columns is None:
+            pairs = through.objects.filter(**{f'{source}__in': pks}).order_by(*ordering).values_list(
+                f'{source}_id', f'{target}_id'
+            )
+            for pk, related_pk in pairs:
+                related[pk].append(related_pk)
+            return related
+        lookups = [f'{target}__{lookup}' for _, lookup, _ in columns]
+        rows = through.objects.filter(**{f'{source}__in': pks}).order_by(*ordering).values_list(
+            f'{source}_id', *lookups
+        )
+        for pk, *values in rows:
+            related[pk].append({
+                name: None if value is None else field.to_representation(value)
+                for (name, _, field), value in zip(columns, values)
+            })
+        return related
+
+    def to_representation(self, rows):
+        """List of output dicts for .values(*self.lookups) rows"""
+        rows = list(rows)
+        pks = [row['pk'] for row in rows]
+        related = {}
+        for kind, name, lookup, extra in self.steps:
+            if kind == 'many_pks':
+                related[name] = self._many_map(lookup, pks)
+            elif kind == 'many_nested':
+                related[name] = self._many_map(lookup, pks, extra)
+            elif kind == 'string_related':
+                ids = {row[lookup] for row in rows if row[lookup] is not None}
+                related[name] = {pk: str(obj) for pk, obj in extra.related_model._default_manager.in_bulk(ids).items()}
+
+        data = []
+        for row in rows:
+            item = {}
+            for kind, name, lookup, extra in self.steps:
+                if kind == 'column':
+                    value = row[lookup]
+                    item[name] = None if value is None else extra.to_representation(value)
+                elif kind == 'value':
+                    item[name] = row[lookup]
+                elif kind == 'follow':
+                    # Like ReadOnlyField: omitted when the foreign key is null
+                    if row[extra] is not None:
+                        item[name] = row[lookup]
+                elif kind == 'string_related':
+                    value = row[lookup]
+                    item[name] = None if value is None else related[name][value]
+                else:
+                    item[name] = related[name][row['pk']]
+            data.append(item)
+        return data
+
+
+class ValuesListMixin:
+    """
+    list() from .values() rows through ValuesSerializer when the list serializer supports it.
+
+    The queryset's filters, ordering and pagination apply unchanged;
+    select_related/prefetch_related are dropped since nothing is read from instances.
+    """
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = ValuesSerializer.from_serializer(self.get_serializer())
+        if values_serializer is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None).prefetch_related(None)
+        queryset = queryset.values(*values_serializer.lookups)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.to_representation(page))
+        return Response(values_serializer.to_representation(queryset))
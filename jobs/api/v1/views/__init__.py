@@ -12,6 +12,10 @@ from .view_attachments import AttachmentViewSet
 from .view_notifications import NotificationViewSet
 from .view_profile import UserProfileViewSet
 from .view_statistics import StatisticsView, MonthlyReportView, CalendarView
+from .view_batch import BatchView
+from .view_async import (
+    AsyncStatisticsView, AsyncMonthlyReportView, AsyncCalendarView, AsyncUnreadCountView
+)
 
 __all__ = [
     # Jobs
@@ -32,5 +36,12 @@ __all__ = [
     'StatisticsView',
     'MonthlyReportView',
     'CalendarView',
+    # Batch
+    'BatchView',
+    # Async
+    'AsyncStatisticsView',
+    'AsyncMonthlyReportView',
+    'AsyncCalendarView',
+    'AsyncUnreadCountView',
 ]
 
@@ -0,0 +1,142 @@
+"""
+ASGI-native variants of the read-heavy API views.
+
+Same JSON as StatisticsView, CalendarView, MonthlyReportView and the unread
+notification count, from plain Django async views served by an ASGI server
+(uvicorn job_search.asgi:application):
+
+- statistics: the independent statistics blocks run concurrently (gather_queries)
+- monthly report: its two ID queries run concurrently
+- calendar and unread count: Django's async ORM (`async for`, acount())
+
+Results are cached exactly like the sync views (same keys, so both share them).
+Only the cache calls run in a worker thread (the backend may block); the
+computation is awaited on the event loop. Django's async ORM still runs each
+query in the one thread it shares with sync code, so only gather_queries()
+really overlaps queries. Throttles are those of the sync endpoints. Only
+session authentication is supported and there are no ETags. Under WSGI these
+views still work, but every request then runs in an event loop of its own,
+which costs more than it saves.
+"""
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.translation import get_language
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated, Throttled
+from rest_framework.settings import api_settings
+
+from jobs.async_db import gather_queries
+from jobs.caching import acached_user_compute, aget_or_set_user_cache
+from jobs.db_routing import ausing_replica
+from jobs.models import JobEntry, Notification
+from jobs.utils import aget_statistics_data
+from jobs.views.view_statistics import (
+    _monthly_report_id_queries, _parse_year_month, _query_monthly_report_job_entries
+)
+from ..renderers import FastJSONRenderer
+from .view_statistics import CalendarView, MonthlyReportView
+
+
+class AsyncAPIView(View):
+    """Base class of the async read-only endpoints: session authentication, throttling and JSON responses"""
+    http_method_names = ['get']
+    throttle_scope = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            # As DRF answers session-authenticated endpoints
+            return self.render({'detail': NotAuthenticated.default_detail}, status_code=status.HTTP_403_FORBIDDEN)
+        wait = await sync_to_async(self.check_throttles)(request)
+        if wait is not None:
+            response = self.render({'detail': Throttled(wait).detail}, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+            response['Retry-After'] = str(math.ceil(wait))
+            return response
+        return await super().dispatch(request, *args, **kwargs)
+
+    def check_throttles(self, request):
+        """Seconds to wait if a DEFAULT_THROTTLE_CLASSES throttle refuses the request, else None"""
+        waits = [throttle.wait() for throttle in (cls() for cls in api_settings.DEFAULT_THROTTLE_CLASSES)
+                 if not throttle.allow_request(request, self)]
+        return max(waits) if waits else None
+
+    @staticmethod
+    def render(data, status_code=status.HTTP_200_OK):
+        """JSON response rendered like the DRF views' responses"""
+        return HttpResponse(FastJSONRenderer().render(data), content_type='application/json', status=status_code)
+
+
+class AsyncStatisticsView(AsyncAPIView):
+    """Async StatisticsView"""
+    throttle_scope = 'statistics'
+
+    async def get(self, request):
+        user = request.user
+        user_jobs = JobEntry.objects.filter(user=user).select_related('category')
+        async with ausing_replica(user):
+            statistics_data = await acached_user_compute(
+                user, 'statistics', lambda: aget_statistics_data(user_jobs, user)
+            )
+        return self.render(statistics_data)
+
+
+async def _monthly_report_job_entries(user, year, month):
+    """_query_monthly_report_job_entries() with its two ID queries run concurrently"""
+    entries_by_date_ids, entries_by_status_ids = await gather_queries(
+        *((set, ids) for ids in _monthly_report_id_queries(user, year, month))
+    )
+    return await sync_to_async(_query_monthly_report_job_entries)(
+        user, year, month, entries_by_date_ids | entries_by_status_ids
+    )
+
+
+class AsyncMonthlyReportView(AsyncAPIView):
+    """Async MonthlyReportView"""
+    throttle_scope = 'reports'
+
+    async def get(self, request):
+        user = request.user
+        year, month = _parse_year_month(request)
+        # Entries keep their replica alias, so related lookups made later also read from it
+        async with ausing_replica(user):
+            job_entries = await acached_user_compute(
+                user, 'monthly_report_entries', lambda: _monthly_report_job_entries(user, year, month),
+                parts=(year, month)
+            )
+        report = MonthlyReportView._build_report(year, month, job_entries)
+        return self.render(report)
+
+
+async def _calendar_events(user, start_date, end_date):
+    return [CalendarView._build_event(*row) async for row in CalendarView._event_rows(user, start_date, end_date)]
+
+
+class AsyncCalendarView(AsyncAPIView):
+    """Async CalendarView"""
+
+    async def get(self, request):
+        try:
+            start_date, end_date = CalendarView._parse_range(request.GET)
+        except ValueError as error:
+            return self.render({'detail': str(error)}, status_code=status.HTTP_400_BAD_REQUEST)
+        async with ausing_replica(request.user):
+            events = await acached_user_compute(
+                request.user, 'calendar_events', lambda: _calendar_events(request.user, start_date, end_date),
+                parts=(start_date.isoformat(), end_date.isoformat(), get_language() or 'en')
+            )
+        return self.render(events)
+
+
+async def _unread_count(user):
+    return await Notification.objects.filter(user=user, is_read=False).acount()
+
+
+class AsyncUnreadCountView(AsyncAPIView):
+    """Async NotificationViewSet.unread_count"""
+
+    async def get(self, request):
+        count = await aget_or_set_user_cache(request.user, 'notifications_count', lambda: _unread_count(request.user))
+        return self.render({'unread_count': count})
@@ -0,0 +1,132 @@
+import copy
+import logging
+import time
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction
+from django.http import QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from jobs.query_budget import QueryRecorder, query_budget
+
+
+logger = logging.getLogger(__name__)
+
+# Response headers passed through for each sub-request (validators for conditional GETs)
+FORWARDED_HEADERS = ('ETag', 'Last-Modified')
+
+
+@query_budget(max_queries=200)
+class BatchView(APIView):
+    """
+    API endpoint running several GET requests in one round trip
+
+    POST {"requests": [{"path": "/api/v1/jobs/?page=2"}, {"path": "/api/v1/statistics/",
+    "headers": {"If-None-Match": "..."}}]} returns {"responses": [...], "duration_ms": ...}
+    with the status, validators, body, time and query count of every sub-request, in order.
+    Sub-requests run in this process with the caller's already authenticated user, so the
+    session, user and profile lookups happen once; each still goes through the target
+    view's permissions and throttles.
+    """
+    permission_classes = [IsAuthenticated]
+
+    MAX_REQUESTS = 20
+
+    def post(self, request):
+        """Run the sub-requests in order and collect their responses"""
+        specs = request.data.get('requests') if isinstance(request.data, dict) else None
+        if not isinstance(specs, list) or not specs:
+            return Response({'detail': 'requests must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(specs) > self.MAX_REQUESTS:
+            return Response(
+                {'detail': f'At most {self.MAX_REQUESTS} requests per batch'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Validate the whole batch before running any of it
+        for spec in specs:
+            if not isinstance(spec, dict) or not isinstance(spec.get('path'), str):
+                return Response(
+                    {'detail': 'Each request needs a "path"'}, status=status.HTTP_400_BAD_REQUEST
+                )
+            method = spec.get('method', 'GET')
+            if not isinstance(method, str) or method.upper() != 'GET':
+                return Response(
+                    {'detail': 'Only GET requests can be batched'}, status=status.HTTP_400_BAD_REQUEST
+                )
+            headers = spec.get('headers')
+            if headers is not None and not (
+                isinstance(headers, dict)
+                and all(isinstance(name, str) and isinstance(value, str) for name, value in headers.items())
+            ):
+                return Response(
+                    {'detail': '"headers" must be an object of string header names and values'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        started = time.perf_counter()
+        responses = [self._run(request, spec['path'], spec.get('headers') or {}) for spec in specs]
+        return Response({
+            'responses': responses,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+        })
+
+    def _sub_request(self, request, path, query, headers):
+        """GET request for `path` sharing the caller's user and session"""
+        sub_request = copy.copy(request._request)
+        # Drop values cached from the outer request (e.g. the `headers` property)
+        sub_request.__dict__.pop('headers', None)
+        sub_request.method = 'GET'
+        sub_request.path = sub_request.path_info = path
+        sub_request.GET = QueryDict(query)
+        sub_request.META = {
+            key: value for key, value in request._request.META.items()
+            if key not in ('CONTENT_LENGTH', 'CONTENT_TYPE', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+        }
+        sub_request.META.update({
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'HTTP_ACCEPT': 'application/json',
+        })
+        for name, value in headers.items():
+            sub_request.META['HTTP_' + name.upper().replace('-', '_')] = value
+        return sub_request
+
+    def _run(self, request, url, headers):
+        """Resolve and run one sub-request; never raises"""
+        parts = urlsplit(url)
+        result = {'path': url}
+        try:
+            match = resolve(parts.path)
+        except Resolver404:
+            match = None
+        # Async views cannot run inside this sync view
+        if (match is None or match.namespace != 'api_v1' or getattr(match.func, 'cls', None) is type(self)
+                or iscoroutinefunction(match.func)):
+            result.update(status=status.HTTP_404_NOT_FOUND, body={'detail': 'Not found.'},
+                          duration_ms=0.0, queries=0)
+            return result
+
+        sub_request = self._sub_request(request, parts.path, parts.query, headers)
+        sub_request.resolver_match = match
+        started = time.perf_counter()
+        with QueryRecorder() as recorder:
+            try:
+                response = match.func(sub_request, *match.args, **match.kwargs)
+            except Exception:
+                logger.exception('Batch sub-request %s failed', url)
+                response = Response({'detail': 'Internal server error.'},
+                                    status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        result.update(
+            status=response.status_code,
+            headers={name: response[name] for name in FORWARDED_HEADERS if response.has_header(name)},
+            body=getattr(response, 'data', None),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            queries=recorder.count,
+        )
+        return result
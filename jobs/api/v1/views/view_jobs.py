@@ -3,9 +3,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import filters, serializers
+from rest_framework.exceptions import ParseError
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from jobs.models import JobEntry, ResumeSubmissionStatus, JobEntryHistory
+from jobs.models import JobEntry, ResumeSubmissionStatus, JobEntryHistory, Tag
+from jobs.caching import CATEGORIES_NAMESPACE, TAGS_NAMESPACE
+from ..conditional import ConditionalRequestMixin
+from ..values import ValuesListMixin
 from ..pagination import StandardResultsSetPagination
+from ..filters import JobEntrySearchFilter
 from ..serializers import (
     JobEntrySerializer, JobEntryListSerializer,
     ResumeSubmissionStatusSerializer, JobEntryHistorySerializer,
@@ -13,7 +19,7 @@ from ..serializers import (
 )
 
 
-class JobEntryViewSet(viewsets.ModelViewSet):
+class JobEntryViewSet(ConditionalRequestMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for JobEntry model
     
@@ -23,10 +29,16 @@ class JobEntryViewSet(viewsets.ModelViewSet):
     update: Update job entry
     partial_update: Partially update job entry
     destroy: Delete job entry
+    
+    GET requests are conditional (ETag/Last-Modified); update and destroy honour If-Match.
+    list and retrieve accept ?fields= (comma-separated output fields) and ?expand=
+    (relations to nest; the others are returned as ids), which also narrow the query.
     """
     permission_classes = [IsAuthenticated]
+    # Entries embed category and tag names
+    etag_namespaces = (CATEGORIES_NAMESPACE, TAGS_NAMESPACE)
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobEntrySearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'priority', 'work_type', 'source', 'category']
     search_fields = [
         'job_title', 'employer', 'description', 'address',
@@ -37,9 +49,11 @@ class JobEntryViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return job entries for current user"""
-        queryset = JobEntry.objects.filter(
-            user=self.request.user
-        ).select_related('category', 'user').prefetch_related('tags', 'resume_statuses')
+        queryset = JobEntry.objects.filter(user=self.request.user)
+        if self.action in ('list', 'retrieve'):
+            queryset = self._select_requested_fields(queryset)
+        else:
+            queryset = queryset.select_related('category', 'user').prefetch_related('tags', 'resume_statuses')
         
         # Additional filtering
         tag_filter = self.request.query_params.get('tag', None)
@@ -55,6 +69,77 @@ class JobEntryViewSet(viewsets.ModelViewSet):
         return JobEntrySerializer
     
     
+    def get_serializer_context(self):
+        """Pass ?fields= and ?expand= to the serializer (list and retrieve only)"""
+        context = super().get_serializer_context()
+        if self.action in ('list', 'retrieve'):
+            context['fields'], context['expand'] = self.get_field_selection()
+        return context
+    
+    def _list_param(self, name):
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        return {part.strip() for part in value.split(',') if part.strip()}
+    
+    def get_field_selection(self):
+        """
+        Requested output fields and expanded relations of a list or retrieve request.
+        
+        Returns:
+            Tuple of (fields, expand) sets; None where the parameter was not given
+        
+        Raises:
+            ParseError: For names the serializer does not have
+        """
+        if hasattr(self, '_field_selection'):
+            return self._field_selection
+        serializer_class = self.get_serializer_class()
+        fields, expand = self._list_param('fields'), self._list_param('expand')
+        readable = {name for name, field in serializer_class().fields.items() if not field.write_only}
+        if fields is not None and fields - readable:
+            raise ParseError(f'Unknown fields: {", ".join(sorted(fields - readable))}. '
+                             f'Available: {", ".join(sorted(readable))}')
+        expandable = set(serializer_class.expandable_fields)
+        if expand is not None and expand - expandable:
+            raise ParseError(f'Cannot expand: {", ".join(sorted(expand - expandable))}. '
+                             f'Expandable: {", ".join(sorted(expandable))}')
+        self._field_selection = (fields, expand)
+        return self._field_selection
+    
+    def _select_requested_fields(self, queryset):
+        """Load only the columns and relations the requested output needs"""
+        fields, expand = self.get_field_selection()
+        serializer_class = self.get_serializer_class()
+        if fields is None:
+            fields = {name for name, field in serializer_class().fields.items() if not field.write_only}
+        if expand is None:
+            expand = set(serializer_class.expandable_fields)
+        
+        columns = ['id']
+        related = []
+        prefetches = []
+        for name in fields:
+            if name == 'user':
+                columns.append('user__username')
+                related.append('user')
+            elif name == 'category':
+                # Collapsed to an id, the category comes from category_id without a join
+                columns.append('category')
+                if name in expand:
+                    related.append('category')
+            elif name == 'tags':
+                prefetches.append('tags' if name in expand else Prefetch('tags', queryset=Tag.objects.only('id')))
+            elif name == 'resume_statuses':
+                prefetches.append('resume_statuses' if name in expand else Prefetch(
+                    'resume_statuses', queryset=ResumeSubmissionStatus.objects.only('id', 'job_entry')
+                ))
+            else:
+                columns.append(name)
+        queryset = queryset.only(*columns).prefetch_related(*prefetches)
+        # select_related() without arguments would follow every foreign key
+        return queryset.select_related(*related) if related else queryset
+    
     def perform_create(self, serializer):
         """Set user when creating job entry"""
         serializer.save(user=self.request.user)
@@ -114,7 +199,7 @@ class ResumeSubmissionStatusViewSet(viewsets.ModelViewSet):
         serializer.save()
 
 
-class JobEntryHistoryViewSet(viewsets.ReadOnlyModelViewSet):
+class JobEntryHistoryViewSet(ValuesListMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for JobEntryHistory model (read-only)"""
     permission_classes = [IsAuthenticated]
     serializer_class = JobEntryHistorySerializer
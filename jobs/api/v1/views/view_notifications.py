@@ -5,12 +5,16 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from jobs.models import Notification
+from jobs.caching import bump_user_generation
+from jobs.utils import get_unread_notifications_count
+from ..conditional import ConditionalRequestMixin
+from ..values import ValuesListMixin
 from ..pagination import StandardResultsSetPagination
 from ..serializers import NotificationSerializer
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
-    """ViewSet for Notification model"""
+class NotificationViewSet(ConditionalRequestMixin, ValuesListMixin, viewsets.ModelViewSet):
+    """ViewSet for Notification model (conditional GET, If-Match on update and destroy)"""
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
     pagination_class = StandardResultsSetPagination
@@ -29,6 +33,11 @@ class NotificationViewSet(viewsets.ModelViewSet):
         """Set user when creating notification"""
         serializer.save(user=self.request.user)
     
+    def perform_destroy(self, instance):
+        """Delete the notification; deletions send no cache-invalidating signal"""
+        instance.delete()
+        bump_user_generation(instance.user_id)
+    
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
         """Mark notification as read"""
@@ -44,14 +53,13 @@ class NotificationViewSet(viewsets.ModelViewSet):
             user=request.user,
             is_read=False
         ).update(is_read=True)
+        # Queryset update() does not send signals - invalidate cached counts explicitly
+        bump_user_generation(request.user)
         return Response({'status': 'all marked as read', 'count': count})
     
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
         """Get count of unread notifications"""
-        count = Notification.objects.filter(
-            user=request.user,
-            is_read=False
-        ).count()
+        count = get_unread_notifications_count(request.user)
         return Response({'unread_count': count})
 
@@ -1,23 +1,37 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
+from rest_framework import status
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.translation import get_language, gettext, gettext_noop
 from datetime import datetime, timedelta
-from jobs.models import JobEntry
+from jobs.models import JobEntry, JobEvent
+from jobs.caching import CATEGORIES_NAMESPACE, cached_user_compute
+from jobs.db_routing import using_replica
+from ..conditional import ConditionalRequestMixin
 from ..serializers import JobEntryListSerializer
 
 
-class StatisticsView(APIView):
+class StatisticsView(ConditionalRequestMixin, APIView):
     """API endpoint for job statistics"""
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'statistics'
+    etag_namespaces = (CATEGORIES_NAMESPACE,)
+    
+    def get_etag_parts(self, request):
+        # Upcoming counts are relative to today
+        return (timezone.localdate().isoformat(),)
     
     def get(self, request):
         """Get statistics for user's job entries"""
         from jobs.utils import get_statistics_data
         
         user_jobs = JobEntry.objects.filter(user=request.user).select_related('category')
-        statistics_data = get_statistics_data(user_jobs)
+        with using_replica(request.user):
+            statistics_data = cached_user_compute(
+                request.user, 'statistics', lambda: get_statistics_data(user_jobs, request.user)
+            )
         
         return Response(statistics_data)
 
@@ -25,95 +39,117 @@ class StatisticsView(APIView):
 class MonthlyReportView(APIView):
     """API endpoint for monthly report"""
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'reports'
     
     def get(self, request):
         """Get monthly report for user's job entries"""
-        from jobs.views.view_statistics import _get_monthly_report_job_entries
-        from jobs.views.view_statistics import _parse_year_month
-        
-        year_month = request.query_params.get('month', None)
-        if not year_month:
-            # Default to current month
-            now = timezone.now()
-            year_month = f"{now.year}-{now.month:02d}"
+        from jobs.views.view_statistics import _get_monthly_report_job_entries, _parse_year_month
         
-        year, month = _parse_year_month(year_month)
+        year, month = _parse_year_month(request)
         job_entries = _get_monthly_report_job_entries(request.user, year, month)
-        
+        return Response(self._build_report(year, month, job_entries))
+    
+    @staticmethod
+    def _build_report(year, month, job_entries):
+        """Response data for the month's job entries"""
         serializer = JobEntryListSerializer(job_entries, many=True)
-        return Response({
+        return {
             'year': year,
             'month': month,
             'total_entries': len(job_entries),
             'job_entries': serializer.data
-        })
+        }
 
 
-class CalendarView(APIView):
+class CalendarView(ConditionalRequestMixin, APIView):
     """API endpoint for calendar events"""
     permission_classes = [IsAuthenticated]
     
+    def get_etag_parts(self, request):
+        # Without ?start the range is the current month
+        return (timezone.localdate().isoformat(),)
+    
+    # Longest range one request may ask for; the calendar page asks for about six weeks
+    MAX_RANGE_DAYS = 366
+    
     def get(self, request):
         """Get calendar events for user's job entries"""
-        start_date = request.query_params.get('start', None)
-        end_date = request.query_params.get('end', None)
+        try:
+            start_date, end_date = self._parse_range(request.query_params)
+        except ValueError as error:
+            return Response({'detail': str(error)}, status=status.HTTP_400_BAD_REQUEST)
         
-        if start_date:
-            start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-        else:
-            start_date = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        if end_date:
-            end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-        else:
-            end_date = start_date + timedelta(days=30)
-        
-        events = []
-        job_entries = JobEntry.objects.filter(
-            user=request.user
-        ).filter(
-            Q(interview_date__range=[start_date, end_date]) |
-            Q(follow_up_date__range=[start_date, end_date]) |
-            Q(application_deadline__range=[start_date.date(), end_date.date()])
-        ).select_related('category')
+        # Cached per (user, range, language) and versioned by the user's data generation
+        with using_replica(request.user):
+            events = cached_user_compute(
+                request.user, 'calendar_events',
+                lambda: self._get_events(request.user, start_date, end_date),
+                parts=(start_date.isoformat(), end_date.isoformat(), get_language() or 'en')
+            )
+        return Response(events)
+    
+    @classmethod
+    def _parse_range(cls, params):
+        """
+        (start, end) from the ?start= and ?end= query parameters, defaulting to the current month.
         
-        for job in job_entries:
-            if job.interview_date and start_date <= job.interview_date <= end_date:
-                events.append({
-                    'id': f'interview_{job.id}',
-                    'title': f"Interview: {job.job_title} - {job.employer}",
-                    'start': job.interview_date.isoformat(),
-                    'end': (job.interview_date + timedelta(hours=1)).isoformat(),
-                    'type': 'interview',
-                    'job_id': job.id,
-                    'color': '#28a745'
-                })
-            
-            if job.follow_up_date and start_date <= job.follow_up_date <= end_date:
-                events.append({
-                    'id': f'followup_{job.id}',
-                    'title': f"Follow-up: {job.job_title} - {job.employer}",
-                    'start': job.follow_up_date.isoformat(),
-                    'end': (job.follow_up_date + timedelta(hours=1)).isoformat(),
-                    'type': 'follow_up',
-                    'job_id': job.id,
-                    'color': '#17a2b8'
-                })
-            
-            if job.application_deadline:
-                deadline_start = timezone.make_aware(
-                    datetime.combine(job.application_deadline, datetime.min.time())
-                )
-                if start_date <= deadline_start <= end_date:
-                    events.append({
-                        'id': f'deadline_{job.id}',
-                        'title': f"Deadline: {job.job_title} - {job.employer}",
-                        'start': deadline_start.isoformat(),
-                        'end': (deadline_start + timedelta(hours=1)).isoformat(),
-                        'type': 'deadline',
-                        'job_id': job.id,
-                        'color': '#dc3545'
-                    })
+        Raises:
+            ValueError: With the error detail for an invalid range
+        """
+        try:
+            start_date = cls._parse_date(params.get('start', None))
+            end_date = cls._parse_date(params.get('end', None))
+        except ValueError:
+            raise ValueError('start and end must be ISO 8601 dates')
         
-        return Response(events)
-
+        if start_date is None:
+            start_date = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if end_date is None:
+            end_date = start_date + timedelta(days=30)
+        if end_date < start_date or end_date - start_date > timedelta(days=cls.MAX_RANGE_DAYS):
+            raise ValueError(f'end must be after start and at most {cls.MAX_RANGE_DAYS} days later')
+        return start_date, end_date
+    
+    @staticmethod
+    def _parse_date(value):
+        """Parse an ISO 8601 date or datetime query parameter (naive values are in the current time zone)"""
+        if not value:
+            return None
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+    
+    # JobEvent kind -> (event id prefix, title prefix, color)
+    EVENT_STYLES = {
+        'interview': ('interview', gettext_noop('Interview'), '#28a745'),
+        'follow_up': ('followup', gettext_noop('Follow-up'), '#17a2b8'),
+        'deadline': ('deadline', gettext_noop('Deadline'), '#dc3545'),
+    }
+    
+    @staticmethod
+    def _event_rows(user, start_date, end_date):
+        """(kind, at, job id, job title, employer) of the user's events within the range"""
+        return JobEvent.objects.filter(user=user, at__range=[start_date, end_date]).values_list(
+            'kind', 'at', 'job_entry_id', 'job_entry__job_title', 'job_entry__employer'
+        )
+    
+    @classmethod
+    def _build_event(cls, kind, at, job_id, job_title, employer):
+        """Calendar event for one _event_rows() row"""
+        id_prefix, title, color = cls.EVENT_STYLES[kind]
+        start = timezone.localtime(at)
+        return {
+            'id': f'{id_prefix}_{job_id}',
+            'title': f"{gettext(title)}: {job_title} - {employer}",
+            'start': start.isoformat(),
+            'end': (start + timedelta(hours=1)).isoformat(),
+            'type': kind,
+            'job_id': job_id,
+            'url': reverse('jobs:job_detail', args=[job_id]),
+            'color': color
+        }
+    
+    def _get_events(self, user, start_date, end_date):
+        """Build calendar events for user's job entries within the range (one scan of the JobEvent index)"""
+        return [self._build_event(*row) for row in self._event_rows(user, start_date, end_date)]
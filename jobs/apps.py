@@ -7,4 +7,6 @@ class JobsConfig(AppConfig):
     
     def ready(self):
         import jobs.signals  # noqa
+        # Connects the query recording wrapper to every new database connection
+        import jobs.query_budget  # noqa
 
@@ -0,0 +1,64 @@
+"""
+Concurrent ORM work for async views.
+
+Django's async ORM methods (acount(), aaggregate(), `async for`) hand every query
+to the single thread that sync code shares, so queries awaited together with
+asyncio.gather() still run one after another. gather_queries() runs each call
+in a worker thread of its own instead: every thread has its own database
+connection, so independent queries really overlap. Each call closes its
+thread's connections when it returns, so idle worker threads never hold
+connections (or pool slots) open.
+
+Every worker holds a connection while it runs, so one request could otherwise
+take as many connections as it has calls and a few concurrent requests would
+drain the PostgreSQL pool. At most settings.ASYNC_DB_CONCURRENCY workers run
+at a time in a process; the others wait in their thread for a free slot before
+connecting, and the event loop is never blocked.
+
+Context variables carry over to the workers: the using_replica() read alias, and
+the active QueryRecorders, which count the workers' queries as the request's own.
+Use it for read-only work; calls do not share a transaction.
+"""
+import asyncio
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+
+_worker_slots = None
+_worker_slots_lock = threading.Lock()
+
+
+def _get_worker_slots():
+    """Process-wide semaphore bounding the workers that hold a database connection"""
+    global _worker_slots
+    with _worker_slots_lock:
+        if _worker_slots is None:
+            _worker_slots = threading.BoundedSemaphore(max(1, settings.ASYNC_DB_CONCURRENCY))
+        return _worker_slots
+
+
+def _call_and_close(fn, args):
+    with _get_worker_slots():
+        try:
+            return fn(*args)
+        finally:
+            connections.close_all()
+
+
+async def gather_queries(*calls):
+    """
+    Run independent blocking ORM calls concurrently.
+
+    Args:
+        calls: (fn, *args) tuples
+
+    Returns:
+        list: Results in the order of `calls`
+    """
+    return await asyncio.gather(*(
+        sync_to_async(_call_and_close, thread_sensitive=False)(fn, args)
+        for fn, *args in calls
+    ))
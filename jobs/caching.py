@@ -0,0 +1,580 @@
+"""
+Versioned cache namespaces for derived data.
+
+Every namespace (one per user, plus global ones such as categories and tags)
+has a generation counter stored in the cache. Derived values are cached under
+keys that embed the current generation, so bumping the counter with a single
+atomic increment invalidates everything cached for that namespace without
+enumerating or deleting keys. Stale entries simply expire via their TTL.
+
+The file and db backends implement incr() and add() as a read followed by a
+write, so with several processes two bumps could store the same generation and
+two requests could both take a recompute lock. With those backends generations
+and locks live in database rows instead (CacheGeneration, CacheLock), updated
+atomically with F() expressions and primary keys.
+
+Expensive computations go through cached_compute(), which adds stampede
+protection (single flight, early expiration, stale-while-revalidate). The
+a-prefixed variants serve async views: they await the computation on the
+event loop and run only the cache calls in a worker thread.
+
+Hot, rarely changing objects go through tiered_cache, an in-process LRU (L1)
+in front of the shared cache backend (L2).
+"""
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache as default_cache, caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .db_routing import mark_recent_write
+from .metrics import cache_requests
+from .timing import TimedCache
+
+
+# Backend calls are timed as 'cache' for the Server-Timing header
+cache = TimedCache(default_cache)
+
+
+DEFAULT_TIMEOUT = 300  # 5 minutes
+STALE_TIMEOUT = 600  # How long an expired value may still be served while it is recomputed
+LOCK_TIMEOUT = 30  # Upper bound for a single recomputation holding the lock
+LOCK_WAIT = 5  # How long a request without a stale value waits for another worker's result
+LOCK_POLL_INTERVAL = 0.05
+
+CATEGORIES_NAMESPACE = 'categories'
+TAGS_NAMESPACE = 'tags'
+CHOICES_NAMESPACE = 'choices'
+
+# Last-Modified of a set of generations; generations are never reused, so it may live long
+LAST_MODIFIED_TIMEOUT = 86400
+
+
+def _generation_key(namespace):
+    """Cache key holding the generation counter of a namespace"""
+    return f'generation_{namespace}'
+
+
+def _initial_generation():
+    """
+    Starting value for a generation counter.
+
+    Time-based so that a counter lost to eviction or a cache restart never
+    restarts at a value whose versioned keys may still be cached.
+    """
+    return int(time.time() * 1000)
+
+
+# Backends whose incr()/add() are not atomic across processes
+NON_ATOMIC_BACKENDS = (FileBasedCache, DatabaseCache)
+
+
+def _atomic_cache():
+    """Whether generations and locks can be kept in the cache backend itself"""
+    return not isinstance(caches['default'], NON_ATOMIC_BACKENDS)
+
+
+def _generation_rows(namespace):
+    from .models import CacheGeneration
+    # Always the primary: a lagging replica would return an old generation
+    return CacheGeneration.objects.using(DEFAULT_DB_ALIAS).filter(namespace=namespace)
+
+
+def _get_db_generation(namespace):
+    from .models import CacheGeneration
+    generation = _generation_rows(namespace).values_list('value', flat=True).first()
+    if generation is None:
+        row, _ = CacheGeneration.objects.using(DEFAULT_DB_ALIAS).get_or_create(
+            namespace=namespace, defaults={'value': _initial_generation()}
+        )
+        generation = row.value
+    return generation
+
+
+def _bump_db_generation(namespace):
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        if not _generation_rows(namespace).update(value=F('value') + 1):
+            _get_db_generation(namespace)
+            _generation_rows(namespace).update(value=F('value') + 1)
+        return _generation_rows(namespace).values_list('value', flat=True).get()
+
+
+def get_generation(namespace):
+    """Return the current generation of a namespace, initializing it if missing"""
+    if not _atomic_cache():
+        return _get_db_generation(namespace)
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        generation = _initial_generation()
+        if not cache.add(key, generation, timeout=None):
+            # Another process initialized it first - use its value
+            generation = cache.get(key, generation)
+    return generation
+
+
+def bump_generation(namespace):
+    """Invalidate everything cached in a namespace by incrementing its generation"""
+    # This process sees its own writes at once; other processes within tiered_cache's l1_ttl
+    tiered_cache.invalidate(namespace)
+    if not _atomic_cache():
+        return _bump_db_generation(namespace)
+    key = _generation_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter was never set or has been evicted
+        generation = _initial_generation()
+        if cache.add(key, generation, timeout=None):
+            return generation
+        return cache.incr(key)
+
+
+def get_last_modified(namespaces, generations):
+    """
+    Last-Modified of data versioned by `namespaces`, as a Unix timestamp in whole seconds.
+
+    The time the current `generations` of the namespaces were first seen, which is
+    never earlier than the change itself. HTTP dates have a resolution of one second,
+    so a newer set of generations gets at least the previous value plus one second:
+    otherwise a write in the same second would keep Last-Modified unchanged and a
+    client sending only If-Modified-Since would get 304 for stale data.
+    """
+    key = 'last_modified_' + '_'.join(namespaces)
+    generations = tuple(generations)
+    stored = cache.get(key)
+    if stored is not None and stored[0] == generations:
+        return stored[1]
+    last_modified = int(time.time())
+    if stored is not None:
+        last_modified = max(last_modified, stored[1] + 1)
+    cache.set(key, (generations, last_modified), LAST_MODIFIED_TIMEOUT)
+    return last_modified
+
+
+def _build_key(namespace, generation, name, parts):
+    """Cache key for `name` in `namespace` at a given generation"""
+    key = f'{namespace}_v{generation}_{name}'
+    if parts:
+        key += '_' + '_'.join(str(part) for part in parts)
+    return key
+
+
+def versioned_key(namespace, name, *parts):
+    """Build a cache key for `name` bound to the current generation of `namespace`"""
+    return _build_key(namespace, get_generation(namespace), name, parts)
+
+
+def get_or_set_versioned(namespace, name, compute, timeout=DEFAULT_TIMEOUT, parts=()):
+    """
+    Return the cached value for `name` in `namespace`, computing and storing it on a miss.
+
+    Args:
+        namespace: Namespace whose generation versions the key
+        name: Name of the derived value (e.g. 'statistics')
+        compute: Callable without arguments returning the value
+        timeout: Cache timeout in seconds
+        parts: Extra key parts (e.g. a date range)
+    """
+    key = versioned_key(namespace, name, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
+
+
+async def aget_or_set_versioned(namespace, name, compute, timeout=DEFAULT_TIMEOUT, parts=()):
+    """get_or_set_versioned() for async code: `compute` is a coroutine function awaited on the event loop"""
+    key, value = await sync_to_async(_versioned_get)(namespace, name, parts)
+    if value is None:
+        value = await compute()
+        await sync_to_async(cache.set)(key, value, timeout)
+    return value
+
+
+def _versioned_get(namespace, name, parts):
+    key = versioned_key(namespace, name, *parts)
+    return key, cache.get(key)
+
+
+def _should_refresh_early(entry, beta):
+    """
+    Probabilistic early expiration (XFetch).
+
+    Each request decides to refresh slightly before expiry with a probability
+    that grows as expiry approaches and with the time the value took to compute,
+    so refreshes are spread out instead of all landing at the same instant.
+    """
+    if beta <= 0:
+        return False
+    jitter = -entry['delta'] * beta * math.log(1.0 - random.random())
+    return time.time() + jitter >= entry['expires_at']
+
+
+def _store_entry(key, value, delta, ttl, stale_timeout, stale_key=None):
+    """Store a value with its logical expiry; keep it physically for the stale window"""
+    entry = {'value': value, 'delta': delta, 'expires_at': time.time() + ttl}
+    cache.set(key, entry, ttl + stale_timeout)
+    if stale_key:
+        cache.set(stale_key, entry, ttl + stale_timeout)
+    return entry
+
+
+def _acquire_lock(lock_key, token):
+    """Take the recompute lock `lock_key`; False if another request holds it"""
+    if _atomic_cache():
+        return cache.add(lock_key, token, LOCK_TIMEOUT)
+    from .models import CacheLock
+    now = timezone.now()
+    locks = CacheLock.objects.using(DEFAULT_DB_ALIAS)
+    # A lock left behind by a crashed worker expires like a cache key would
+    locks.filter(key=lock_key, expires_at__lte=now).delete()
+    try:
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            locks.create(key=lock_key, token=token, expires_at=now + timedelta(seconds=LOCK_TIMEOUT))
+    except IntegrityError:
+        return False
+    return True
+
+
+def _release_lock(lock_key, token):
+    """Release the recompute lock if this request still holds it"""
+    if _atomic_cache():
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+        return
+    from .models import CacheLock
+    CacheLock.objects.using(DEFAULT_DB_ALIAS).filter(key=lock_key, token=token).delete()
+
+
+def cached_compute(key, ttl, fn, stale_key=None, stale_timeout=STALE_TIMEOUT, beta=1.0):
+    """
+    Return a cached value, computing it with stampede protection.
+
+    - Single flight: only the request that takes the lock (``cache.add``, or a
+      CacheLock row on non-atomic backends) recomputes; the others serve a
+      stale value or wait for the winner.
+    - Probabilistic early expiration: values are refreshed shortly before they
+      expire, weighted by how long they take to compute.
+    - Stale-while-revalidate: expired values are kept for ``stale_timeout``
+      seconds and served while a single request recomputes them.
+    
+    Args:
+        key: Cache key of the value
+        ttl: Seconds the value is considered fresh
+        fn: Callable without arguments computing the value
+        stale_key: Optional key whose value may be served while `key` is being
+            computed for the first time (e.g. the previous generation of a versioned key)
+        stale_timeout: Seconds an expired value may still be served
+        beta: Early expiration aggressiveness (0 disables it)
+    """
+    state, result = _lookup_or_lock(key, stale_key, beta)
+    if state == 'value':
+        return result
+    if state == 'wait':
+        # Nothing to serve yet - wait briefly for the winner, then compute ourselves
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            entry = cache.get(key)
+            if entry is not None:
+                cache_requests.inc(layer='computed', result='hit')
+                return entry['value']
+        cache_requests.inc(layer='computed', result='miss')
+    try:
+        started = time.monotonic()
+        value = fn()
+        _store_entry(key, value, time.monotonic() - started, ttl, stale_timeout, stale_key)
+        return value
+    finally:
+        if state == 'locked':
+            _release_lock(*result)
+
+
+async def acached_compute(key, ttl, fn, stale_key=None, stale_timeout=STALE_TIMEOUT, beta=1.0):
+    """
+    cached_compute() for async code.
+
+    `fn` is a coroutine function, awaited on the event loop; only the cache
+    and lock calls run in a worker thread, since the backend may block.
+    """
+    state, result = await sync_to_async(_lookup_or_lock)(key, stale_key, beta)
+    if state == 'value':
+        return result
+    if state == 'wait':
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            entry = await sync_to_async(cache.get)(key)
+            if entry is not None:
+                cache_requests.inc(layer='computed', result='hit')
+                return entry['value']
+        cache_requests.inc(layer='computed', result='miss')
+    try:
+        started = time.monotonic()
+        value = await fn()
+        await sync_to_async(_store_entry)(key, value, time.monotonic() - started, ttl, stale_timeout, stale_key)
+        return value
+    finally:
+        if state == 'locked':
+            await sync_to_async(_release_lock)(*result)
+
+
+def _lookup_or_lock(key, stale_key, beta):
+    """
+    The cache lookups of cached_compute() before anything is computed.
+
+    Returns:
+        ('value', value) when a value can be served, ('locked', (lock_key, token))
+        when this request took the recompute lock, or ('wait', None) when another
+        request is recomputing and there is no stale value
+    """
+    entry = cache.get(key)
+    if entry is not None and time.time() < entry['expires_at'] and not _should_refresh_early(entry, beta):
+        cache_requests.inc(layer='computed', result='hit')
+        return 'value', entry['value']
+    
+    lock_key = f'{key}_lock'
+    token = uuid.uuid4().hex
+    if _acquire_lock(lock_key, token):
+        cache_requests.inc(layer='computed', result='miss')
+        return 'locked', (lock_key, token)
+    
+    # Another request is recomputing - serve whatever stale value we have
+    if entry is None and stale_key:
+        entry = cache.get(stale_key)
+    if entry is not None:
+        cache_requests.inc(layer='computed', result='stale')
+        return 'value', entry['value']
+    return 'wait', None
+
+
+def user_namespace(user):
+    """Namespace for a user's derived data; accepts a User instance or a user id"""
+    user_id = getattr(user, 'pk', user)
+    return f'user_{user_id}'
+
+
+def bump_user_generation(user):
+    """Invalidate all derived data cached for a user"""
+    # Every write to a user's data ends up here, so it also starts read-your-writes stickiness
+    mark_recent_write(user)
+    return bump_generation(user_namespace(user))
+
+
+def user_cache_key(user, name, *parts):
+    """Versioned cache key for a user's derived value"""
+    return versioned_key(user_namespace(user), name, *parts)
+
+
+def get_or_set_user_cache(user, name, compute, timeout=DEFAULT_TIMEOUT, parts=()):
+    """Per-user variant of get_or_set_versioned()"""
+    return get_or_set_versioned(user_namespace(user), name, compute, timeout, parts)
+
+
+def cached_user_compute(user, name, fn, ttl=DEFAULT_TIMEOUT, parts=()):
+    """
+    Stampede-protected per-user cache for expensive derived data.
+
+    The value is versioned by the user's data generation. Stale values are only
+    served within the current generation: a previous generation's value predates
+    a write (usually the user's own), so serving it would break read-your-writes.
+    Right after an invalidation, concurrent requests wait for the recompute instead.
+    """
+    return cached_compute(user_cache_key(user, name, *parts), ttl, fn)
+
+
+async def aget_or_set_user_cache(user, name, compute, timeout=DEFAULT_TIMEOUT, parts=()):
+    """Per-user variant of aget_or_set_versioned()"""
+    return await aget_or_set_versioned(user_namespace(user), name, compute, timeout, parts)
+
+
+async def acached_user_compute(user, name, fn, ttl=DEFAULT_TIMEOUT, parts=()):
+    """cached_user_compute() for async code: `fn` is a coroutine function"""
+    key = await sync_to_async(user_cache_key)(user, name, *parts)
+    return await acached_compute(key, ttl, fn)
+
+
+class TwoTierCache:
+    """
+    In-process LRU (L1) in front of the shared cache backend (L2).
+
+    L1 entries remember the namespace generation they were loaded with. Within
+    `l1_ttl` seconds they are served without touching L2 at all; after that they
+    are revalidated by reading only the namespace's generation key, and reloaded
+    from L2 (or recomputed) when the generation has moved on. bump_generation()
+    drops the namespace's entries of the bumping process, so a write is visible
+    to the next request of that process at once; staleness across processes is
+    bounded by `l1_ttl`.
+    
+    Values are shared between threads and requests, so callers must not mutate them.
+    """
+    
+    COUNTERS = ('l1_hits', 'l1_revalidations', 'l1_misses', 'l2_hits', 'l2_misses')
+    
+    def __init__(self, l1_ttl=5, max_entries=1024):
+        self.l1_ttl = l1_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+    
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+        layer, result = counter.split('_', 1)
+        cache_requests.inc(layer=layer, result={'hits': 'hit', 'misses': 'miss'}[result])
+    
+    def get_or_set(self, namespace, name, compute, timeout=DEFAULT_TIMEOUT, parts=()):
+        """Return the value for `name` in `namespace` from L1, L2 or `compute`, in that order"""
+        local_key = (namespace, name, tuple(parts))
+        now = time.monotonic()
+        generation = None
+        
+        with self._lock:
+            entry = self._entries.get(local_key)
+            if entry is not None:
+                self._entries.move_to_end(local_key)
+                value, entry_generation, checked_at = entry
+                if now - checked_at < self.l1_ttl:
+                    self._counters['l1_hits'] += 1
+                    cache_requests.inc(layer='l1', result='hit')
+                    return value
+        
+        if entry is not None:
+            # Cheap revalidation: compare generations instead of fetching the value
+            generation = get_generation(namespace)
+            if generation == entry_generation:
+                with self._lock:
+                    self._entries[local_key] = (value, generation, now)
+                    self._counters['l1_revalidations'] += 1
+                cache_requests.inc(layer='l1', result='revalidation')
+                return value
+        
+        self._count('l1_misses')
+        if generation is None:
+            generation = get_generation(namespace)
+        key = _build_key(namespace, generation, name, parts)
+        value = cache.get(key)
+        if value is None:
+            self._count('l2_misses')
+            value = compute()
+            cache.set(key, value, timeout)
+        else:
+            self._count('l2_hits')
+        
+        with self._lock:
+            self._entries[local_key] = (value, generation, now)
+            self._entries.move_to_end(local_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+    
+    def invalidate(self, namespace):
+        """Drop this process's L1 entries of a namespace (called when its generation is bumped)"""
+        with self._lock:
+            for local_key in [local_key for local_key in self._entries if local_key[0] == namespace]:
+                del self._entries[local_key]
+    
+    def clear(self):
+        """Drop all L1 entries of this process"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """Hit and miss counters for both tiers"""
+        with self._lock:
+            counters = dict(self._counters)
+            counters['l1_size'] = len(self._entries)
+        l1_lookups = counters['l1_hits'] + counters['l1_revalidations'] + counters['l1_misses']
+        l2_lookups = counters['l2_hits'] + counters['l2_misses']
+        counters['l1_hit_rate'] = round(
+            (counters['l1_hits'] + counters['l1_revalidations']) / l1_lookups, 4
+        ) if l1_lookups else 0
+        counters['l2_hit_rate'] = round(counters['l2_hits'] / l2_lookups, 4) if l2_lookups else 0
+        return counters
+
+
+tiered_cache = TwoTierCache(
+    l1_ttl=getattr(settings, 'CACHE_L1_TTL', 5),
+    max_entries=getattr(settings, 'CACHE_L1_MAX_ENTRIES', 1024),
+)
+
+
+def profile_namespace(user):
+    """Namespace for a user's profile; accepts a User instance or a user id"""
+    user_id = getattr(user, 'pk', user)
+    return f'profile_{user_id}'
+
+
+def get_user_profile(user):
+    """User profile (created on first access), served from the two-tier cache"""
+    from .models import UserProfile
+    return tiered_cache.get_or_set(
+        profile_namespace(user), 'profile',
+        lambda: UserProfile.objects.get_or_create(user=user, defaults={'theme': 'light'})[0],
+        timeout=3600
+    )
+
+
+def get_all_categories():
+    """All categories for filters and lists (cached for 1 hour)"""
+    from .models import Category
+    return tiered_cache.get_or_set(
+        CATEGORIES_NAMESPACE, 'all',
+        lambda: list(Category.objects.only('id', 'name', 'color').order_by('name')),
+        timeout=3600
+    )
+
+
+def get_all_tags():
+    """All tags for filters and lists (cached for 1 hour)"""
+    from .models import Tag
+    return tiered_cache.get_or_set(
+        TAGS_NAMESPACE, 'all',
+        lambda: list(Tag.objects.only('id', 'name').order_by('name')),
+        timeout=3600
+    )
+
+
+def _build_catalog(objects):
+    """Lookup by id plus prebuilt (id, label) choices, in the objects' order"""
+    objects = list(objects)
+    return {
+        'by_id': {obj.pk: obj for obj in objects},
+        'choices': tuple((obj.pk, str(obj)) for obj in objects),
+    }
+
+
+def get_category_catalog():
+    """Categories by id and as form choices (cached for 1 hour)"""
+    from .models import Category
+    return tiered_cache.get_or_set(
+        CATEGORIES_NAMESPACE, 'catalog',
+        lambda: _build_catalog(Category.objects.only('id', 'name', 'color').order_by('name')),
+        timeout=3600
+    )
+
+
+def get_tag_catalog():
+    """Tags by id and as form choices (cached for 1 hour)"""
+    from .models import Tag
+    return tiered_cache.get_or_set(
+        TAGS_NAMESPACE, 'catalog',
+        lambda: _build_catalog(Tag.objects.only('id', 'name').order_by('name')),
+        timeout=3600
+    )
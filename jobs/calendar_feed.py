@@ -0,0 +1,164 @@
+"""
+Per-user iCalendar (ICS) feed of interviews, follow-ups and deadlines.
+
+Calendar apps poll the feed far more often than anything changes, so a poll
+with a matching validator is answered without touching the database: the
+token -> user lookup is cached, and the ETag/Last-Modified validators follow
+the user's data generation, which every write to the user's data (deletions
+included) bumps.
+"""
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import get_language, gettext, gettext_noop
+
+from .caching import (
+    cache, get_generation, get_last_modified, profile_namespace, bump_generation, user_namespace
+)
+from .models import JobEvent, UserProfile
+
+
+TOKEN_CACHE_TIMEOUT = 3600
+FEED_PRODID = '-//Job Search//Calendar Feed//EN'
+
+# JobEvent kind -> summary prefix
+EVENT_SUMMARIES = {
+    'interview': gettext_noop('Interview'),
+    'follow_up': gettext_noop('Follow-up'),
+    'deadline': gettext_noop('Deadline'),
+}
+
+
+def _token_cache_key(token):
+    # Tokens are hashed so they never appear in cache keys or cache dumps
+    return f'calendar_token_{hashlib.sha256(token.encode()).hexdigest()}'
+
+
+def get_calendar_token(user):
+    """The user's feed token, created on first use"""
+    profile, _ = UserProfile.objects.get_or_create(user=user)
+    if profile.calendar_token:
+        return profile.calendar_token
+    return reset_calendar_token(user)
+
+
+def reset_calendar_token(user):
+    """Replace the user's feed token; the old feed URL stops working immediately"""
+    old_token = UserProfile.objects.filter(user=user).values_list('calendar_token', flat=True).first()
+    token = secrets.token_urlsafe(32)
+    UserProfile.objects.filter(user=user).update(calendar_token=token)
+    # update() skips the profile signal - drop the cached profile and the old token ourselves
+    bump_generation(profile_namespace(user))
+    if old_token:
+        cache.delete(_token_cache_key(old_token))
+    return token
+
+
+def resolve_calendar_token(token):
+    """Id of the user owning a feed token, or None (cached)"""
+    if not token:
+        return None
+    key = _token_cache_key(token)
+    user_id = cache.get(key)
+    if user_id is None:
+        user_id = UserProfile.objects.filter(calendar_token=token).values_list('user_id', flat=True).first()
+        if user_id is None:
+            return None
+        cache.set(key, user_id, TOKEN_CACHE_TIMEOUT)
+    return user_id
+
+
+def feed_validators(user_id):
+    """
+    ETag and Last-Modified of a user's feed, without queries.
+
+    The ETag hashes the user's data generation with the language the feed is
+    rendered in; Last-Modified is the time the generation was first seen, so
+    deleting an entry moves it as well. Every generation gets a later
+    Last-Modified than the one before, even within the same second, because
+    calendar apps usually poll with If-Modified-Since only.
+    """
+    namespace = user_namespace(user_id)
+    generation = get_generation(namespace)
+    digest = hashlib.sha256(f'{user_id}:{generation}:{get_language() or ""}'.encode())
+    last_modified = get_last_modified([namespace], [generation])
+    return {
+        'etag': f'"{digest.hexdigest()[:32]}"',
+        'last_modified': datetime.fromtimestamp(last_modified, tz=dt_timezone.utc),
+    }
+
+
+def _escape(text):
+    """Escape a TEXT value (RFC 5545, 3.3.11)"""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line):
+    """Fold a content line at 75 octets (RFC 5545, 3.1) and terminate it with CRLF"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    while len(encoded) > 75:
+        cut = 75 if not parts else 74  # Continuation lines start with a space
+        # Never split a multi-byte UTF-8 character
+        while cut and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+    parts.append(encoded.decode())
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _utc(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def iter_calendar_feed(user_id, base_url, calendar_name):
+    """
+    Content lines of a user's feed, streaming the events from the database.
+
+    Args:
+        user_id: Owner of the events
+        base_url: Absolute URL prefix for event links (e.g. https://example.com)
+        calendar_name: Display name of the calendar
+
+    Returns:
+        Iterator of CRLF-terminated lines
+    """
+    # Translate now: the lines are produced after the view has returned
+    summaries = {kind: gettext(label) for kind, label in EVENT_SUMMARIES.items()}
+    events = JobEvent.objects.filter(user_id=user_id).order_by('at').values_list(
+        'kind', 'at', 'job_entry_id', 'job_entry__job_title', 'job_entry__employer', 'job_entry__updated_at'
+    )
+    return _feed_lines(events, summaries, base_url, calendar_name)
+
+
+def _feed_lines(events, summaries, base_url, calendar_name):
+    yield _fold('BEGIN:VCALENDAR')
+    yield _fold('VERSION:2.0')
+    yield _fold(f'PRODID:{FEED_PRODID}')
+    yield _fold('CALSCALE:GREGORIAN')
+    yield _fold('METHOD:PUBLISH')
+    yield _fold(f'X-WR-CALNAME:{_escape(calendar_name)}')
+
+    for kind, at, job_id, job_title, employer, updated_at in events.iterator(chunk_size=500):
+        yield _fold('BEGIN:VEVENT')
+        yield _fold(f'UID:{kind}-{job_id}@job-search')
+        yield _fold(f'DTSTAMP:{_utc(updated_at)}')
+        if kind == 'deadline':
+            day = timezone.localtime(at).date()
+            yield _fold(f'DTSTART;VALUE=DATE:{day:%Y%m%d}')
+            yield _fold(f'DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}')
+        else:
+            yield _fold(f'DTSTART:{_utc(at)}')
+            yield _fold(f'DTEND:{_utc(at + timedelta(hours=1))}')
+        yield _fold(f'SUMMARY:{_escape(f"{summaries[kind]}: {job_title} - {employer}")}')
+        yield _fold(f'URL:{base_url}{reverse("jobs:job_detail", args=[job_id])}')
+        yield _fold('END:VEVENT')
+
+    yield _fold('END:VCALENDAR')
@@ -53,3 +53,9 @@ RESUME_SUBMISSION_STATUS_CHOICES = [
     ('rejection_received', _('Rejection Received')),
 ]
 
+
+JOB_EVENT_KIND_CHOICES = [
+    ('interview', _('Interview')),
+    ('follow_up', _('Follow-up')),
+    ('deadline', _('Deadline')),
+]
@@ -1,17 +1,12 @@
-from django.core.cache import cache
-from .models import Notification, UserProfile
+from .caching import get_user_profile
+from .utils import get_unread_notifications_count
 
 
 def notifications_count(request):
     """Add unread notifications count to template context"""
     if request.user.is_authenticated:
-        # Cache for 5 minutes to reduce database queries
-        cache_key = f'notifications_count_{request.user.id}'
-        unread_count = cache.get(cache_key)
-        if unread_count is None:
-            unread_count = Notification.objects.filter(user=request.user, is_read=False).count()
-            cache.set(cache_key, unread_count, 300)  # 5 minutes
-        return {'unread_notifications_count': unread_count}
+        # Cached per user data generation to reduce database queries
+        return {'unread_notifications_count': get_unread_notifications_count(request.user)}
     return {'unread_notifications_count': 0}
 
 
@@ -19,11 +14,8 @@ def user_theme(request):
     """Context processor to add user theme preference to all templates"""
     theme = 'light'
     if request.user.is_authenticated:
-        # Use get_or_create to avoid exception handling and ensure profile exists
-        profile, created = UserProfile.objects.get_or_create(
-            user=request.user,
-            defaults={'theme': 'light'}
-        )
+        # Profile is created on first access and served from the two-tier cache
+        profile = get_user_profile(request.user)
         theme = profile.theme
         # If auto, detect system preference
         if theme == 'auto':
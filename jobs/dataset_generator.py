@@ -0,0 +1,225 @@
+"""
+Synthetic data generation at production scale.
+
+DatasetGenerator writes realistic job entries (weighted statuses with matching
+resume-status timelines, status history, notifications, calendar events and tag links) for any
+number of users with batched bulk_create. bulk_create bypasses save(),
+full_clean() and all model signals, so no per-row history, notification or
+cache-invalidation work is done. Every user's rows depend only on the seed and
+the username, so the same arguments always produce the same data.
+
+Used by the generate_dataset command and the benchmark suite.
+"""
+import random
+from collections import Counter
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .events import build_job_events
+from .models import (JobEntry, JobEntryHistory, JobEvent, Notification, ResumeSubmissionStatus,
+                     Category, Tag, UserProfile)
+
+
+JOB_TITLES = [
+    'Software Engineer', 'Senior Python Developer', 'Full Stack Developer', 'Backend Developer',
+    'Frontend Developer', 'DevOps Engineer', 'Cloud Architect', 'Data Engineer',
+    'Machine Learning Engineer', 'Java Developer', 'QA Engineer', 'Security Engineer',
+]
+EMPLOYERS = [
+    'SAP SE', 'Siemens AG', 'BMW Group', 'Volkswagen AG', 'Bosch', 'Zalando', 'Delivery Hero',
+    'HelloFresh', 'TeamViewer', 'Trivago', 'Celonis', 'Personio', 'N26', 'GetYourGuide', 'Babbel',
+]
+CITIES = ['Berlin', 'München', 'Hamburg', 'Frankfurt am Main', 'Köln', 'Stuttgart', 'Leipzig', 'Dresden']
+CATEGORIES = [('IT', '#667eea'), ('Finance', '#48bb78'), ('Engineering', '#805ad5'), ('Consulting', '#c05621')]
+TAGS = ['Python', 'Django', 'JavaScript', 'React', 'SQL', 'PostgreSQL', 'Docker', 'Kubernetes', 'AWS', 'Agile']
+
+# Final status -> weight; the resume-status timeline leading to it is in STATUS_TIMELINES
+STATUS_WEIGHTS = {
+    'not_applied': 15, 'applied': 30, 'confirmed': 10, 'interview_scheduled': 8,
+    'interview_passed': 4, 'documents_requested': 3, 'response_received': 5, 'rejected': 22, 'accepted': 3,
+}
+STATUS_TIMELINES = {
+    'not_applied': [],
+    'applied': ['resume_sent'],
+    'confirmed': ['resume_sent', 'confirmation_received'],
+    'interview_scheduled': ['resume_sent', 'confirmation_received', 'interview_scheduled'],
+    'interview_passed': ['resume_sent', 'interview_scheduled', 'interview_passed'],
+    'documents_requested': ['resume_sent', 'documents_requested'],
+    'response_received': ['resume_sent', 'confirmation_received'],
+    'rejected': ['resume_sent', 'rejection_received'],
+    'accepted': ['resume_sent', 'interview_scheduled', 'interview_passed'],
+}
+# Job status reached by each resume-status event (mirrors sync_status_from_resume_status)
+EVENT_STATUSES = {
+    'resume_sent': 'applied',
+    'confirmation_received': 'confirmed',
+    'interview_scheduled': 'interview_scheduled',
+    'interview_passed': 'interview_passed',
+    'documents_requested': 'documents_requested',
+    'rejection_received': 'rejected',
+}
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create store generated auto_now/auto_now_add values instead of the current time"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class DatasetGenerator:
+    """
+    Bulk generator of realistic rows.
+
+    Args:
+        seed: Random seed
+        batch_size: Job entries per batch (one transaction and one bulk_create per table)
+        anchor: Newest possible creation and update time (defaults to the start of today)
+    """
+
+    def __init__(self, seed=0, batch_size=2000, anchor=None):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.anchor = anchor or timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.categories = [Category.objects.get_or_create(name=name, defaults={'color': color})[0]
+                           for name, color in CATEGORIES]
+        self.tags = [Tag.objects.get_or_create(name=name)[0] for name in TAGS]
+        self.counts = Counter()  # Rows written per table
+
+    def create_users(self, usernames, password):
+        """Bulk-create users (one shared password hash) with their profiles"""
+        password_hash = make_password(password)
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(username=username, email=f'{username}@example.com', password=password_hash)
+                for username in usernames
+            ], batch_size=self.batch_size)
+            UserProfile.objects.bulk_create([UserProfile(user=user) for user in users], batch_size=self.batch_size)
+        self.counts[User._meta.db_table] += len(users)
+        self.counts[UserProfile._meta.db_table] += len(users)
+        return users
+
+    def generate_jobs(self, user, count):
+        """Write `count` job entries with their related rows for `user`"""
+        rng = random.Random(f'{self.seed}-{user.username}')
+        with explicit_timestamps(JobEntry, ResumeSubmissionStatus, JobEntryHistory, Notification):
+            for start in range(0, count, self.batch_size):
+                with transaction.atomic():
+                    self._write_batch(user, rng, range(start, min(start + self.batch_size, count)))
+
+    def _write_batch(self, user, rng, indexes):
+        built = [self._build_job(user, rng, index) for index in indexes]
+        jobs = JobEntry.objects.bulk_create([job for job, _ in built])
+        related = {ResumeSubmissionStatus: [], JobEntryHistory: [], Notification: [], JobEvent: [],
+                   JobEntry.tags.through: []}
+        for job, (_, timeline) in zip(jobs, built):
+            self._add_related_rows(related, job, timeline, rng)
+        self.counts[JobEntry._meta.db_table] += len(jobs)
+        for model, rows in related.items():
+            model.objects.bulk_create(rows, batch_size=self.batch_size)
+            self.counts[model._meta.db_table] += len(rows)
+
+    def _build_job(self, user, rng, index):
+        """One unsaved JobEntry plus the (status_type, date) timeline that led to its status"""
+        status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+        created_at = self.anchor - timedelta(days=rng.randint(0, 400), minutes=rng.randint(0, 1439))
+        timeline = []
+        moment = created_at
+        for status_type in STATUS_TIMELINES[status]:
+            moment = moment + timedelta(days=rng.randint(0, 14), hours=rng.randint(1, 12))
+            timeline.append((status_type, moment))
+        dates = dict(timeline)
+        response_date = None
+        if status in ('response_received', 'accepted'):
+            response_date = moment = moment + timedelta(days=rng.randint(1, 10))
+
+        salary_min = rng.randrange(40000, 90000, 1000) if rng.random() < 0.6 else None
+        job = JobEntry(
+            user=user,
+            job_title=rng.choice(JOB_TITLES),
+            employer=rng.choice(EMPLOYERS),
+            address=f'{rng.choice(CITIES)}, Germany',
+            contact_email=f'jobs{index}@example.com',
+            contact_phone=f'+49 30 {rng.randint(1000000, 9999999)}',
+            job_url=f'https://jobs.example.com/{user.username}/{index}',
+            description='Generated job entry. ' * rng.randint(5, 30),
+            category=rng.choice(self.categories),
+            salary_min=Decimal(salary_min) if salary_min else None,
+            salary_max=Decimal(salary_min + rng.randrange(5000, 30000, 1000)) if salary_min else None,
+            salary_currency='EUR',
+            work_type=rng.choice(['remote', 'office', 'hybrid', 'flexible']),
+            priority=rng.choice(['high', 'medium', 'low']),
+            source=rng.choice(['linkedin', 'indeed', 'stepstone', 'company_website', 'recruiter', 'referral']),
+            status=status,
+            resume_submitted='resume_sent' in dates,
+            resume_submitted_date=dates.get('resume_sent'),
+            application_confirmed='confirmation_received' in dates,
+            confirmation_date=dates.get('confirmation_received'),
+            response_received=response_date is not None,
+            response_date=response_date,
+            rejection_received=status == 'rejected',
+            rejection_date=dates.get('rejection_received'),
+            interview_date=dates.get('interview_scheduled'),
+            follow_up_date=created_at + timedelta(days=rng.randint(7, 21)) if rng.random() < 0.3 else None,
+            application_deadline=(
+                (created_at + timedelta(days=rng.randint(14, 60))).date() if rng.random() < 0.4 else None
+            ),
+            notes='' if rng.random() < 0.5 else 'Follow up with the recruiter.',
+            created_at=created_at,
+            updated_at=min(moment, self.anchor),
+        )
+        return job, timeline
+
+    def _add_related_rows(self, related, job, timeline, rng):
+        """Resume statuses, status history, notifications, events and tag links of a saved job"""
+        previous_status = 'not_applied'
+        for status_type, moment in timeline:
+            related[ResumeSubmissionStatus].append(ResumeSubmissionStatus(
+                job_entry=job, status_type=status_type, date_time=moment, created_at=moment
+            ))
+            new_status = EVENT_STATUSES[status_type]
+            if new_status != previous_status:
+                related[JobEntryHistory].append(JobEntryHistory(
+                    job_entry=job, user_id=job.user_id, field_name='status',
+                    old_value=previous_status, new_value=new_status, changed_at=moment
+                ))
+                previous_status = new_status
+        if job.status != previous_status:
+            # Final status without a resume-status event (response received, accepted)
+            related[JobEntryHistory].append(JobEntryHistory(
+                job_entry=job, user_id=job.user_id, field_name='status',
+                old_value=previous_status, new_value=job.status, changed_at=job.updated_at
+            ))
+        if job.interview_date:
+            related[Notification].append(Notification(
+                user_id=job.user_id, job_entry=job, notification_type='interview',
+                title=f'Upcoming interview: {job.job_title}',
+                message=f'Interview scheduled for {job.interview_date:%Y-%m-%d %H:%M}',
+                is_read=rng.random() < 0.7, created_at=job.updated_at,
+            ))
+        if job.follow_up_date:
+            related[Notification].append(Notification(
+                user_id=job.user_id, job_entry=job, notification_type='followup',
+                title=f'Follow-up reminder: {job.job_title}',
+                message=f'Follow-up scheduled for {job.follow_up_date:%Y-%m-%d %H:%M}',
+                is_read=rng.random() < 0.7, created_at=job.created_at,
+            ))
+        related[JobEvent].extend(build_job_events(job))
+        for tag in rng.sample(self.tags, rng.randint(0, 3)):
+            related[JobEntry.tags.through].append(JobEntry.tags.through(jobentry_id=job.pk, tag_id=tag.pk))
@@ -0,0 +1,123 @@
+"""
+Read/write routing for reporting traffic.
+
+Writes always go to the primary ('default') database. Read-heavy reporting code
+(statistics, monthly reports, PDFs, calendar events) runs inside using_replica(),
+which sends its queries to settings.DATABASE_READ_ALIAS. To keep read-your-writes
+semantics, a user who wrote within the last DATABASE_REPLICA_STICKY_SECONDS
+stays on the primary until the replica has had time to catch up.
+"""
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+_read_alias = ContextVar('jobs_read_alias', default=None)
+
+
+def get_read_alias():
+    """Database alias used for replica reads ('default' when no replica is configured)"""
+    return getattr(settings, 'DATABASE_READ_ALIAS', DEFAULT_DB_ALIAS)
+
+
+def replica_enabled():
+    """Whether a separate read alias is configured"""
+    return get_read_alias() != DEFAULT_DB_ALIAS
+
+
+def _recent_write_key(user):
+    user_id = getattr(user, 'pk', user)
+    return f'db_recent_write_{user_id}'
+
+
+def mark_recent_write(user):
+    """Pin a user's reads to the primary for the stickiness window after a write"""
+    if replica_enabled() and user is not None:
+        cache.set(_recent_write_key(user), True, getattr(settings, 'DATABASE_REPLICA_STICKY_SECONDS', 10))
+
+
+def has_recent_write(user):
+    """Whether the user wrote recently enough that the replica may not have the change yet"""
+    return user is not None and cache.get(_recent_write_key(user)) is not None
+
+
+@contextmanager
+def using_replica(user=None):
+    """
+    Route reads inside the block (or decorated function) to the read alias.
+
+    Args:
+        user: User (or user id) the reads are made for. If the user wrote
+            recently, reads stay on the primary (read-your-writes).
+    """
+    alias = _replica_read_alias(user)
+    token = _read_alias.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_alias.reset(token)
+
+
+@asynccontextmanager
+async def ausing_replica(user=None):
+    """using_replica() for async code (the recent-write check reads the cache in a worker thread)"""
+    alias = await sync_to_async(_replica_read_alias)(user) if replica_enabled() else DEFAULT_DB_ALIAS
+    token = _read_alias.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_alias.reset(token)
+
+
+def _replica_read_alias(user):
+    """Alias that reads for `user` go to inside using_replica()"""
+    if not replica_enabled() or (user is not None and has_recent_write(user)):
+        return DEFAULT_DB_ALIAS
+    return get_read_alias()
+
+
+class ReadReplicaRouter:
+    """Send reads inside using_replica() to the read alias; everything else to the primary"""
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is not None:
+            return alias
+        # Related lookups follow the instance they start from (Django's default)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same data, so objects from either alias may be related
+        aliases = {DEFAULT_DB_ALIAS, get_read_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+def sync_sqlite_replica(source=DEFAULT_DB_ALIAS, target=None):
+    """
+    Copy the primary SQLite database into the replica with SQLite's online backup.
+
+    Used for the local two-file setup and as a test fixture; a real replica is
+    kept in sync by the database server instead.
+    """
+    target = target or get_read_alias()
+    if target == source:
+        return False
+    source_connection, target_connection = connections[source], connections[target]
+    if source_connection.vendor != 'sqlite' or target_connection.vendor != 'sqlite':
+        raise ValueError('sync_sqlite_replica() only supports SQLite databases')
+    source_connection.ensure_connection()
+    target_connection.ensure_connection()
+    source_connection.connection.backup(target_connection.connection)
+    return True
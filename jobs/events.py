@@ -0,0 +1,101 @@
+"""
+JobEvent maintenance.
+
+Every interview, follow-up and deadline date of a job entry is mirrored as one
+JobEvent row. post_save on JobEntry keeps the rows in sync (see signals.py);
+rebuild_job_events() backfills them for rows written without signals, such as
+bulk_create or queryset.update(). backfill_job_events() runs it after migrate
+while the table is still empty, e.g. on installs upgraded from before JobEvent.
+"""
+from datetime import datetime, time
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .caching import bump_user_generation
+from .models import JobEntry, JobEvent
+
+
+# JobEvent kind -> JobEntry date field
+EVENT_FIELDS = {
+    'interview': 'interview_date',
+    'follow_up': 'follow_up_date',
+    'deadline': 'application_deadline',
+}
+
+
+def event_time(kind, value):
+    """Moment of an event; deadlines are dates and start at midnight in the current time zone"""
+    if kind == 'deadline':
+        return timezone.make_aware(datetime.combine(value, time.min))
+    return value
+
+
+def build_job_events(job_entry):
+    """Unsaved JobEvent rows for a job entry's date fields"""
+    events = []
+    for kind, field in EVENT_FIELDS.items():
+        value = getattr(job_entry, field)
+        if value is not None:
+            events.append(JobEvent(
+                user_id=job_entry.user_id, job_entry_id=job_entry.pk, kind=kind, at=event_time(kind, value)
+            ))
+    return events
+
+
+def sync_job_events(job_entry):
+    """Replace the JobEvent rows of a saved job entry"""
+    events = build_job_events(job_entry)
+    with transaction.atomic():
+        JobEvent.objects.filter(job_entry_id=job_entry.pk).delete()
+        if events:
+            JobEvent.objects.bulk_create(events)
+
+
+def rebuild_job_events(job_entries=None, batch_size=2000):
+    """
+    Rebuild the JobEvent rows of many job entries.
+
+    Args:
+        job_entries: JobEntry queryset (all entries when None)
+        batch_size: Job entries per transaction
+
+    Returns:
+        Number of events written
+    """
+    if job_entries is None:
+        job_entries = JobEntry.objects.all()
+    ids = list(job_entries.order_by('pk').values_list('pk', flat=True))
+    written = 0
+    for start in range(0, len(ids), batch_size):
+        batch_ids = ids[start:start + batch_size]
+        rows = JobEntry.objects.filter(pk__in=batch_ids).only('id', 'user_id', *EVENT_FIELDS.values())
+        events = [event for job_entry in rows for event in build_job_events(job_entry)]
+        with transaction.atomic():
+            JobEvent.objects.filter(job_entry_id__in=batch_ids).delete()
+            JobEvent.objects.bulk_create(events, batch_size=batch_size)
+        written += len(events)
+    return written
+
+
+def backfill_job_events(using):
+    """
+    Build the JobEvent rows of all job entries if there are none yet.
+
+    Returns:
+        Number of events written (0 when the table already had rows or no entry has a date)
+    """
+    if using != DEFAULT_DB_ALIAS or JobEvent.objects.exists():
+        return 0
+    dated = Q()
+    for field in EVENT_FIELDS.values():
+        dated |= Q(**{f'{field}__isnull': False})
+    job_entries = JobEntry.objects.filter(dated)
+    if not job_entries.exists():
+        return 0
+    written = rebuild_job_events(job_entries)
+    # Cached calendars and statistics were built without the events
+    for user_id in job_entries.order_by().values_list('user_id', flat=True).distinct():
+        bump_user_generation(user_id)
+    return written
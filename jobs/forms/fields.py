@@ -0,0 +1,94 @@
+"""
+Model choice fields backed by the versioned category/tag caches.
+
+Rendering and validation use a cached catalog ({'by_id': ..., 'choices': ...})
+instead of querying the field's queryset on every form, so forms listing all
+categories and tags cost no queries once the catalog is cached. Ids that are
+not in the catalog (e.g. created in another process within the L1 TTL) are
+still checked against the database before they are rejected.
+"""
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+
+from ..caching import get_category_catalog, get_tag_catalog
+
+
+class CatalogChoiceIterator(ModelChoiceIterator):
+    """Choices from the field's cached catalog instead of its queryset"""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        catalog = self.field.get_catalog()
+        by_id = catalog['by_id']
+        for pk, label in catalog['choices']:
+            yield ModelChoiceIteratorValue(pk, by_id[pk]), label
+
+    def __len__(self):
+        return len(self.field.get_catalog()['choices']) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.get_catalog()['choices'])
+
+
+class CatalogChoiceMixin:
+    """Shared lookup of submitted ids in the cached catalog"""
+    iterator = CatalogChoiceIterator
+    catalog = None  # Callable returning the catalog
+
+    def get_catalog(self):
+        return self.catalog()
+
+    def _lookup(self, values):
+        """Objects for the submitted ids; raises ValidationError for unknown or malformed ids"""
+        pks = set()
+        for value in values:
+            try:
+                pks.add(int(value))
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value}
+                )
+        by_id = self.get_catalog()['by_id']
+        objects = {pk: by_id[pk] for pk in pks if pk in by_id}
+        missing = pks - objects.keys()
+        if missing:
+            objects.update((obj.pk, obj) for obj in self.queryset.filter(pk__in=missing))
+        for pk in pks - objects.keys():
+            raise ValidationError(
+                self.error_messages['invalid_choice'], code='invalid_choice', params={'value': pk}
+            )
+        return objects
+
+
+class CatalogModelChoiceField(CatalogChoiceMixin, forms.ModelChoiceField):
+    """ModelChoiceField rendered and validated from a cached catalog"""
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        self.validate_no_null_characters(value)
+        return next(iter(self._lookup([value]).values()))
+
+
+class CatalogModelMultipleChoiceField(CatalogChoiceMixin, forms.ModelMultipleChoiceField):
+    """ModelMultipleChoiceField rendered and validated from a cached catalog"""
+
+    def _check_values(self, value):
+        try:
+            values = list(value)
+        except TypeError:
+            raise ValidationError(self.error_messages['invalid_list'], code='invalid_list')
+        for pk in values:
+            self.validate_no_null_characters(pk)
+        objects = self._lookup(values)
+        return [objects[pk] for pk in sorted(objects)]
+
+
+class CategoryChoiceField(CatalogModelChoiceField):
+    catalog = staticmethod(get_category_catalog)
+
+
+class TagMultipleChoiceField(CatalogModelMultipleChoiceField):
+    catalog = staticmethod(get_tag_catalog)
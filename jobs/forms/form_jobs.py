@@ -1,12 +1,40 @@
 from django import forms
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
+from ..caching import tiered_cache, CHOICES_NAMESPACE
 from ..models import JobEntry, Tag, ResumeSubmissionStatus
 from ..choices import RESUME_SUBMISSION_STATUS_CHOICES
+from .fields import CategoryChoiceField, TagMultipleChoiceField
+
+
+EMPTY_CHOICE = ('', '---------')
+CURRENCY_CHOICES = [EMPTY_CHOICE, ('USD', 'USD'), ('EUR', 'EUR'), ('GBP', 'GBP'), ('RUB', 'RUB'), ('CHF', 'CHF')]
+
+
+def _build_job_form_choices():
+    """Select choices of JobEntryForm, with labels translated to the active language"""
+    choices = {}
+    for name in ('work_type', 'priority', 'source', 'status'):
+        field_choices = tuple((value, str(label)) for value, label in JobEntry._meta.get_field(name).formfield().choices)
+        # Optional selects start with an empty choice
+        if name != 'status' and field_choices[0][0] != '':
+            field_choices = (EMPTY_CHOICE,) + field_choices
+        choices[name] = field_choices
+    choices['salary_currency'] = tuple(CURRENCY_CHOICES)
+    return choices
+
+
+def get_job_form_choices():
+    """Prebuilt JobEntryForm choices for the active language (cached for 1 hour)"""
+    return tiered_cache.get_or_set(
+        CHOICES_NAMESPACE, 'job_form', _build_job_form_choices,
+        timeout=3600, parts=(get_language() or 'en',)
+    )
 
 
 class JobEntryForm(forms.ModelForm):
     """Form for creating/editing job entries"""
-    tags = forms.ModelMultipleChoiceField(
+    # Choices and validation come from the cached category/tag catalogs
+    tags = TagMultipleChoiceField(
         queryset=Tag.objects.all(),
         required=False,
         widget=forms.CheckboxSelectMultiple(attrs={'class': 'form-check-input'}),
@@ -29,6 +57,9 @@ class JobEntryForm(forms.ModelForm):
             'rejection_received', 'rejection_date',
             'status', 'notes'
         )
+        field_classes = {
+            'category': CategoryChoiceField,
+        }
         widgets = {
             'job_title': forms.TextInput(attrs={'class': 'form-control'}),
             'employer': forms.TextInput(attrs={'class': 'form-control'}),
@@ -63,26 +94,20 @@ class JobEntryForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
+        choices = get_job_form_choices()
         # Set currency choices and make it not required
         self.fields['salary_currency'].required = False
-        self.fields['salary_currency'].widget = forms.Select(choices=[
-            ('', '---------'), ('USD', 'USD'), ('EUR', 'EUR'), ('GBP', 'GBP'), ('RUB', 'RUB'), ('CHF', 'CHF')
-        ], attrs={'class': 'form-control'})
+        self.fields['salary_currency'].widget = forms.Select(choices=choices['salary_currency'],
+                                                             attrs={'class': 'form-control'})
         # Make fields not required
         self.fields['priority'].required = False
         self.fields['work_type'].required = False
         self.fields['source'].required = False
         self.fields['salary_min'].required = False
         self.fields['salary_max'].required = False
-        # Add empty choice to select fields
-        if self.fields['work_type'].choices:
-            self.fields['work_type'].choices = [('', '---------')] + list(self.fields['work_type'].choices)
-        if self.fields['priority'].choices:
-            self.fields['priority'].choices = [('', '---------')] + list(self.fields['priority'].choices)
-        if self.fields['source'].choices:
-            self.fields['source'].choices = [('', '---------')] + list(self.fields['source'].choices)
-        # Set tags queryset to all tags (tags are global, not user-specific)
-        self.fields['tags'].queryset = Tag.objects.all()
+        # Prebuilt choices (with an empty choice for the optional selects)
+        for name in ('work_type', 'priority', 'source', 'status'):
+            self.fields[name].choices = choices[name]
         
         # Hide status fields when creating a new job entry
         if not self.instance.pk:
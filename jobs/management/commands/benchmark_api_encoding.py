@@ -0,0 +1,95 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from django.db.models import Count
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from jobs.api.v1.renderers import FastJSONRenderer, orjson
+from jobs.api.v1.serializers import JobEntrySerializer
+from jobs.middleware import CompressionMiddleware, brotli
+from jobs.models import JobEntry
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare JSON encode time and response size (raw, gzip, brotli) for an API job list'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=1000,
+            help='Number of job entries in the list (default: 1000)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Number of timed runs per encoder (default: 20)',
+        )
+        parser.add_argument(
+            '--user',
+            type=str,
+            default='',
+            help='Username whose jobs are encoded (default: the user with the most jobs)',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+        else:
+            user = User.objects.annotate(job_count=Count('job_entries')).order_by('-job_count').first()
+        if user is None:
+            raise CommandError('No such user; run generate_dataset first')
+
+        jobs = list(
+            JobEntry.objects.filter(user=user).select_related('category', 'user')
+            .prefetch_related('tags', 'resume_statuses').order_by('-created_at')[:options['jobs']]
+        )
+        if not jobs:
+            raise CommandError(f'{user.username} has no job entries')
+        # The same shape as a GET /api/v1/jobs/ response, serialized once
+        data = {'count': len(jobs), 'next': None, 'previous': None,
+                'results': JobEntrySerializer(jobs, many=True).data}
+        self.stdout.write(f'Encoding {len(jobs)} job entries of {user.username}, {options["iterations"]} runs each')
+
+        encoders = [('json (stdlib)', JSONRenderer().render)]
+        if orjson is not None:
+            encoders.append(('orjson', FastJSONRenderer().render))
+        else:
+            self.stdout.write(self.style.WARNING('orjson is not installed (pip install orjson)'))
+
+        self.stdout.write('')
+        self.stdout.write(f'{"Step":<16} {"p50 ms":>10} {"mean ms":>10} {"bytes":>12}')
+        body = None
+        for name, render in encoders:
+            body, samples = self._time(lambda: render(data), options['iterations'])
+            self._row(name, samples, len(body))
+
+        # Compression settings of CompressionMiddleware, applied to the last encoder's output
+        compressors = [
+            ('gzip', lambda: compress_string(body, max_random_bytes=CompressionMiddleware.GZIP_MAX_RANDOM_BYTES)),
+        ]
+        if brotli is not None:
+            compressors.append(
+                ('brotli', lambda: brotli.compress(body, quality=CompressionMiddleware.BROTLI_QUALITY))
+            )
+        else:
+            self.stdout.write(self.style.WARNING('brotli is not installed (pip install brotli)'))
+        for name, compress in compressors:
+            compressed, samples = self._time(compress, options['iterations'])
+            self._row(name, samples, len(compressed))
+
+    def _time(self, fn, iterations):
+        """Run fn `iterations` times; return its last result and the timings in milliseconds"""
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            result = fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        return result, samples
+
+    def _row(self, name, samples, size):
+        self.stdout.write(
+            f'{name:<16} {statistics.median(samples):>10.2f} {statistics.mean(samples):>10.2f} {size:>12,}'
+        )
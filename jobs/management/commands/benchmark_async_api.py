@@ -0,0 +1,119 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from django.urls import reverse
+from benchmarks.loadtest import HttpTransport
+from benchmarks.runner import _percentile
+from jobs.caching import bump_user_generation
+import threading
+import time
+
+
+# Endpoint -> (sync URL name, async URL name)
+ENDPOINTS = {
+    'statistics': ('api_v1:statistics', 'api_v1:async-statistics'),
+    'monthly_report': ('api_v1:monthly-report', 'api_v1:async-monthly-report'),
+    'calendar': ('api_v1:calendar', 'api_v1:async-calendar'),
+    'unread_count': ('api_v1:notification-unread-count', 'api_v1:async-unread-count'),
+}
+
+
+class Command(BaseCommand):
+    help = ('Compare the sync API views with their async variants under concurrent load against a running '
+            'server, e.g. uvicorn job_search.asgi:application')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            type=str,
+            default='http://127.0.0.1:8000',
+            help='Base URL of the running server (default: http://127.0.0.1:8000)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=20,
+            help='Number of concurrent clients (default: 20)',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=20,
+            help='Requests per client for each endpoint and variant (default: 20)',
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            choices=sorted(ENDPOINTS),
+            help='Endpoint to compare; repeat for several (default: all)',
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help="Invalidate the user's cached data before every request, so each one computes "
+                 '(needs a cache backend shared with the server, e.g. CACHE_BACKEND=file)',
+        )
+        parser.add_argument(
+            '--prefix',
+            type=str,
+            default='loadtest',
+            help='Username prefix of the generate_dataset users (default: loadtest)',
+        )
+        parser.add_argument(
+            '--password',
+            type=str,
+            default='loadtest',
+            help='Password of the generate_dataset users (default: loadtest)',
+        )
+
+    def handle(self, *args, **options):
+        users = list(User.objects.filter(username__startswith=f'{options["prefix"]}_').order_by('id'))
+        if not users:
+            raise CommandError(f'No users with the prefix "{options["prefix"]}_"; run generate_dataset first')
+        concurrency = options['concurrency']
+        try:
+            clients = [
+                (users[number % len(users)], HttpTransport(users[number % len(users)], options['password'], options['url']))
+                for number in range(concurrency)
+            ]
+        except (OSError, RuntimeError) as e:
+            raise CommandError(f'Cannot log in at {options["url"]}: {e}')
+
+        self.stdout.write(f'{concurrency} clients x {options["requests"]} requests against {options["url"]}'
+                          f'{" (cold cache)" if options["cold"] else ""}')
+        self.stdout.write('')
+        self.stdout.write(f'{"Endpoint":<16} {"Variant":<8} {"Req/s":>8} {"p50 ms":>9} {"p95 ms":>9} '
+                          f'{"max ms":>9} {"Errors":>7}')
+        for endpoint in options['endpoint'] or ENDPOINTS:
+            for variant, url_name in zip(('sync', 'async'), ENDPOINTS[endpoint]):
+                latencies, errors, elapsed = self._run(clients, reverse(url_name), options['requests'],
+                                                       options['cold'])
+                line = (f'{endpoint:<16} {variant:<8} {len(latencies) / elapsed:>8.1f} '
+                        f'{_percentile(latencies, 0.50):>9.1f} {_percentile(latencies, 0.95):>9.1f} '
+                        f'{max(latencies):>9.1f} {errors:>7}')
+                self.stdout.write(self.style.WARNING(line) if errors else line)
+
+    def _run(self, clients, path, requests, cold):
+        """Send `requests` GETs of `path` from every client at once; return latencies (ms), errors, seconds"""
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+
+        def work(user, transport):
+            for _ in range(requests):
+                if cold:
+                    bump_user_generation(user)
+                started = time.perf_counter()
+                status = transport.request('GET', path, None)
+                latency = (time.perf_counter() - started) * 1000
+                with lock:
+                    latencies.append(latency)
+                    if status != 200:
+                        errors[0] += 1
+
+        threads = [threading.Thread(target=work, args=client) for client in clients]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies, errors[0], time.perf_counter() - started
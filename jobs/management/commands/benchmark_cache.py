@@ -0,0 +1,122 @@
+from django.core.management.base import BaseCommand
+from django.core.management.commands.createcachetable import Command as CreateCacheTableCommand
+from django.db import connection, DEFAULT_DB_ALIAS
+from django.utils.module_loading import import_string
+from django.conf import settings
+import statistics
+import tempfile
+import shutil
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare cache hit latency across cache backends (locmem, file, db, configured default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Number of cache reads per backend (default: 2000)',
+        )
+        parser.add_argument(
+            '--keys',
+            type=int,
+            default=100,
+            help='Number of distinct keys to read from (default: 100)',
+        )
+        parser.add_argument(
+            '--backends',
+            type=str,
+            default='locmem,file,db',
+            help='Comma-separated backends to compare: locmem, file, db, default (default: locmem,file,db)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        keys = options['keys']
+        backends = [name.strip() for name in options['backends'].split(',') if name.strip()]
+
+        # Payload similar to a cached statistics dictionary
+        payload = {
+            'total_jobs': 1000,
+            'monthly_stats': [{'month': f'2025-{month:02d}', 'count': month * 7} for month in range(1, 13)],
+            'top_employers': [{'employer': f'Employer {i}', 'count': 50 - i} for i in range(10)],
+            'category_stats': [{'category__name': f'Category {i}', 'count': i} for i in range(15)],
+        }
+
+        self.stdout.write(f'{"Backend":<10} {"set µs":>10} {"hit p50 µs":>12} {"hit p95 µs":>12} '
+                          f'{"hit mean µs":>12} {"incr µs":>10}')
+        for name in backends:
+            try:
+                cache, cleanup = self._create_backend(name)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'{name:<10} unavailable: {e}'))
+                continue
+            try:
+                result = self._benchmark(cache, payload, iterations, keys)
+            finally:
+                cleanup()
+            self.stdout.write(
+                f'{name:<10} {result["set"]:>10.1f} {result["p50"]:>12.1f} {result["p95"]:>12.1f} '
+                f'{result["mean"]:>12.1f} {result["incr"]:>10.1f}'
+            )
+
+    def _create_backend(self, name):
+        """Instantiate a cache backend in isolation; return it with a cleanup callable"""
+        if name == 'default':
+            from django.core.cache import cache
+            return cache, lambda: None
+        if name == 'locmem':
+            backend = import_string(settings.CACHE_BACKEND_ALIASES['locmem'])
+            return backend('benchmark', {'OPTIONS': {'MAX_ENTRIES': 100000}}), lambda: None
+        if name == 'file':
+            directory = tempfile.mkdtemp(prefix='job_search_cache_')
+            backend = import_string(settings.CACHE_BACKEND_ALIASES['file'])
+            return (backend(directory, {'OPTIONS': {'MAX_ENTRIES': 100000}}),
+                    lambda: shutil.rmtree(directory, ignore_errors=True))
+        if name == 'db':
+            table = 'jobs_cache_benchmark'
+            create_command = CreateCacheTableCommand()
+            create_command.verbosity = 0
+            create_command.create_table(DEFAULT_DB_ALIAS, table, dry_run=False)
+            backend = import_string(settings.CACHE_BACKEND_ALIASES['db'])
+
+            def drop_table():
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE {connection.ops.quote_name(table)}')
+            return backend(table, {'OPTIONS': {'MAX_ENTRIES': 100000}}), drop_table
+        raise ValueError(f'unknown backend "{name}"')
+
+    def _benchmark(self, cache, payload, iterations, keys):
+        """Measure set, hit and incr latency in microseconds"""
+        key_names = [f'benchmark_{i}' for i in range(keys)]
+
+        started = time.perf_counter()
+        for key in key_names:
+            cache.set(key, payload, 300)
+        set_us = (time.perf_counter() - started) / keys * 1e6
+
+        samples = []
+        for i in range(iterations):
+            key = key_names[i % keys]
+            started = time.perf_counter()
+            cache.get(key)
+            samples.append((time.perf_counter() - started) * 1e6)
+        samples.sort()
+
+        cache.set('benchmark_counter', 1, 300)
+        incr_iterations = min(iterations, 500)
+        started = time.perf_counter()
+        for _ in range(incr_iterations):
+            cache.incr('benchmark_counter')
+        incr_us = (time.perf_counter() - started) / incr_iterations * 1e6
+
+        cache.delete_many(key_names + ['benchmark_counter'])
+        return {
+            'set': set_us,
+            'p50': samples[len(samples) // 2],
+            'p95': samples[int(len(samples) * 0.95) - 1],
+            'mean': statistics.mean(samples),
+            'incr': incr_us,
+        }
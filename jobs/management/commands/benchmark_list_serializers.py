@@ -0,0 +1,103 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+from jobs.api.v1.serializers import JobEntryListSerializer, JobEntryHistorySerializer, NotificationSerializer
+from jobs.api.v1.values import ValuesSerializer
+from jobs.models import JobEntry, JobEntryHistory, Notification
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = ('Check that the .values() list fast path renders byte-identical JSON to the serializers '
+            'and compare their speed')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Rows per list (default: 1000)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=10,
+            help='Number of timed runs per path (default: 10)',
+        )
+        parser.add_argument(
+            '--user',
+            type=str,
+            default='',
+            help='Username whose data is listed (default: the user with the most jobs)',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+        else:
+            user = User.objects.annotate(job_count=Count('job_entries')).order_by('-job_count').first()
+        if user is None:
+            raise CommandError('No such user; run generate_dataset first')
+        rows = options['rows']
+
+        # name -> (serializer class, serializer context, queryset as the viewset builds it)
+        jobs = JobEntry.objects.filter(user=user).order_by('-created_at')
+        cases = {
+            'jobs': (JobEntryListSerializer, {},
+                     jobs.select_related('category').prefetch_related('tags')),
+            'jobs ?expand=': (JobEntryListSerializer, {'expand': set()},
+                              jobs.prefetch_related('tags')),
+            'jobs ?fields=': (JobEntryListSerializer, {'fields': {'id', 'job_title', 'status', 'created_at'}},
+                              jobs),
+            'history': (JobEntryHistorySerializer, {},
+                        JobEntryHistory.objects.filter(job_entry__user=user).select_related('user')
+                        .order_by('-changed_at')),
+            'notifications': (NotificationSerializer, {},
+                              Notification.objects.filter(user=user).select_related('user').order_by('-created_at')),
+        }
+
+        renderer = JSONRenderer()
+        self.stdout.write(f'{user.username}, up to {rows} rows per list, {options["iterations"]} runs each')
+        self.stdout.write('')
+        self.stdout.write(f'{"List":<16} {"Rows":>6} {"serializer ms":>14} {"values ms":>10} {"speedup":>8} {"parity":>7}')
+        failures = []
+        for name, (serializer_class, context, queryset) in cases.items():
+            values_serializer = ValuesSerializer.from_serializer(serializer_class(context=context))
+            if values_serializer is None:
+                raise CommandError(f'{serializer_class.__name__} is not supported by ValuesSerializer')
+            page = queryset[:rows]
+            values_page = queryset.select_related(None).prefetch_related(None).values(
+                *values_serializer.lookups
+            )[:rows]
+
+            def serialize():
+                return renderer.render(serializer_class(list(page.all()), many=True, context=context).data)
+
+            def serialize_values():
+                return renderer.render(values_serializer.to_representation(values_page.all()))
+
+            expected, serializer_samples = self._time(serialize, options['iterations'])
+            actual, values_samples = self._time(serialize_values, options['iterations'])
+            identical = expected == actual
+            if not identical:
+                failures.append(name)
+            serializer_ms = statistics.median(serializer_samples)
+            values_ms = statistics.median(values_samples)
+            line = (f'{name:<16} {len(page):>6} {serializer_ms:>14.2f} {values_ms:>10.2f} '
+                    f'{serializer_ms / values_ms:>7.1f}x {"ok" if identical else "DIFF":>7}')
+            self.stdout.write(line if identical else self.style.ERROR(line))
+
+        if failures:
+            raise CommandError(f'Output differs from the serializers for: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('All lists are byte-identical'))
+
+    def _time(self, fn, iterations):
+        """Run fn `iterations` times (queries included); return its last result and timings in milliseconds"""
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            result = fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        return result, samples
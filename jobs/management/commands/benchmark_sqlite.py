@@ -0,0 +1,186 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare SQLite writer/reader throughput with default settings and the tuned settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=5.0,
+            help='Seconds to run each scenario (default: 5)',
+        )
+        parser.add_argument(
+            '--writers',
+            type=int,
+            default=4,
+            help='Number of concurrent writer threads (default: 4)',
+        )
+        parser.add_argument(
+            '--readers',
+            type=int,
+            default=8,
+            help='Number of concurrent reader threads (default: 8)',
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=10000,
+            help='Number of job rows to seed (default: 10000)',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = [
+            # Before: default journal, new connection per operation, deferred transactions
+            ('default', {
+                'pragmas': {},
+                'timeout': 5,
+                'persistent': False,
+                'begin': 'BEGIN',
+            }),
+            # After: the pragmas, busy timeout and persistent connections from settings
+            ('tuned', {
+                'pragmas': settings.SQLITE_PRAGMAS,
+                'timeout': settings.DATABASES['default']['OPTIONS'].get('timeout', 5),
+                'persistent': True,
+                'begin': 'BEGIN IMMEDIATE',
+            }),
+        ]
+
+        self.stdout.write(
+            f'{"Scenario":<10} {"writes/s":>10} {"reads/s":>10} {"write p95 ms":>13} '
+            f'{"read p95 ms":>12} {"lock errors":>12}'
+        )
+        for name, scenario in scenarios:
+            fd, path = tempfile.mkstemp(prefix='job_search_bench_', suffix='.sqlite3')
+            os.close(fd)
+            try:
+                self._seed(path, options['rows'], scenario)
+                result = self._run(path, scenario, options)
+            finally:
+                for suffix in ('', '-wal', '-shm', '-journal'):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+            self.stdout.write(
+                f'{name:<10} {result["writes_per_second"]:>10.1f} {result["reads_per_second"]:>10.1f} '
+                f'{result["write_p95_ms"]:>13.2f} {result["read_p95_ms"]:>12.2f} {result["errors"]:>12}'
+            )
+
+    def _connect(self, path, scenario):
+        """Open a connection configured like the scenario"""
+        conn = sqlite3.connect(path, timeout=scenario['timeout'], isolation_level=None,
+                               check_same_thread=False)
+        for name, value in scenario['pragmas'].items():
+            conn.execute(f'PRAGMA {name}={value}')
+        return conn
+
+    def _seed(self, path, rows, scenario):
+        """Create a table shaped like jobs_jobentry plus a history table"""
+        conn = self._connect(path, scenario)
+        conn.execute(
+            'CREATE TABLE job (id INTEGER PRIMARY KEY, user_id INTEGER, status TEXT, '
+            'priority TEXT, notes TEXT, updated_at REAL)'
+        )
+        conn.execute('CREATE INDEX job_user_status ON job (user_id, status)')
+        conn.execute(
+            'CREATE TABLE history (id INTEGER PRIMARY KEY, job_id INTEGER, field_name TEXT, '
+            'old_value TEXT, new_value TEXT, changed_at REAL)'
+        )
+        statuses = ['not_applied', 'applied', 'confirmed', 'rejected', 'accepted']
+        conn.execute('BEGIN')
+        conn.executemany(
+            'INSERT INTO job (user_id, status, priority, notes, updated_at) VALUES (?, ?, ?, ?, ?)',
+            [(i % 50, statuses[i % len(statuses)], 'medium', 'x' * 200, time.time()) for i in range(rows)]
+        )
+        conn.execute('COMMIT')
+        conn.close()
+
+    def _run(self, path, scenario, options):
+        """Run writers and readers concurrently for the given duration"""
+        deadline = time.monotonic() + options['duration']
+        rows = options['rows']
+        lock = threading.Lock()
+        results = {'writes': [], 'reads': [], 'errors': 0}
+
+        def write_once(conn, rng):
+            # Mimics edit_job: read the row, update it and record history in one transaction
+            job_id = rng.randint(1, rows)
+            conn.execute(scenario['begin'])
+            try:
+                status = conn.execute('SELECT status FROM job WHERE id = ?', (job_id,)).fetchone()[0]
+                conn.execute('UPDATE job SET status = ?, updated_at = ? WHERE id = ?',
+                             ('applied', time.time(), job_id))
+                conn.execute(
+                    'INSERT INTO history (job_id, field_name, old_value, new_value, changed_at) '
+                    'VALUES (?, ?, ?, ?, ?)', (job_id, 'status', status, 'applied', time.time())
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        def read_once(conn, rng):
+            # Mimics the statistics page: grouped counts for one user
+            conn.execute(
+                'SELECT status, COUNT(*) FROM job WHERE user_id = ? GROUP BY status', (rng.randint(0, 49),)
+            ).fetchall()
+
+        def worker(operation, kind, seed):
+            rng = random.Random(seed)
+            conn = self._connect(path, scenario) if scenario['persistent'] else None
+            timings = []
+            errors = 0
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                current = conn or self._connect(path, scenario)
+                try:
+                    operation(current, rng)
+                    timings.append((time.perf_counter() - started) * 1000)
+                except sqlite3.OperationalError:
+                    errors += 1
+                finally:
+                    if conn is None:
+                        current.close()
+            if conn is not None:
+                conn.close()
+            with lock:
+                results[kind].extend(timings)
+                results['errors'] += errors
+
+        threads = [
+            threading.Thread(target=worker, args=(write_once, 'writes', i))
+            for i in range(options['writers'])
+        ] + [
+            threading.Thread(target=worker, args=(read_once, 'reads', 1000 + i))
+            for i in range(options['readers'])
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        return {
+            'writes_per_second': len(results['writes']) / elapsed,
+            'reads_per_second': len(results['reads']) / elapsed,
+            'write_p95_ms': self._percentile(results['writes'], 0.95),
+            'read_p95_ms': self._percentile(results['reads'], 0.95),
+            'errors': results['errors'],
+        }
+
+    @staticmethod
+    def _percentile(samples, fraction):
+        """Percentile of a list of samples (0 if empty)"""
+        if not samples:
+            return 0.0
+        samples = sorted(samples)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from jobs.dataset_generator import DatasetGenerator
+import time
+
+
+class Command(BaseCommand):
+    help = 'Generate a large synthetic dataset with bulk_create (signals bypassed) for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100,
+            help='Number of users to create (default: 100)',
+        )
+        parser.add_argument(
+            '--jobs-per-user',
+            type=int,
+            default=1000,
+            help='Job entries per user (default: 1000)',
+        )
+        parser.add_argument(
+            '--prefix',
+            type=str,
+            default='loadtest',
+            help='Username prefix; users are named <prefix>_<n> (default: loadtest)',
+        )
+        parser.add_argument(
+            '--password',
+            type=str,
+            default='loadtest',
+            help='Password of all generated users (default: loadtest)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed; the same arguments always produce the same rows (default: 0)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Job entries per bulk_create batch and transaction (default: 2000)',
+        )
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        usernames = [f'{prefix}_{number}' for number in range(1, options['users'] + 1)]
+        if User.objects.filter(username__startswith=f'{prefix}_').exists():
+            raise CommandError(
+                f'Users with the prefix "{prefix}_" already exist. Use another --prefix or a fresh database.'
+            )
+
+        started = time.perf_counter()
+        generator = DatasetGenerator(seed=options['seed'], batch_size=options['batch_size'])
+        users = generator.create_users(usernames, options['password'])
+        self.stdout.write(f'Created {len(users)} users in {time.perf_counter() - started:.1f}s')
+
+        report_every = max(1, len(users) // 20)
+        for number, user in enumerate(users, start=1):
+            generator.generate_jobs(user, options['jobs_per_user'])
+            if number % report_every == 0 or number == len(users):
+                elapsed = time.perf_counter() - started
+                total = sum(generator.counts.values())
+                self.stdout.write(
+                    f'{number}/{len(users)} users, {total:,} rows, {total / elapsed:,.0f} rows/s'
+                )
+
+        elapsed = time.perf_counter() - started
+        total = sum(generator.counts.values())
+        self.stdout.write('')
+        self.stdout.write(f'{"Table":<32} {"Rows":>12}')
+        for table, rows in sorted(generator.counts.items()):
+            self.stdout.write(f'{table:<32} {rows:>12,}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s). '
+            f'Log in as {usernames[0]} / {options["password"]}.'
+        ))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from jobs.caching import bump_user_generation
+from jobs.events import rebuild_job_events
+from jobs.models import JobEntry
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the JobEvent rows (calendar, reminders, upcoming counts) from the job entry dates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            default='',
+            help='Only rebuild the events of this username (default: all users)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Job entries per transaction (default: 2000)',
+        )
+
+    def handle(self, *args, **options):
+        job_entries = JobEntry.objects.all()
+        if options['user']:
+            job_entries = job_entries.filter(user__username=options['user'])
+
+        written = rebuild_job_events(job_entries, batch_size=options['batch_size'])
+
+        # Cached calendars and statistics were built from the old rows
+        for user_id in job_entries.order_by().values_list('user_id', flat=True).distinct():
+            bump_user_generation(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} job events'))
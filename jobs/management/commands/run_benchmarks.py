@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import json
+
+
+class Command(BaseCommand):
+    help = 'Run the benchmark suite (hot views, PDFs and APIs) on seeded datasets and report JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=str,
+            default='1000,10000',
+            help='Comma-separated dataset sizes in job entries per user, e.g. 1000,10000,100000 '
+                 '(default: 1000,10000)',
+        )
+        parser.add_argument(
+            '--cases',
+            type=str,
+            default='',
+            help='Comma-separated case names to run (default: all)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5,
+            help='Warm runs per case after the cold run (default: 5)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Dataset seed (default: 0)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default='',
+            help='Write the JSON report to this file instead of stdout',
+        )
+        parser.add_argument(
+            '--compare',
+            type=str,
+            default='',
+            help='Baseline JSON report to compare against (e.g. from the previous commit)',
+        )
+        parser.add_argument(
+            '--allow-live-db',
+            action='store_true',
+            help='Run with DEBUG off. The suite creates and rewrites bench_* users in the default '
+                 'database and invalidates their cached data',
+        )
+
+    def handle(self, *args, **options):
+        from benchmarks.cases import CASES
+        from benchmarks.runner import run_suite, compare
+
+        if not settings.DEBUG and not options['allow_live_db']:
+            raise CommandError('DEBUG is off, so this may be a production database. The benchmarks write '
+                               'bench_* users to it; pass --allow-live-db to run anyway')
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers')
+        case_names = [name.strip() for name in options['cases'].split(',') if name.strip()]
+        unknown = set(case_names) - set(CASES)
+        if unknown:
+            raise CommandError(f'Unknown cases: {", ".join(sorted(unknown))}. Available: {", ".join(CASES)}')
+
+        # Progress goes to stderr so stdout stays valid JSON
+        report = run_suite(
+            sizes, case_names, options['iterations'], options['seed'],
+            progress=lambda message: self.stderr.write(message)
+        )
+
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(payload + '\n')
+            self.stderr.write(self.style.SUCCESS(f'Report written to {options["output"]}'))
+        else:
+            self.stdout.write(payload)
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+            self.stderr.write(f'{"Dataset":>8} {"Case":<20} {"base p50":>10} {"p50":>10} {"change":>8} '
+                              f'{"queries":>11}')
+            for dataset, case, old_p50, p50, change, old_queries, queries in compare(report, baseline):
+                line = (f'{dataset:>8} {case:<20} {old_p50:>10.2f} {p50:>10.2f} {change:>+7.1f}% '
+                        f'{old_queries:>5} -> {queries:<4}')
+                # Flag slowdowns over 10% and any new queries
+                if change > 10 or queries > old_queries:
+                    self.stderr.write(self.style.WARNING(line))
+                else:
+                    self.stderr.write(line)
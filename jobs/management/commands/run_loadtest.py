@@ -0,0 +1,117 @@
+from django.core.management.base import BaseCommand, CommandError
+import json
+import logging
+
+
+class Command(BaseCommand):
+    help = 'Replay weighted user sessions with concurrent virtual users and report throughput, latency and errors'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=10,
+            help='Number of concurrent virtual users (default: 10)',
+        )
+        parser.add_argument(
+            '--duration',
+            type=int,
+            default=30,
+            help='Test duration in seconds (default: 30)',
+        )
+        parser.add_argument(
+            '--sessions',
+            type=int,
+            default=0,
+            help='Stop each virtual user after this many sessions (default: 0, run for --duration)',
+        )
+        parser.add_argument(
+            '--think-time',
+            type=float,
+            default=0.0,
+            help='Mean pause between steps in seconds (default: 0)',
+        )
+        parser.add_argument(
+            '--url',
+            type=str,
+            default='',
+            help='Base URL of a running server, e.g. http://127.0.0.1:8000 '
+                 '(default: in-process through the test client)',
+        )
+        parser.add_argument(
+            '--prefix',
+            type=str,
+            default='loadtest',
+            help='Username prefix of the generate_dataset users (default: loadtest)',
+        )
+        parser.add_argument(
+            '--password',
+            type=str,
+            default='loadtest',
+            help='Password of the generate_dataset users, used with --url (default: loadtest)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for session and job choices (default: 0)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default='',
+            help='Also write the JSON report to this file',
+        )
+
+    def handle(self, *args, **options):
+        from benchmarks.loadtest import load_virtual_users, run_load_test
+
+        try:
+            virtual_users = load_virtual_users(options['prefix'], options['users'], seed=options['seed'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        mode = options['url'] or 'in-process'
+        self.stdout.write(f'{len(virtual_users)} virtual users against {mode} for {options["duration"]}s...')
+
+        # Budget warnings from every request would drown the report
+        budget_logger = logging.getLogger('jobs.query_budget')
+        previous_level = budget_logger.level
+        budget_logger.setLevel(logging.ERROR)
+        try:
+            result = run_load_test(
+                virtual_users,
+                duration=options['duration'],
+                max_sessions=options['sessions'],
+                think_time=options['think_time'],
+                base_url=options['url'],
+                password=options['password'],
+            )
+        finally:
+            budget_logger.setLevel(previous_level)
+        summary = result.summary()
+
+        self.stdout.write('')
+        self.stdout.write(f'{"Step":<20} {"Requests":>9} {"Req/s":>8} {"p50 ms":>9} {"p95 ms":>9} '
+                          f'{"p99 ms":>9} {"max ms":>9} {"Errors":>8}')
+        rows = list(summary['steps'].items()) + [('TOTAL', summary['total'])]
+        for step, stats in rows:
+            line = (f'{step:<20} {stats["requests"]:>9} {stats["throughput_rps"]:>8.1f} {stats["p50_ms"]:>9.1f} '
+                    f'{stats["p95_ms"]:>9.1f} {stats["p99_ms"]:>9.1f} {stats["max_ms"]:>9.1f} '
+                    f'{stats["error_rate"]:>7.1%}')
+            self.stdout.write(self.style.WARNING(line) if stats['errors'] else line)
+        self.stdout.write('')
+        self.stdout.write('Sessions: ' + ', '.join(f'{name} {count}' for name, count in sorted(summary['sessions'].items())))
+        for sample in summary['error_samples']:
+            self.stdout.write(self.style.ERROR(f'  {sample}'))
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(json.dumps({'mode': mode, 'users': len(virtual_users), **summary}, indent=2) + '\n')
+            self.stdout.write(f'Report written to {options["output"]}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{summary["total"]["requests"]} requests in {summary["elapsed_s"]}s: '
+            f'{summary["total"]["throughput_rps"]} req/s, p95 {summary["total"]["p95_ms"]} ms, '
+            f'error rate {summary["total"]["error_rate"]:.2%}'
+        ))
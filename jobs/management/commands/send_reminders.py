@@ -4,7 +4,9 @@ from django.utils import timezone
 from django.utils.translation import activate, gettext as _
 from django.conf import settings
 from datetime import timedelta
-from jobs.models import JobEntry, UserProfile
+from django.db.models import Q
+from jobs.models import JobEvent, UserProfile
+from jobs.metrics import reminder_emails
 
 
 class Command(BaseCommand):
@@ -22,6 +24,7 @@ class Command(BaseCommand):
         days_before = options['days']
         now = timezone.now()
         reminder_date = now + timedelta(days=days_before)
+        today_start = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Get all users with email notifications enabled
         users_with_notifications = UserProfile.objects.filter(
@@ -39,49 +42,49 @@ class Command(BaseCommand):
             # For now, use default language
             activate(settings.LANGUAGE_CODE)
             
-            user_jobs = JobEntry.objects.filter(user=user)
+            # One range scan of the user's events; deadlines are stored at midnight,
+            # so the scan starts at the beginning of today to include today's deadlines
+            events = JobEvent.objects.filter(
+                user=user,
+                at__gte=today_start,
+                at__lte=reminder_date
+            ).filter(
+                Q(at__gte=now) | Q(kind='deadline')
+            ).select_related('job_entry').order_by('at')
             
-            # Get upcoming interviews
-            interviews = user_jobs.filter(
-                interview_date__gte=now,
-                interview_date__lte=reminder_date
-            ).exclude(interview_date__isnull=True)
+            events_by_kind = {'interview': [], 'follow_up': [], 'deadline': []}
+            for event in events:
+                events_by_kind[event.kind].append(event)
+            interviews = events_by_kind['interview']
+            follow_ups = events_by_kind['follow_up']
+            deadlines = events_by_kind['deadline']
             
-            # Get upcoming follow-ups
-            follow_ups = user_jobs.filter(
-                follow_up_date__gte=now,
-                follow_up_date__lte=reminder_date
-            ).exclude(follow_up_date__isnull=True)
-            
-            # Get upcoming deadlines
-            deadlines = user_jobs.filter(
-                application_deadline__gte=now.date(),
-                application_deadline__lte=reminder_date.date()
-            ).exclude(application_deadline__isnull=True)
-            
-            if interviews.exists() or follow_ups.exists() or deadlines.exists():
+            if interviews or follow_ups or deadlines:
                 subject = _('Job Search Reminders')
                 message_parts = []
                 
-                if interviews.exists():
+                if interviews:
                     message_parts.append(_('Upcoming Interviews:'))
-                    for job in interviews:
+                    for event in interviews:
+                        job = event.job_entry
                         message_parts.append(
                             f"- {job.job_title} at {job.employer} on {job.interview_date.strftime('%d.%m.%Y %H:%M')}"
                         )
                     message_parts.append('')
                 
-                if follow_ups.exists():
+                if follow_ups:
                     message_parts.append(_('Follow-ups:'))
-                    for job in follow_ups:
+                    for event in follow_ups:
+                        job = event.job_entry
                         message_parts.append(
                             f"- {job.job_title} at {job.employer} on {job.follow_up_date.strftime('%d.%m.%Y %H:%M')}"
                         )
                     message_parts.append('')
                 
-                if deadlines.exists():
+                if deadlines:
                     message_parts.append(_('Application Deadlines:'))
-                    for job in deadlines:
+                    for event in deadlines:
+                        job = event.job_entry
                         message_parts.append(
                             f"- {job.job_title} at {job.employer} on {job.application_deadline.strftime('%d.%m.%Y')}"
                         )
@@ -99,10 +102,12 @@ class Command(BaseCommand):
                         fail_silently=False,
                     )
                     emails_sent += 1
+                    reminder_emails.inc(result='sent')
                     self.stdout.write(
                         self.style.SUCCESS(f'Sent reminder email to {user.email}')
                     )
                 except Exception as e:
+                    reminder_emails.inc(result='failed')
                     self.stdout.write(
                         self.style.ERROR(f'Failed to send email to {user.email}: {str(e)}')
                     )
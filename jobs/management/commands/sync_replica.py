@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+from jobs.db_routing import get_read_alias, replica_enabled, sync_sqlite_replica
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database into the local read replica (DATABASE_READ_URL)'
+
+    def handle(self, *args, **options):
+        if not replica_enabled():
+            raise CommandError('No read replica configured. Set DATABASE_READ_URL first.')
+
+        try:
+            sync_sqlite_replica()
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f'Replica "{get_read_alias()}" is in sync with "default".'))
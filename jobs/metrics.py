@@ -0,0 +1,290 @@
+"""
+Prometheus-style application metrics without external dependencies.
+
+Counters and histograms live in memory in each process. With
+settings.METRICS_MULTIPROC_DIR set (e.g. for several gunicorn workers), every
+process periodically writes its values to metrics_<pid>.json in that shared
+directory, and the /metrics view sums the files of all processes - the same
+idea as prometheus_client's multiprocess mode. Counters of finished processes
+stay in the directory, so totals never go backwards; clear the directory when
+the application is (re)deployed.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+PREFIX = 'job_search_'
+
+# Request latency buckets in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+class MetricsRegistry:
+    """Process-local metric values, optionally shared through a multiprocess directory"""
+
+    def __init__(self):
+        self.metrics = []
+        self._values = {}  # (sample name, ((label, value), ...)) -> float
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._baseline_loaded = False
+        self._last_flush = 0.0
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def _check_fork(self):
+        # Values copied into a forked worker belong to the parent, which reports them itself
+        if os.getpid() != self._pid:
+            self._values = {}
+            self._pid = os.getpid()
+            self._baseline_loaded = False
+
+    def add(self, samples):
+        """Add (sample name, labels, amount) triples atomically"""
+        with self._lock:
+            self._check_fork()
+            for name, labels, amount in samples:
+                key = (name, labels)
+                self._values[key] = self._values.get(key, 0.0) + amount
+
+    def values(self):
+        with self._lock:
+            self._check_fork()
+            return dict(self._values)
+
+    # Multiprocess support
+
+    @staticmethod
+    def multiproc_dir():
+        return getattr(settings, 'METRICS_MULTIPROC_DIR', '')
+
+    def _process_file(self):
+        return os.path.join(self.multiproc_dir(), f'metrics_{os.getpid()}.json')
+
+    @staticmethod
+    def _read_file(path):
+        try:
+            with open(path) as f:
+                return {(name, tuple(tuple(label) for label in labels)): value
+                        for name, labels, value in json.load(f)}
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self):
+        """Write this process's values to the multiprocess directory (no-op without one)"""
+        directory = self.multiproc_dir()
+        if not directory:
+            return
+        with self._lock:
+            self._check_fork()
+            if not self._baseline_loaded:
+                # A previous process with the same pid left its totals behind - keep counting from them
+                for key, value in self._read_file(self._process_file()).items():
+                    self._values[key] = self._values.get(key, 0.0) + value
+                self._baseline_loaded = True
+            data = [[name, labels, value] for (name, labels), value in self._values.items()]
+            self._last_flush = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix='.metrics_', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(temporary, self._process_file())
+
+    def maybe_flush(self):
+        """Flush at most once per METRICS_FLUSH_INTERVAL seconds"""
+        if self.multiproc_dir() and \
+                time.monotonic() - self._last_flush >= getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0):
+            self.flush()
+
+    def collect(self):
+        """Values summed over all processes (or this process only without a multiprocess directory)"""
+        directory = self.multiproc_dir()
+        if not directory:
+            return self.values()
+        self.flush()
+        totals = {}
+        for filename in os.listdir(directory):
+            if filename.startswith('metrics_') and filename.endswith('.json'):
+                for key, value in self._read_file(os.path.join(directory, filename)).items():
+                    totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def render(self, extra_families=()):
+        """
+        Render all metrics in the Prometheus text exposition format (version 0.0.4).
+
+        Args:
+            extra_families: (name, type, help, [(labels, value), ...]) tuples computed
+                at scrape time (e.g. gauges)
+        """
+        values = self.collect()
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            samples = sorted(
+                (key for key in values if key[0] in metric.sample_names),
+                key=metric.sort_key
+            )
+            for name, labels in samples:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(values[(name, labels)])}')
+        for name, metric_type, documentation, samples in extra_families:
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for labels, value in samples:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+atexit.register(registry.flush)
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=(), registry=registry):
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.sample_names = {self.name}
+        self.registry = registry
+        registry.register(self)
+
+    def _labels(self, labels):
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        self.registry.add([(self.name, self._labels(labels), amount)])
+
+    def sort_key(self, key):
+        return key[1]
+
+
+class Histogram(Counter):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=registry):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self.sample_names = {f'{self.name}_bucket', f'{self.name}_sum', f'{self.name}_count'}
+
+    def observe(self, value, **labels):
+        labels = self._labels(labels)
+        # Buckets are stored cumulatively, as exposed; every bucket is touched so none is missing
+        samples = [
+            (f'{self.name}_bucket', labels + (('le', _format_value(bound)),), 1 if value <= bound else 0)
+            for bound in self.buckets
+        ]
+        samples.append((f'{self.name}_sum', labels, value))
+        samples.append((f'{self.name}_count', labels, 1))
+        self.registry.add(samples)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def sort_key(self, key):
+        name, labels = key
+        series = tuple(label for label in labels if label[0] != 'le')
+        le = dict(labels).get('le')
+        bound = float('inf') if le in (None, '+Inf') else float(le)
+        return series, name.endswith('_count') + name.endswith('_sum') * 2, bound
+
+
+http_requests = Counter(
+    'http_requests_total', 'HTTP requests by URL name, method and status code.',
+    ('view', 'method', 'status')
+)
+http_request_duration = Histogram(
+    'http_request_duration_seconds', 'HTTP request latency by URL name.', ('view',)
+)
+db_queries = Counter('db_queries_total', 'Database queries by URL name.', ('view',))
+db_query_duration = Counter(
+    'db_query_duration_seconds_total', 'Time spent in database queries by URL name.', ('view',)
+)
+cache_requests = Counter(
+    'cache_requests_total',
+    'Cache lookups by layer and result (l1/l2 of the two-tier cache, computed for stampede-protected values).',
+    ('layer', 'result')
+)
+pdf_render_duration = Histogram(
+    'pdf_render_duration_seconds', 'ReportLab document build time by document type.', ('document',)
+)
+reminder_emails = Counter('reminder_emails_total', 'Reminder emails by result (sent, failed).', ('result',))
+notifications_created = Counter('notifications_created_total', 'Notifications created by type.', ('type',))
+
+
+def record_request(view_name, method, status, duration, query_count, db_duration):
+    """Record one HTTP request"""
+    http_requests.inc(view=view_name, method=method, status=status)
+    http_request_duration.observe(duration, view=view_name)
+    if query_count:
+        db_queries.inc(query_count, view=view_name)
+        db_query_duration.inc(db_duration, view=view_name)
+    registry.maybe_flush()
+
+
+def estimate_table_rows():
+    """Row count estimates per table, without scanning them"""
+    from django.apps import apps
+    from django.db import connection
+
+    tables = sorted({
+        model._meta.db_table
+        for app_label in ('jobs', 'auth')
+        for model in apps.get_app_config(app_label).get_models()
+    })
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Planner statistics maintained by (auto)vacuum/analyze
+            cursor.execute(
+                'SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class '
+                'WHERE relkind = %s AND relname = ANY(%s)', ['r', tables]
+            )
+            return dict(cursor.fetchall())
+        estimates = {}
+        for table in tables:
+            # Highest rowid: an index lookup, exact unless rows were deleted
+            cursor.execute(f'SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}')
+            estimates[table] = cursor.fetchone()[0] or 0
+        return estimates
+
+
+def render_metrics():
+    """The /metrics payload"""
+    row_estimates = estimate_table_rows()
+    return registry.render(extra_families=[
+        (PREFIX + 'table_rows', 'gauge', 'Estimated number of rows per database table.',
+         [((('table', table),), rows) for table, rows in sorted(row_estimates.items())]),
+    ])
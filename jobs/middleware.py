@@ -0,0 +1,228 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import SimpleLazyObject, empty
+from django.utils.text import compress_sequence, compress_string
+
+from .query_budget import QueryBudgetExceeded, QueryRecorder, get_view_budget
+from .timing import server_timing_header, timing_scope, timing_stats
+from .metrics import record_request
+
+
+logger = logging.getLogger('jobs.query_budget')
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: pip install brotli
+    brotli = None
+
+
+class AsyncCapableMiddleware:
+    """
+    Base class of middleware that runs natively under both WSGI and ASGI.
+
+    Django calls it with a coroutine function `get_response` in an async
+    stack; __call__ then returns __acall__()'s coroutine, so async views are
+    not switched to a thread and back for every middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        """Process a request in a sync stack"""
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        """Process a request in an async stack"""
+        raise NotImplementedError
+
+
+class QueryBudgetMiddleware(AsyncCapableMiddleware):
+    """
+    Count the queries of each request and flag budget overruns and N+1 patterns.
+
+    Meant for development and tests (settings.QUERY_BUDGET_ENABLED). Problems
+    are logged, or raised as QueryBudgetExceeded when QUERY_BUDGET_RAISE is set.
+    """
+
+    def handle(self, request):
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        return self.check_budget(request, response, recorder)
+
+    async def __acall__(self, request):
+        with QueryRecorder() as recorder:
+            response = await self.get_response(request)
+        return self.check_budget(request, response, recorder)
+
+    def check_budget(self, request, response, recorder):
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return response
+
+        budget = get_view_budget(resolver_match.func)
+        problems = recorder.violations(**budget)
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(recorder.count)
+        if problems:
+            message = f'Query budget exceeded for {request.method} {request.path} ({resolver_match.view_name}): ' + \
+                '; '.join(problems)
+            if getattr(settings, 'QUERY_BUDGET_RAISE', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+class ServerTimingMiddleware(AsyncCapableMiddleware):
+    """
+    Measure where request time goes (db, cache, template, pdf; see jobs.timing).
+
+    Every request is recorded in the per-view histograms of timing_stats and in
+    the Prometheus request metrics (jobs.metrics). The
+    Server-Timing header is added in DEBUG and for staff users only, since it
+    reveals internals.
+    """
+
+    def handle(self, request):
+        started = time.perf_counter()
+        with timing_scope() as timings, QueryRecorder() as recorder:
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+        self.record(request, response, total, timings, recorder)
+
+        user = getattr(request, 'user', None)
+        if settings.DEBUG or (user is not None and user.is_staff):
+            response['Server-Timing'] = server_timing_header(total, timings, recorder.count)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        with timing_scope() as timings, QueryRecorder() as recorder:
+            response = await self.get_response(request)
+        total = time.perf_counter() - started
+        self.record(request, response, total, timings, recorder)
+
+        user = None if settings.DEBUG else await _aget_user(request)
+        if settings.DEBUG or (user is not None and user.is_staff):
+            response['Server-Timing'] = server_timing_header(total, timings, recorder.count)
+        return response
+
+    def record(self, request, response, total, timings, recorder):
+        """Add the request to the timing histograms and request metrics"""
+        timings['db'] = recorder.duration
+        resolver_match = getattr(request, 'resolver_match', None)
+        view_name = resolver_match.view_name if resolver_match else 'unresolved'
+        timing_stats.record(view_name, total, timings)
+        record_request(view_name, request.method, response.status_code, total, recorder.count, recorder.duration)
+
+
+async def _aget_user(request):
+    """request.user, loaded without blocking the event loop if nothing has loaded it yet"""
+    user = getattr(request, 'user', None)
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return await request.auser()
+    return user
+
+
+def _accepted_encodings(header):
+    """Content codings of an Accept-Encoding header that are not refused with q=0"""
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+class CompressionMiddleware(AsyncCapableMiddleware):
+    """
+    Compress responses with brotli or gzip, whichever the client accepts.
+
+    Responses shorter than settings.COMPRESSION_MIN_SIZE and already compressed
+    content (PDFs, images, archives) are sent as they are. brotli is preferred
+    when installed, for responses other than HTML: HTML pages embed CSRF tokens,
+    and gzip gets Django's random-length padding against BREACH while brotli
+    has no equivalent. Streaming responses are gzipped chunk by chunk.
+    """
+
+    BROTLI_QUALITY = 5  # Much faster than the default 11, still smaller than gzip
+    GZIP_MAX_RANDOM_BYTES = 100
+    INCOMPRESSIBLE_TYPES = ('image/', 'video/', 'audio/', 'application/pdf', 'application/zip', 'application/gzip')
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+
+    def handle(self, request):
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        """The response encoded with the best coding the client accepts, if worth it"""
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+        content_type = response.get('Content-Type', '')
+        if content_type.startswith(self.INCOMPRESSIBLE_TYPES):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        use_brotli = (brotli is not None and 'br' in accepted and not response.streaming
+                      and not content_type.startswith('text/html'))
+        if use_brotli:
+            compressed = brotli.compress(response.content, quality=self.BROTLI_QUALITY)
+            encoding = 'br'
+        elif 'gzip' in accepted:
+            encoding = 'gzip'
+            if response.streaming:
+                if response.is_async:
+                    # Async streaming responses are rare here; leave them uncompressed
+                    return response
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, max_random_bytes=self.GZIP_MAX_RANDOM_BYTES
+                )
+                del response.headers['Content-Length']
+            else:
+                compressed = compress_string(response.content, max_random_bytes=self.GZIP_MAX_RANDOM_BYTES)
+        else:
+            return response
+
+        if not response.streaming:
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # A compressed representation needs a different strong ETag; weaken it instead (RFC 9110, 8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
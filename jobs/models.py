@@ -3,7 +3,7 @@ from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from .choices import (STATUS_CHOICES, PRIORITY_CHOICES, WORK_TYPE_CHOICES, SOURCE_CHOICES,
-                      RESUME_SUBMISSION_STATUS_CHOICES)
+                      RESUME_SUBMISSION_STATUS_CHOICES, JOB_EVENT_KIND_CHOICES)
 
 # Create your models here.
 class Category(models.Model):
@@ -197,6 +197,34 @@ class JobEntryHistory(models.Model):
         return f"{self.job_entry} - {self.field_name} - {self.changed_at}"
 
 
+class JobEvent(models.Model):
+    """
+    Dated event of a job entry: its interview, follow-up or application deadline.
+    
+    Denormalized from the JobEntry date fields and kept in sync by jobs.events, so
+    range queries over all three kinds are a single scan of the (user, at) index.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_events')
+    job_entry = models.ForeignKey(JobEntry, on_delete=models.CASCADE, related_name='events')
+    kind = models.CharField(max_length=20, choices=JOB_EVENT_KIND_CHOICES, verbose_name=_('Kind'))
+    # Deadlines are stored at the start of their day
+    at = models.DateTimeField(verbose_name=_('Date'))
+    
+    class Meta:
+        verbose_name = _('Job Event')
+        verbose_name_plural = _('Job Events')
+        ordering = ['at']
+        indexes = [
+            models.Index(fields=['user', 'at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['job_entry', 'kind'], name='unique_job_event_kind'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()} - {self.job_entry_id} - {self.at}"
+
+
 class Attachment(models.Model):
     """File attachments for job entries"""
     job_entry = models.ForeignKey(JobEntry, on_delete=models.CASCADE, related_name='attachments')
@@ -253,6 +281,9 @@ class UserProfile(models.Model):
     theme = models.CharField(max_length=10, choices=THEME_CHOICES, default='light', verbose_name=_('Theme'))
     email_notifications_enabled = models.BooleanField(default=True, verbose_name=_('Email Notifications Enabled'))
     reminder_days_before = models.IntegerField(default=1, verbose_name=_('Reminder Days Before'))
+    # Secret of the ICS feed URL; created on first use (see jobs.calendar_feed)
+    calendar_token = models.CharField(max_length=64, unique=True, null=True, blank=True,
+                                      verbose_name=_('Calendar Feed Token'))
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -269,3 +300,37 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.get_full_name()} - {self.theme}"
 
+
+
+class CacheGeneration(models.Model):
+    """
+    Generation counter of a cache namespace (see jobs.caching).
+    
+    Only used with cache backends whose incr() is a read followed by a write
+    (file, db), where two concurrent bumps could store the same value.
+    """
+    namespace = models.CharField(max_length=255, primary_key=True)
+    value = models.BigIntegerField()
+    
+    def __str__(self):
+        return f"{self.namespace} - {self.value}"
+
+
+class CacheLock(models.Model):
+    """Recompute lock of jobs.caching.cached_compute() for cache backends without an atomic add() (file, db)"""
+    key = models.CharField(max_length=255, primary_key=True)
+    token = models.CharField(max_length=32)
+    expires_at = models.DateTimeField()
+    
+    def __str__(self):
+        return self.key
+
+
+class ThrottleCounter(models.Model):
+    """Request counter of a jobs.throttling window for cache backends without an atomic incr() (file, db)"""
+    key = models.CharField(max_length=255, primary_key=True)
+    value = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    def __str__(self):
+        return f"{self.key} - {self.value}"
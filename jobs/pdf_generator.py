@@ -10,6 +10,8 @@ from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from io import BytesIO
 import os
 from .models import JobEntry
+from .timing import timed
+from .metrics import pdf_render_duration
 
 # Register font with Cyrillic support
 # Use system font or built-in font with Unicode support
@@ -212,7 +214,8 @@ def generate_job_pdf(job_entry: JobEntry, language_code: str = 'ru') -> BytesIO:
     translation.activate(old_language)
     
     # Build PDF
-    doc.build(story)
+    with timed('pdf'), pdf_render_duration.time(document='job'):
+        doc.build(story)
     buffer.seek(0)
     return buffer
 
@@ -507,7 +510,8 @@ def generate_statistics_pdf(statistics_data: dict, username: str, language_code:
     translation.activate(old_language)
     
     # Build PDF
-    doc.build(story)
+    with timed('pdf'), pdf_render_duration.time(document='statistics'):
+        doc.build(story)
     buffer.seek(0)
     return buffer
 
@@ -765,7 +769,8 @@ def generate_monthly_report_pdf(job_entries, year: int, month: int, username: st
     translation.activate(old_language)
     
     # Build PDF
-    doc.build(story)
+    with timed('pdf'), pdf_render_duration.time(document='monthly_report'):
+        doc.build(story)
     buffer.seek(0)
     return buffer
 
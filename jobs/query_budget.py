@@ -0,0 +1,157 @@
+"""
+Per-request query budgets and N+1 detection.
+
+QueryRecorder counts the queries run on every database connection and groups
+them by SQL shape (the parametrized SQL with IN lists collapsed). The same shape
+repeated many times in one request is the signature of an N+1 pattern.
+
+Every connection gets one permanent execute wrapper that reports to the recorders
+active in the current context. Recorders follow the context rather than the
+thread, so queries that async code runs through sync_to_async, or in the worker
+threads of jobs.async_db.gather_queries(), are counted too.
+
+Views declare their budget with @query_budget; QueryBudgetMiddleware enforces
+it (see settings.QUERY_BUDGET_*), and jobs.testing provides test assertions.
+"""
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+_IN_LIST_RE = re.compile(r'\bIN \((?:%s, )*%s\)', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# QueryRecorders active in the current context (innermost last)
+_active_recorders = ContextVar('jobs_query_recorders', default=())
+
+
+class QueryBudgetExceeded(Exception):
+    """A request ran more queries than its budget allows, or repeated one query shape too often"""
+
+
+def fingerprint(sql):
+    """SQL shape of a query: placeholders kept, IN lists and literal numbers collapsed"""
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    sql = _NUMBER_RE.sub('N', sql)
+    return _WHITESPACE_RE.sub(' ', sql).strip()
+
+
+def _record_query(execute, sql, params, many, context):
+    """Execute wrapper of every connection: time the query for the recorders of the current context"""
+    recorders = _active_recorders.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        query = (context['connection'].alias, sql, time.perf_counter() - started)
+        for recorder in recorders:
+            recorder.queries.append(query)
+
+
+def install_query_recording(connection):
+    """Add the recording execute wrapper to a connection (once)"""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+@receiver(connection_created)
+def _install_on_connect(sender, connection, **kwargs):
+    # Covers the connections of every thread, including gather_queries() workers
+    install_query_recording(connection)
+
+
+class QueryRecorder:
+    """Record queries on all database connections while used as a context manager"""
+
+    def __init__(self):
+        self.queries = []  # (alias, sql, duration in seconds)
+        self._token = None
+
+    def __enter__(self):
+        # Connections opened before this module was imported have no wrapper yet
+        for connection in connections.all(initialized_only=True):
+            install_query_recording(connection)
+        self._token = _active_recorders.set(_active_recorders.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_recorders.reset(self._token)
+        self._token = None
+        return False
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        """Total time spent in the database, in seconds"""
+        return sum(duration for _, _, duration in self.queries)
+
+    def repeated(self, threshold):
+        """SQL shapes executed at least `threshold` times, most frequent first"""
+        shapes = Counter(fingerprint(sql) for _, sql, _ in self.queries)
+        return [(shape, count) for shape, count in shapes.most_common() if count >= threshold]
+
+    def violations(self, max_queries=None, n_plus_one_threshold=None):
+        """
+        Describe how the recorded queries break a budget.
+
+        Args:
+            max_queries: Maximum number of queries (None = unlimited)
+            n_plus_one_threshold: Number of repetitions of one SQL shape that
+                counts as an N+1 pattern (None = not checked)
+
+        Returns:
+            List of human-readable problems (empty when within budget)
+        """
+        problems = []
+        if max_queries is not None and self.count > max_queries:
+            problems.append(f'{self.count} queries, budget is {max_queries}')
+        if n_plus_one_threshold:
+            for shape, count in self.repeated(n_plus_one_threshold):
+                problems.append(f'possible N+1: {count} x {shape[:300]}')
+        return problems
+
+
+def query_budget(max_queries=None, n_plus_one_threshold=None):
+    """
+    Declare the query budget of a view (function or class-based view).
+
+    Args:
+        max_queries: Maximum number of queries per request
+        n_plus_one_threshold: Repetitions of one SQL shape reported as N+1
+            (defaults to settings.QUERY_BUDGET_N_PLUS_ONE_THRESHOLD)
+    """
+    def decorator(view):
+        view.query_budget = {
+            'max_queries': max_queries,
+            'n_plus_one_threshold': n_plus_one_threshold,
+        }
+        return view
+    return decorator
+
+
+def get_view_budget(view_func):
+    """Budget for a resolved view: its @query_budget declaration merged with the defaults"""
+    declared = getattr(view_func, 'query_budget', None)
+    if declared is None:
+        # as_view() of class-based views (Django and DRF) keeps the class on the function
+        view_class = getattr(view_func, 'view_class', None) or getattr(view_func, 'cls', None)
+        declared = getattr(view_class, 'query_budget', None) or {}
+    max_queries = declared.get('max_queries')
+    threshold = declared.get('n_plus_one_threshold')
+    return {
+        'max_queries': max_queries if max_queries is not None else getattr(settings, 'QUERY_BUDGET_DEFAULT', None),
+        'n_plus_one_threshold': (threshold if threshold is not None
+                                 else getattr(settings, 'QUERY_BUDGET_N_PLUS_ONE_THRESHOLD', None)),
+    }
@@ -0,0 +1,87 @@
+"""
+Backend-agnostic job entry search.
+
+On PostgreSQL the search uses a full-text SearchVector over the searchable
+fields, backed by a GIN expression index (created after migrate, see
+ensure_search_index). On other backends it falls back to icontains lookups.
+
+Full-text search matches whole words and word prefixes only. The contact fields
+keep their substring match as well, so searching part of an address or phone
+number ("gmail", "4567") still finds the entry; a match in the middle of a word
+in the other fields ("script" in "JavaScript") does not on PostgreSQL.
+"""
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+
+SEARCH_FIELDS = (
+    'job_title', 'employer', 'description', 'address',
+    'notes', 'contact_email', 'contact_phone',
+)
+# Also matched as substrings on PostgreSQL (e-mail domains, partial phone numbers)
+SUBSTRING_SEARCH_FIELDS = ('contact_email', 'contact_phone')
+SEARCH_CONFIG = 'simple'  # No stemming: entries are written in several languages
+SEARCH_INDEX_NAME = 'jobentry_search_gin'
+
+
+def supports_full_text_search(using):
+    """Whether the database alias supports PostgreSQL full-text search"""
+    return connections[using].vendor == 'postgresql'
+
+
+def _search_vector():
+    from django.contrib.postgres.search import SearchVector
+    # Must match the indexed expression exactly for PostgreSQL to use the GIN index
+    return SearchVector(*SEARCH_FIELDS, config=SEARCH_CONFIG)
+
+
+def _prefix_query(search_query):
+    """Build a tsquery matching every word as a prefix (closest to icontains)"""
+    from django.contrib.postgres.search import SearchQuery
+    terms = re.findall(r'\w+', search_query)
+    if not terms:
+        return None
+    return SearchQuery(' & '.join(f'{term}:*' for term in terms), config=SEARCH_CONFIG, search_type='raw')
+
+
+def search_job_entries(queryset, search_query):
+    """
+    Filter a JobEntry queryset by a free-text search query.
+
+    Args:
+        queryset: JobEntry queryset
+        search_query: Text entered by the user
+    """
+    if not search_query:
+        return queryset
+
+    if supports_full_text_search(queryset.db):
+        query = _prefix_query(search_query)
+        if query is not None:
+            condition = Q(search=query)
+            for field in SUBSTRING_SEARCH_FIELDS:
+                condition |= Q(**{f'{field}__icontains': search_query})
+            return queryset.annotate(search=_search_vector()).filter(condition)
+
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f'{field}__icontains': search_query})
+    return queryset.filter(condition)
+
+
+def ensure_search_index(using):
+    """Create the GIN full-text index on PostgreSQL if it does not exist yet"""
+    if not supports_full_text_search(using):
+        return
+    from django.contrib.postgres.indexes import GinIndex
+    from .models import JobEntry
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, JobEntry._meta.db_table)
+    if SEARCH_INDEX_NAME in constraints:
+        return
+    with connection.schema_editor() as schema_editor:
+        schema_editor.add_index(JobEntry, GinIndex(_search_vector(), name=SEARCH_INDEX_NAME))
@@ -1,17 +1,43 @@
-from django.db.models.signals import pre_save, post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed, post_migrate
 from django.dispatch import receiver
-from django.core.cache import cache
-from .models import JobEntry, JobEntryHistory, Notification, Category, Tag
+from .models import (JobEntry, JobEntryHistory, Notification, Category, Tag,
+                     ResumeSubmissionStatus, Attachment, UserProfile)
+from .caching import (bump_generation, bump_user_generation, profile_namespace,
+                      CATEGORIES_NAMESPACE, TAGS_NAMESPACE)
+from .search import ensure_search_index
+from .events import EVENT_FIELDS, backfill_job_events, sync_job_events
+from .metrics import notifications_created
 from django.utils import timezone
 
 
+# Date fields that produce notifications: field -> (notification_type, title, message, date format)
+# Store English text in database, translation happens in views.py
+NOTIFICATION_DATE_FIELDS = {
+    'interview_date': (
+        'interview', 'Upcoming interview: %(job_title)s', 'Interview scheduled for %(date)s', "%Y-%m-%d %H:%M"
+    ),
+    'follow_up_date': (
+        'followup', 'Follow-up reminder: %(job_title)s', 'Follow-up scheduled for %(date)s', "%Y-%m-%d %H:%M"
+    ),
+    'application_deadline': (
+        'deadline', 'Application deadline: %(job_title)s', 'Application deadline: %(date)s', "%Y-%m-%d"
+    ),
+}
+
 
 @receiver(pre_save, sender=JobEntry)
 def track_job_entry_changes(sender, instance, **kwargs):
     """Track changes to job entry fields"""
+    instance._pre_save_dates = None
     if instance.pk:
         try:
             old_instance = JobEntry.objects.select_related('user').get(pk=instance.pk)
+            
+            # Snapshot notification dates so create_notifications can skip unchanged saves
+            instance._pre_save_dates = {
+                field: getattr(old_instance, field) for field in NOTIFICATION_DATE_FIELDS
+            }
             user = instance.user
             
             # List of fields to track
@@ -50,77 +76,181 @@ def track_job_entry_changes(sender, instance, **kwargs):
             pass
 
 
+@receiver(post_save, sender=JobEntry)
+def sync_events(sender, instance, created, **kwargs):
+    """Keep the entry's JobEvent rows in sync with its date fields"""
+    # Runs before create_notifications, which clears the pre-save snapshot
+    old_dates = getattr(instance, '_pre_save_dates', None)
+    dates = {field: getattr(instance, field) for field in EVENT_FIELDS.values()}
+    if old_dates is not None and all(old_dates.get(field) == value for field, value in dates.items()):
+        return
+    if created and not any(value is not None for value in dates.values()):
+        return
+    sync_job_events(instance)
+
+
 @receiver(post_save, sender=JobEntry)
 def create_notifications(sender, instance, created, **kwargs):
-    """Create notifications for important dates only"""
-    user = instance.user
+    """Create or refresh notifications for important dates that actually changed"""
+    # Pre-save snapshot of the date fields (None for new entries)
+    old_dates = getattr(instance, '_pre_save_dates', None)
+    instance._pre_save_dates = None
     
-    # Invalidate notifications count cache
-    cache.delete(f'notifications_count_{user.id}')
+    now = timezone.now()
+    pending = {}
+    # Notifications whose date was cleared or moved into the past
+    stale = set()
+    for field, (notification_type, title, message, date_format) in NOTIFICATION_DATE_FIELDS.items():
+        value = getattr(instance, field)
+        if old_dates is not None and old_dates.get(field) == value:
+            continue
+        # Deadlines are dates, interviews and follow-ups are datetimes
+        is_upcoming = value and (value >= now.date() if field == 'application_deadline' else value > now)
+        if not is_upcoming:
+            if old_dates is not None and old_dates.get(field):
+                stale.add(notification_type)
+            continue
+        pending[notification_type] = {
+            'title': title % {'job_title': instance.job_title},
+            'message': message % {'date': value.strftime(date_format)},
+        }
     
-    # Store notification text as template strings that will be translated in views/templates
-    # Use English as base language for storage, translation happens at display time
+    # Nothing relevant changed - skip notification queries
+    if not pending and not stale:
+        return
     
-    # Notification for upcoming interview
-    # Store English text in database, translation happens in views.py
-    if instance.interview_date and instance.interview_date > timezone.now():
-        title = 'Upcoming interview: %(job_title)s' % {'job_title': instance.job_title}
-        message = 'Interview scheduled for %(date)s' % {
-            'date': instance.interview_date.strftime("%Y-%m-%d %H:%M")
-        }
-        Notification.objects.get_or_create(
-            user=user,
-            job_entry=instance,
-            notification_type='interview',
-            defaults={
-                'title': title,
-                'message': message,
-            }
-        )
+    if stale:
+        # A single DELETE: Notification has no delete signal receivers
+        Notification.objects.filter(job_entry=instance, notification_type__in=stale).delete()
+    if not pending:
+        return
     
-    # Notification for follow-up reminder
-    if instance.follow_up_date and instance.follow_up_date > timezone.now():
-        title = 'Follow-up reminder: %(job_title)s' % {'job_title': instance.job_title}
-        message = 'Follow-up scheduled for %(date)s' % {
-            'date': instance.follow_up_date.strftime("%Y-%m-%d %H:%M")
-        }
-        Notification.objects.get_or_create(
-            user=user,
+    # Resolve all existing notifications for the changed dates in one query
+    existing = {
+        notification.notification_type: notification
+        for notification in Notification.objects.filter(
             job_entry=instance,
-            notification_type='followup',
-            defaults={
-                'title': title,
-                'message': message,
-            }
-        )
+            notification_type__in=list(pending)
+        ).only('id', 'notification_type', 'title', 'message', 'is_read')
+    }
     
-    # Notification for application deadline
-    if instance.application_deadline and instance.application_deadline >= timezone.now().date():
-        title = 'Application deadline: %(job_title)s' % {'job_title': instance.job_title}
-        message = 'Application deadline: %(date)s' % {
-            'date': instance.application_deadline.strftime("%Y-%m-%d")
-        }
-        Notification.objects.get_or_create(
-            user=user,
-            job_entry=instance,
-            notification_type='deadline',
-            defaults={
-                'title': title,
-                'message': message,
-            }
-        )
+    to_create = []
+    to_update = []
+    for notification_type, text in pending.items():
+        notification = existing.get(notification_type)
+        if notification is None:
+            to_create.append(Notification(
+                user_id=instance.user_id,
+                job_entry=instance,
+                notification_type=notification_type,
+                **text
+            ))
+        elif notification.title != text['title'] or notification.message != text['message']:
+            # Date moved - refresh stored text and show it as unread again
+            notification.title = text['title']
+            notification.message = text['message']
+            notification.is_read = False
+            to_update.append(notification)
+    
+    # Cached unread count is invalidated by invalidate_user_cache, which runs after this receiver
+    if to_create:
+        Notification.objects.bulk_create(to_create)
+        for notification in to_create:
+            notifications_created.inc(type=notification.notification_type)
+    if to_update:
+        Notification.objects.bulk_update(to_update, ['title', 'message', 'is_read'])
 
 
 @receiver(post_save, sender=Category)
 @receiver(post_delete, sender=Category)
 def invalidate_categories_cache(sender, **kwargs):
     """Invalidate categories cache when Category is created/updated/deleted"""
-    cache.delete('all_categories')
+    bump_generation(CATEGORIES_NAMESPACE)
 
 
 @receiver(post_save, sender=Tag)
 @receiver(post_delete, sender=Tag)
 def invalidate_tags_cache(sender, **kwargs):
     """Invalidate tags cache when Tag is created/updated/deleted"""
-    cache.delete('all_tags')
+    bump_generation(TAGS_NAMESPACE)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    """Invalidate cached profile when UserProfile is created/updated/deleted"""
+    bump_generation(profile_namespace(instance.user_id))
+
+
+# Per-user cache invalidation. Registered last so that it runs after the
+# receivers above have finished writing (e.g. notifications created on save).
+
+@receiver(post_save, sender=JobEntry)
+@receiver(post_delete, sender=JobEntry)
+@receiver(post_save, sender=Notification)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Invalidate the owner's derived data when a JobEntry or Notification changes"""
+    # Notification deletions bump explicitly: a post_delete receiver would turn
+    # deleting all of a user's notifications into one query and one bump per row
+    bump_user_generation(instance.user_id)
+
+
+class _JobEntryOwnersInvalidation:
+    """on_commit callback invalidating the owners of the job entries collected in one transaction"""
+    
+    def __init__(self):
+        self.job_entry_ids = set()
+    
+    def __call__(self):
+        # Entries deleted in the transaction are gone; their own post_delete bumped the owner
+        user_ids = JobEntry.objects.filter(pk__in=self.job_entry_ids).values_list('user_id', flat=True).distinct()
+        for user_id in user_ids:
+            bump_user_generation(user_id)
+
+
+def _invalidate_job_entry_owner(job_entry_id):
+    """Invalidate the owner of a job entry once, when the current transaction commits"""
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        for _, callback, _ in connection.run_on_commit:
+            if isinstance(callback, _JobEntryOwnersInvalidation):
+                callback.job_entry_ids.add(job_entry_id)
+                return
+    callback = _JobEntryOwnersInvalidation()
+    callback.job_entry_ids.add(job_entry_id)
+    # Runs at once outside a transaction
+    transaction.on_commit(callback)
+
+
+@receiver(post_save, sender=ResumeSubmissionStatus)
+@receiver(post_delete, sender=ResumeSubmissionStatus)
+@receiver(post_save, sender=Attachment)
+@receiver(post_delete, sender=Attachment)
+def invalidate_job_entry_user_cache(sender, instance, **kwargs):
+    """Invalidate the owner's derived data when a job entry's status or attachment changes"""
+    if sender.job_entry.is_cached(instance):
+        bump_user_generation(instance.job_entry.user_id)
+    else:
+        # Cascaded deletes load the rows without their entry: one owner lookup per transaction
+        _invalidate_job_entry_owner(instance.job_entry_id)
+
+
+@receiver(m2m_changed, sender=JobEntry.tags.through)
+def invalidate_job_entry_tags_cache(sender, instance, action, **kwargs):
+    """Invalidate the owner's derived data when a job entry's tags change"""
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, JobEntry):
+        bump_user_generation(instance.user_id)
+
+
+@receiver(post_migrate)
+def create_search_index(sender, using, **kwargs):
+    """Create the full-text search index after migrating the jobs app (PostgreSQL only)"""
+    if sender.name == 'jobs':
+        ensure_search_index(using)
+
 
+@receiver(post_migrate)
+def backfill_events(sender, using, **kwargs):
+    """Build the JobEvent rows of existing job entries when the table is new"""
+    if sender.name == 'jobs':
+        backfill_job_events(using)
@@ -0,0 +1,71 @@
+"""
+Test helpers.
+
+Not a test module: import these from tests.
+"""
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.test import override_settings
+from django.urls import resolve
+
+from .db_routing import sync_sqlite_replica
+from .query_budget import QueryRecorder, get_view_budget
+
+
+# Database alias of the read replica (see settings.DATABASES)
+REPLICA_ALIAS = 'replica'
+
+
+class ReplicaTestMixin:
+    """
+    Run a TransactionTestCase against two SQLite databases kept in sync.
+
+    Uses the 'replica' database: the one from DATABASE_READ_URL, or under
+    `manage.py test` a second SQLite test database the settings add. Reads inside
+    using_replica() go to it for the duration of each test. The replica is refreshed
+    from the primary before each test; call sync_replica() after writing test data.
+    """
+    databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS} & set(settings.DATABASES)
+
+    def setUp(self):
+        super().setUp()
+        routing = override_settings(DATABASE_READ_ALIAS=REPLICA_ALIAS)
+        routing.enable()
+        self.addCleanup(routing.disable)
+        self.sync_replica()
+
+    def sync_replica(self):
+        """Copy the primary's committed data into the replica"""
+        sync_sqlite_replica()
+
+
+@contextmanager
+def assert_query_budget(max_queries=None, n_plus_one_threshold=None):
+    """
+    Fail if the block runs more than `max_queries` queries or repeats one SQL shape
+    `n_plus_one_threshold` times (defaults to settings.QUERY_BUDGET_N_PLUS_ONE_THRESHOLD).
+    """
+    if n_plus_one_threshold is None:
+        n_plus_one_threshold = getattr(settings, 'QUERY_BUDGET_N_PLUS_ONE_THRESHOLD', None)
+    with QueryRecorder() as recorder:
+        yield recorder
+    problems = recorder.violations(max_queries, n_plus_one_threshold)
+    if problems:
+        raise AssertionError('Query budget exceeded: ' + '; '.join(problems))
+
+
+class QueryBudgetTestMixin:
+    """Assertions for query budgets in TestCase classes"""
+
+    def assertQueryBudget(self, max_queries=None, n_plus_one_threshold=None):
+        """Context manager: see assert_query_budget()"""
+        return assert_query_budget(max_queries, n_plus_one_threshold)
+
+    def assertViewQueryBudget(self, path, data=None, **extra):
+        """GET `path` with self.client and check it against its view's @query_budget"""
+        budget = get_view_budget(resolve(path).func)
+        with assert_query_budget(**budget):
+            response = self.client.get(path, data, **extra)
+        return response
@@ -0,0 +1,82 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.api.v1.renderers import FastJSONRenderer
+from jobs.api.v1.serializers import JobEntrySerializer, ResumeSubmissionStatusSerializer
+from jobs.models import Category, JobEntry, ResumeSubmissionStatus, Tag
+
+
+class JobDetailFieldSelectionTests(TestCase):
+    """?fields= and ?expand= on the detail endpoint (the list is covered by test_api_lists)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='sparse', password='secret')
+        cls.category = Category.objects.create(name='Engineering')
+        cls.tags = [Tag.objects.create(name='remote'), Tag.objects.create(name='python')]
+        cls.job = JobEntry.objects.create(user=cls.user, job_title='Developer', employer='ACME',
+                                          job_url='https://example.com/job', category=cls.category)
+        cls.job.tags.set(cls.tags)
+        cls.status = ResumeSubmissionStatus.objects.create(job_entry=cls.job, status_type='resume_sent',
+                                                           date_time=timezone.now())
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = reverse('api_v1:job-detail', args=[self.job.pk])
+
+    def get(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json(), ' '.join(query['sql'] for query in queries.captured_queries)
+
+    def test_without_parameters_matches_serializer(self):
+        response = self.client.get(self.url)
+        job = JobEntry.objects.get(pk=self.job.pk)
+        self.assertEqual(response.content, FastJSONRenderer().render(JobEntrySerializer(job).data))
+
+    def test_fields_narrow_output_and_columns(self):
+        data, sql = self.get({'fields': 'id,job_title'})
+        self.assertEqual(data, {'id': self.job.pk, 'job_title': 'Developer'})
+        self.assertNotIn('"jobs_jobentry"."description"', sql)
+        self.assertNotIn('jobs_category', sql)
+        self.assertNotIn('jobs_tag', sql)
+        self.assertNotIn('jobs_resumesubmissionstatus', sql)
+
+    def test_collapsed_relations_are_ids(self):
+        data, sql = self.get({'fields': 'id,category,tags,resume_statuses', 'expand': ''})
+        self.assertEqual(data['category'], self.category.pk)
+        self.assertEqual(sorted(data['tags']), sorted(tag.pk for tag in self.tags))
+        self.assertEqual(data['resume_statuses'], [self.status.pk])
+        # The id comes from category_id, without a join
+        self.assertNotIn('"jobs_category"', sql)
+
+    def test_expanded_relations_are_nested(self):
+        data, sql = self.get({'fields': 'id,category,resume_statuses', 'expand': 'category'})
+        self.assertEqual(data['category']['name'], 'Engineering')
+        self.assertEqual(data['resume_statuses'], [self.status.pk])
+        self.assertIn('"jobs_category"', sql)
+        self.assertNotIn('jobs_tag', sql)
+
+        data, _ = self.get({'fields': 'resume_statuses', 'expand': 'resume_statuses'})
+        self.assertEqual(data, {'resume_statuses': [ResumeSubmissionStatusSerializer(self.status).data]})
+
+    def test_unknown_names_are_rejected(self):
+        for params in ({'fields': 'id,salary'}, {'expand': 'user'}, {'expand': 'job_title'}):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+
+    def test_write_ignores_selection(self):
+        response = self.client.patch(self.url + '?fields=id', {'job_title': 'Engineer'},
+                                     content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['job_title'], 'Engineer')
+        self.assertEqual(response.json()['category']['name'], 'Engineering')
+
@@ -0,0 +1,115 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from jobs.api.v1.renderers import FastJSONRenderer
+from jobs.api.v1.serializers import JobEntryHistorySerializer, JobEntryListSerializer, NotificationSerializer
+from jobs.models import Category, JobEntry, JobEntryHistory, Notification, Tag
+
+
+class ListEndpointParityTests(TestCase):
+    """The list endpoints render rows with ValuesSerializer; their output must match the DRF serializers"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='lister', password='secret')
+        other = User.objects.create_user(username='other', password='secret')
+        category = Category.objects.create(name='Engineering')
+        tags = [Tag.objects.create(name='remote'), Tag.objects.create(name='python')]
+        for number in range(12):
+            job = JobEntry.objects.create(
+                user=cls.user, job_title=f'{"Python" if number % 3 else "Java"} developer {number}',
+                employer=f'Employer {number}', job_url='https://example.com/job',
+                # Entries without a category or tags render null and []
+                category=category if number % 2 else None, priority=('low', 'medium', 'high')[number % 3],
+                work_type='remote' if number % 4 else '',
+            )
+            job.tags.set(tags[:number % 3])
+            JobEntryHistory.objects.create(job_entry=job, user=cls.user if number % 2 else None,
+                                           field_name='status', old_value='not_applied', new_value='applied')
+            Notification.objects.create(user=cls.user, job_entry=job if number % 2 else None,
+                                        title=f'Notification {number}', message='Message',
+                                        is_read=bool(number % 2))
+        JobEntry.objects.create(user=other, job_title='Python developer', employer='Elsewhere',
+                                job_url='https://example.com/job')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def assertListMatchesSerializer(self, path, params, serializer_class, instances, context=None):
+        """The response body must be byte-identical to the serializer's output for the same page"""
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        page = response.json()
+        expected = FastJSONRenderer().render({
+            'count': page['count'],
+            'next': page['next'],
+            'previous': page['previous'],
+            'results': serializer_class(instances, many=True, context=context or {}).data,
+        })
+        self.assertEqual(response.content, expected)
+        return response
+
+    def jobs(self):
+        return JobEntry.objects.filter(user=self.user).order_by('-created_at')
+
+    def test_jobs(self):
+        self.assertListMatchesSerializer(reverse('api_v1:job-list'), {}, JobEntryListSerializer, self.jobs()[:10])
+
+    def test_jobs_second_page(self):
+        response = self.assertListMatchesSerializer(
+            reverse('api_v1:job-list'), {'page': 2}, JobEntryListSerializer, self.jobs()[10:]
+        )
+        self.assertEqual(response.json()['count'], 12)
+
+    def test_jobs_fields(self):
+        fields = {'id', 'job_title', 'tags', 'created_at'}
+        self.assertListMatchesSerializer(
+            reverse('api_v1:job-list'), {'fields': ','.join(sorted(fields)), 'page_size': 100},
+            JobEntryListSerializer, self.jobs(), {'fields': fields}
+        )
+
+    def test_jobs_expand(self):
+        for expand in (set(), {'tags'}, {'category', 'tags'}):
+            with self.subTest(expand=expand):
+                self.assertListMatchesSerializer(
+                    reverse('api_v1:job-list'), {'expand': ','.join(sorted(expand)), 'page_size': 100},
+                    JobEntryListSerializer, self.jobs(), {'expand': expand}
+                )
+
+    def test_jobs_fields_and_expand(self):
+        self.assertListMatchesSerializer(
+            reverse('api_v1:job-list'), {'fields': 'id,category', 'expand': '', 'page_size': 100},
+            JobEntryListSerializer, self.jobs(), {'fields': {'id', 'category'}, 'expand': set()}
+        )
+
+    def test_jobs_search(self):
+        response = self.assertListMatchesSerializer(
+            reverse('api_v1:job-list'), {'search': 'python', 'page_size': 100},
+            JobEntryListSerializer, self.jobs().filter(job_title__icontains='python')
+        )
+        self.assertEqual(response.json()['count'], 8)
+
+    def test_jobs_filter_and_ordering(self):
+        self.assertListMatchesSerializer(
+            reverse('api_v1:job-list'), {'priority': 'high', 'ordering': 'job_title', 'page_size': 100},
+            JobEntryListSerializer, self.jobs().filter(priority='high').order_by('job_title')
+        )
+
+    def test_notifications(self):
+        notifications = Notification.objects.filter(user=self.user).order_by('-created_at')
+        self.assertListMatchesSerializer(
+            reverse('api_v1:notification-list'), {'page_size': 100}, NotificationSerializer, notifications
+        )
+        self.assertListMatchesSerializer(
+            reverse('api_v1:notification-list'), {'is_read': 'false', 'page_size': 100},
+            NotificationSerializer, notifications.filter(is_read=False)
+        )
+
+    def test_history(self):
+        history = JobEntryHistory.objects.filter(job_entry__user=self.user).order_by('-changed_at')
+        self.assertListMatchesSerializer(
+            reverse('api_v1:history-list'), {'page_size': 100}, JobEntryHistorySerializer, history
+        )
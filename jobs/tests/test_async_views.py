@@ -0,0 +1,109 @@
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import AsyncClient, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.async_db import gather_queries
+from jobs.caching import bump_user_generation
+from jobs.models import JobEntry, Notification, ResumeSubmissionStatus
+from jobs.query_budget import QueryRecorder
+
+
+class AsyncViewTests(TransactionTestCase):
+    # Sync URL name -> async variant
+    ENDPOINTS = {
+        'api_v1:statistics': 'api_v1:async-statistics',
+        'api_v1:monthly-report': 'api_v1:async-monthly-report',
+        'api_v1:calendar': 'api_v1:async-calendar',
+        'api_v1:notification-unread-count': 'api_v1:async-unread-count',
+    }
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='async', password='secret')
+        now = timezone.now()
+        # Status dates may not precede the entry's creation
+        submitted = now + timedelta(seconds=1)
+        for number in range(3):
+            job = JobEntry.objects.create(
+                user=self.user, job_title=f'Developer {number}', employer='ACME',
+                job_url='https://example.com/job', status='applied',
+                interview_date=now + timedelta(days=number + 1),
+                follow_up_date=now + timedelta(days=number + 2) if number % 2 else None,
+                application_deadline=timezone.localdate(now) + timedelta(days=number),
+            )
+            ResumeSubmissionStatus.objects.create(job_entry=job, status_type='resume_sent',
+                                                  date_time=submitted + timedelta(seconds=number))
+            Notification.objects.create(user=self.user, job_entry=job, title='Reminder', message='Message')
+        # The month of the submissions and a range around the dates above
+        self.params = {
+            'api_v1:monthly-report': {'month': f'{submitted:%Y-%m}'},
+            'api_v1:calendar': {'start': (now - timedelta(days=1)).isoformat(),
+                                'end': (now + timedelta(days=10)).isoformat()},
+        }
+        self.client.force_login(self.user)
+        self.async_client = AsyncClient()
+        async_to_sync(self.async_client.aforce_login)(self.user)
+
+    def test_async_views_match_sync_views(self):
+        for sync_name, async_name in self.ENDPOINTS.items():
+            with self.subTest(endpoint=sync_name):
+                params = self.params.get(sync_name, {})
+                bump_user_generation(self.user)
+                expected = self.client.get(reverse(sync_name), params)
+                # Computed by the async view itself, not read from the sync view's cache entry
+                bump_user_generation(self.user)
+                response = async_to_sync(self.async_client.get)(reverse(async_name), params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), expected.json())
+
+    def test_fixture_fills_the_compared_responses(self):
+        report = self.client.get(reverse('api_v1:monthly-report'), self.params['api_v1:monthly-report']).json()
+        self.assertEqual(report['total_entries'], 3)
+        events = self.client.get(reverse('api_v1:calendar'), self.params['api_v1:calendar']).json()
+        self.assertEqual(sorted(event['type'] for event in events),
+                         ['deadline'] * 3 + ['follow_up'] + ['interview'] * 3)
+
+    def test_query_recorder_counts_gather_queries_workers(self):
+        with QueryRecorder() as recorder:
+            counts = async_to_sync(gather_queries)(
+                (JobEntry.objects.filter(user=self.user).count,),
+                (ResumeSubmissionStatus.objects.filter(job_entry__user=self.user).count,),
+            )
+        self.assertEqual(counts, [3, 3])
+        self.assertEqual(recorder.count, 2)
+
+    def test_async_view_queries_are_recorded(self):
+        bump_user_generation(self.user)
+        with QueryRecorder() as recorder:
+            response = async_to_sync(self.async_client.get)(reverse('api_v1:async-statistics'))
+        self.assertEqual(response.status_code, 200)
+        # The statistics blocks run in gather_queries() workers
+        self.assertGreater(recorder.count, 10)
+
+    def test_gather_queries_bounds_open_connections(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def query():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            count = JobEntry.objects.filter(user=self.user).count()
+            with lock:
+                running.pop()
+            return count
+
+        with mock.patch('jobs.async_db._worker_slots', threading.BoundedSemaphore(2)):
+            counts = async_to_sync(gather_queries)(*((query,) for _ in range(6)))
+        self.assertEqual(counts, [3] * 6)
+        self.assertEqual(max(peak), 2)
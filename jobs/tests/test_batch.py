@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+
+class BatchViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='batcher', password='secret')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post_batch(self, requests):
+        return self.client.post(reverse('api_v1:batch'), {'requests': requests}, content_type='application/json')
+
+    def test_headers_are_forwarded(self):
+        first = self.post_batch([{'path': '/api/v1/statistics/'}]).json()['responses'][0]
+        etag = first['headers']['ETag']
+        response = self.post_batch([{'path': '/api/v1/statistics/', 'headers': {'If-None-Match': etag}}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['responses'][0]['status'], 304)
+
+    def test_invalid_headers_are_rejected(self):
+        for headers in (['If-None-Match'], 'If-None-Match: "x"', {'If-None-Match': 1}, {'X-Ids': ['1', '2']}):
+            with self.subTest(headers=headers):
+                response = self.post_batch([{'path': '/api/v1/jobs/'},
+                                            {'path': '/api/v1/statistics/', 'headers': headers}])
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('headers', response.json()['detail'])
+
+    def test_non_string_method_is_rejected(self):
+        response = self.post_batch([{'path': '/api/v1/jobs/', 'method': 1}])
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import parse_http_date
+
+from jobs.calendar_feed import get_calendar_token
+from jobs.models import JobEntry
+
+
+class CalendarFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='subscriber', password='secret')
+        cls.token = get_calendar_token(cls.user)
+
+    def setUp(self):
+        cache.clear()
+        # Every poll and write below happens within the same second
+        clock = mock.patch('jobs.caching.time.time', return_value=int(time.time()) + 0.25)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def create_interview(self, title):
+        return JobEntry.objects.create(user=self.user, job_title=title, employer='ACME',
+                                       job_url='https://example.com/job',
+                                       interview_date=timezone.now() + timedelta(days=1))
+
+    def get_feed(self, **headers):
+        return self.client.get(reverse('jobs:calendar_feed'), {'token': self.token}, **headers)
+
+    def test_unchanged_feed_is_not_modified_without_queries(self):
+        self.create_interview('Developer')
+        response = self.get_feed()
+        self.assertIn(b'SUMMARY:Interview: Developer - ACME', b''.join(response.streaming_content))
+        with self.assertNumQueries(0):
+            response = self.get_feed(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_write_in_the_same_second_moves_last_modified(self):
+        self.create_interview('Developer')
+        response = self.get_feed()
+        self.create_interview('Tester')
+        response_after = self.get_feed(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response_after.status_code, 200)
+        self.assertIn(b'Tester', b''.join(response_after.streaming_content))
+        self.assertGreater(parse_http_date(response_after['Last-Modified']),
+                           parse_http_date(response['Last-Modified']))
+
+    def test_unknown_token_is_not_found(self):
+        response = self.client.get(reverse('jobs:calendar_feed'), {'token': 'unknown'})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,146 @@
+import datetime
+import gzip
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from jobs import middleware
+from jobs.api.v1 import renderers
+from jobs.api.v1.renderers import FastJSONRenderer
+from jobs.middleware import CompressionMiddleware, _accepted_encodings
+from jobs.models import JobEntry
+
+
+BODY = b'{"results": [' + b'{"job_title": "Developer", "employer": "ACME"}, ' * 100 + b'{}]}'
+
+
+class FakeBrotli:
+    """Stands in for the optional brotli module"""
+
+    @staticmethod
+    def compress(data, quality):
+        return b'br:' + gzip.compress(data)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def compress(self, response, accept_encoding='gzip, deflate, br'):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, body=BODY, **headers):
+        return HttpResponse(body, content_type='application/json', headers=headers)
+
+    def test_accepted_encodings_follow_q_values(self):
+        self.assertEqual(_accepted_encodings('gzip, br;q=0.5, deflate;q=0'), {'gzip', 'br'})
+        self.assertEqual(_accepted_encodings('br;q=0, GZIP;q=1.0'), {'gzip'})
+        self.assertEqual(_accepted_encodings('gzip;q=oops'), set())
+        self.assertEqual(_accepted_encodings(''), set())
+
+    def test_brotli_preferred_when_installed(self):
+        with mock.patch.object(middleware, 'brotli', FakeBrotli):
+            response = self.compress(self.json_response())
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(gzip.decompress(response.content[3:]), BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+
+    def test_gzip_without_brotli(self):
+        for brotli_module, accept_encoding in ((None, 'gzip, br'), (FakeBrotli, 'gzip, br;q=0')):
+            with self.subTest(brotli=brotli_module, accept_encoding=accept_encoding):
+                with mock.patch.object(middleware, 'brotli', brotli_module):
+                    response = self.compress(self.json_response(), accept_encoding)
+                self.assertEqual(response['Content-Encoding'], 'gzip')
+                self.assertEqual(gzip.decompress(response.content), BODY)
+
+    def test_html_is_never_brotli(self):
+        response = HttpResponse(BODY, content_type='text/html; charset=utf-8')
+        with mock.patch.object(middleware, 'brotli', FakeBrotli):
+            response = self.compress(response)
+        # gzip keeps Django's BREACH padding for pages carrying CSRF tokens
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+
+    def test_uncompressed_responses(self):
+        cases = {
+            'small': (self.json_response(b'{"count": 0}'), 'gzip'),
+            'identity only': (self.json_response(), 'identity'),
+            'incompressible type': (HttpResponse(BODY, content_type='application/pdf'), 'gzip'),
+            'already encoded': (self.json_response(**{'Content-Encoding': 'gzip'}), 'gzip'),
+        }
+        for name, (response, accept_encoding) in cases.items():
+            with self.subTest(name):
+                content, encoding = response.content, response.get('Content-Encoding')
+                response = self.compress(response, accept_encoding)
+                self.assertEqual(response.content, content)
+                self.assertEqual(response.get('Content-Encoding'), encoding)
+
+    def test_vary_and_weak_etag(self):
+        response = self.compress(self.json_response(ETag='"abc"'), 'gzip')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+        response = self.compress(self.json_response(ETag='W/"abc"'), 'gzip')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_streaming_is_gzipped(self):
+        response = StreamingHttpResponse(iter([BODY[:500], BODY[500:]]), content_type='application/json')
+        with mock.patch.object(middleware, 'brotli', FakeBrotli):
+            response = self.compress(response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), BODY)
+
+
+class CompressedApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='compressed', password='secret')
+        cls.job = JobEntry.objects.create(user=cls.user, job_title='Developer', employer='ACME',
+                                          job_url='https://example.com/job', description='x' * 2000)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_if_match_accepts_weakened_etag(self):
+        url = reverse('api_v1:job-detail', args=[self.job.pk])
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        response = self.client.patch(url, {'job_title': 'Engineer'}, content_type='application/json',
+                                     HTTP_IF_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    data = {
+        'salary': Decimal('1234.50'),
+        'created_at': datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        'date': datetime.date(2024, 3, 1),
+        'label': gettext_lazy('Tags'),
+        'nested': [{'id': 1, 'name': 'ünïcode'}, None, True],
+        1: 'non-string key',
+    }
+
+    def test_output_matches_stdlib_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_indented_and_fallback_output(self):
+        context = {'indent': 4}
+        self.assertEqual(FastJSONRenderer().render(self.data, renderer_context=context),
+                         JSONRenderer().render(self.data, renderer_context=context))
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    @skipUnless(renderers.orjson, 'orjson is not installed')
+    def test_uses_orjson(self):
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            FastJSONRenderer().render(self.data)
+        dumps.assert_called_once()
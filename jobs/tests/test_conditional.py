@@ -0,0 +1,52 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import parse_http_date
+
+from jobs.models import JobEntry
+
+
+class ConditionalRequestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='poller', password='secret')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        # Every request and write below happens within the same second
+        clock = mock.patch('jobs.caching.time.time', return_value=int(time.time()) + 0.25)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def create_job(self):
+        return JobEntry.objects.create(user=self.user, job_title='Developer', employer='ACME',
+                                       job_url='https://example.com/job')
+
+    def test_unchanged_resource_is_not_modified(self):
+        response = self.client.get(reverse('api_v1:job-list'))
+        for headers in ({'HTTP_IF_NONE_MATCH': response['ETag']},
+                        {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']}):
+            with self.subTest(headers=headers):
+                self.assertEqual(self.client.get(reverse('api_v1:job-list'), **headers).status_code, 304)
+
+    def test_write_in_the_same_second_moves_last_modified(self):
+        response = self.client.get(reverse('api_v1:job-list'))
+        self.create_job()
+        response_after = self.client.get(reverse('api_v1:job-list'),
+                                         HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response_after.status_code, 200)
+        self.assertEqual(response_after.json()['count'], 1)
+        self.assertGreater(parse_http_date(response_after['Last-Modified']),
+                           parse_http_date(response['Last-Modified']))
+
+    def test_stale_if_match_fails(self):
+        job = self.create_job()
+        etag = self.client.get(reverse('api_v1:job-detail', args=[job.pk]))['ETag']
+        self.create_job()
+        response = self.client.delete(reverse('api_v1:job-detail', args=[job.pk]), HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
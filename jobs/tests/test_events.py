@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.events import backfill_job_events, sync_job_events
+from jobs.models import JobEntry, JobEvent
+
+
+class JobEventTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='planner', password='secret')
+        now = timezone.now()
+        cls.upcoming = JobEntry.objects.create(user=cls.user, job_title='Upcoming', employer='ACME',
+                                               job_url='https://example.com/job',
+                                               interview_date=now + timedelta(days=1),
+                                               application_deadline=timezone.localdate(now))
+        cls.past = JobEntry.objects.create(user=cls.user, job_title='Past', employer='ACME',
+                                           job_url='https://example.com/job')
+        # Dates may not precede the entry's creation; update() skips the validation
+        JobEntry.objects.filter(pk=cls.past.pk).update(interview_date=now - timedelta(hours=1))
+        cls.past.refresh_from_db()
+        sync_job_events(cls.past)
+        JobEntry.objects.create(user=cls.user, job_title='Undated', employer='ACME',
+                                job_url='https://example.com/job')
+
+    def test_backfill_fills_an_empty_table(self):
+        JobEvent.objects.all().delete()
+        self.assertEqual(backfill_job_events('default'), 3)
+        self.assertEqual(
+            set(JobEvent.objects.values_list('job_entry__job_title', 'kind')),
+            {('Upcoming', 'interview'), ('Upcoming', 'deadline'), ('Past', 'interview')},
+        )
+
+    def test_backfill_leaves_an_existing_table_alone(self):
+        JobEvent.objects.filter(job_entry=self.past).delete()
+        self.assertEqual(backfill_job_events('default'), 0)
+        self.assertFalse(JobEvent.objects.filter(job_entry=self.past).exists())
+
+    def test_calendar_page_lists_upcoming_events(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('jobs:calendar'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['interviews'], [self.upcoming])
+        self.assertEqual(response.context['follow_ups'], [])
+        # Today's deadline is still upcoming
+        self.assertEqual(response.context['deadlines'], [self.upcoming])
@@ -0,0 +1,78 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from jobs.caching import tiered_cache
+from jobs.forms import JobEntryForm
+from jobs.models import Category, JobEntry, Tag
+
+
+class CatalogChoiceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='chooser', password='secret')
+        cls.category = Category.objects.create(name='Engineering')
+        cls.tags = [Tag.objects.create(name=f'tag-{i}') for i in range(20)]
+
+    def setUp(self):
+        cache.clear()
+        tiered_cache.clear()
+
+    def form_data(self, **overrides):
+        data = {'job_title': 'Developer', 'employer': 'ACME', 'job_url': 'https://example.com/job',
+                'status': 'not_applied'}
+        data.update(overrides)
+        return data
+
+    def test_rendering_choices_is_cached(self):
+        str(JobEntryForm())
+        with self.assertNumQueries(0):
+            html = str(JobEntryForm())
+        self.assertIn('Engineering', html)
+        self.assertIn('tag-19', html)
+
+    def test_edit_form_loads_only_its_own_tags(self):
+        job = JobEntry.objects.create(user=self.user, job_title='Developer', employer='ACME',
+                                      job_url='https://example.com/job')
+        job.tags.set(self.tags[:2])
+        str(JobEntryForm())
+        with self.assertNumQueries(1):
+            html = str(JobEntryForm(instance=job))
+        self.assertEqual(html.count('checked'), 2)
+
+    def test_cached_ids_validate_without_queries(self):
+        str(JobEntryForm())
+        form = JobEntryForm(data=self.form_data(category=self.category.pk,
+                                                tags=[self.tags[0].pk, self.tags[1].pk]))
+        # Only the model's own ForeignKey check queries; the fields use the catalogs
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['category'], self.category)
+        self.assertEqual(form.cleaned_data['tags'], self.tags[:2])
+
+    def test_id_missing_from_catalog_is_looked_up(self):
+        str(JobEntryForm())
+        # bulk_create sends no post_save, like a tag created by another process
+        tag = Tag.objects.bulk_create([Tag(name='remote')])[0]
+        form = JobEntryForm(data=self.form_data(tags=[self.tags[0].pk, tag.pk]))
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['tags'], [self.tags[0], tag])
+
+    def test_unknown_and_malformed_ids_are_rejected(self):
+        for value in ('999999', 'abc'):
+            with self.subTest(value=value):
+                form = JobEntryForm(data=self.form_data(category=value, tags=[value]))
+                self.assertFalse(form.is_valid())
+                self.assertIn('category', form.errors)
+                self.assertIn('tags', form.errors)
+
+    def test_category_change_invalidates_catalog(self):
+        str(JobEntryForm())
+        Category.objects.create(name='Design')
+        self.assertIn('Design', str(JobEntryForm()))
+        self.category.name = 'Platform'
+        self.category.save()
+        html = str(JobEntryForm())
+        self.assertIn('Platform', html)
+        self.assertNotIn('Engineering', html)
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from jobs.metrics import Counter, Histogram, MetricsRegistry
+
+
+class MetricsEndpointTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='member', password='secret')
+        cls.staff = User.objects.create_user(username='staff', password='secret', is_staff=True)
+
+    def get_metrics(self, **headers):
+        return self.client.get(reverse('jobs:metrics'), **headers)
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_access(self):
+        self.assertEqual(self.get_metrics().status_code, 403)
+        self.assertEqual(self.get_metrics(HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self.get_metrics(HTTP_AUTHORIZATION='Bearer scrape-token').status_code, 200)
+        self.client.force_login(self.user)
+        self.assertEqual(self.get_metrics().status_code, 403)
+        self.client.force_login(self.staff)
+        self.assertEqual(self.get_metrics().status_code, 200)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_no_token_means_staff_only(self):
+        self.assertEqual(self.get_metrics(HTTP_AUTHORIZATION='Bearer ').status_code, 403)
+
+    def test_exposition_format(self):
+        self.client.force_login(self.staff)
+        self.client.get(reverse('jobs:statistics'))
+        response = self.get_metrics()
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        text = response.content.decode()
+        self.assertIn('# TYPE job_search_http_requests_total counter', text)
+        self.assertRegex(text, r'job_search_http_requests_total\{view="jobs:statistics",method="GET",status="200"\} \d+')
+        self.assertIn('# TYPE job_search_http_request_duration_seconds histogram', text)
+        self.assertRegex(text, r'job_search_table_rows\{table="jobs_jobentry"\} \d+')
+        # Every sample line is `name{labels} value`
+        for line in text.splitlines():
+            if not line.startswith('#'):
+                self.assertRegex(line, r'^[a-z_]+(\{.*\})? [-+\w.]+$')
+
+
+class MetricsRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.requests = Counter('test_requests_total', 'Requests.', ('view',), registry=self.registry)
+        self.latency = Histogram('test_latency_seconds', 'Latency.', buckets=(0.1, 1.0), registry=self.registry)
+
+    def test_histogram_buckets_are_cumulative(self):
+        for value in (0.05, 0.5, 5):
+            self.latency.observe(value)
+        text = self.registry.render()
+        self.assertIn('job_search_test_latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('job_search_test_latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('job_search_test_latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn('job_search_test_latency_seconds_count 3', text)
+        self.assertIn('job_search_test_latency_seconds_sum 5.55', text)
+
+    def test_label_values_are_escaped(self):
+        self.requests.inc(view='say "hi"\n')
+        self.assertIn(r'job_search_test_requests_total{view="say \"hi\"\n"} 1', self.registry.render())
+
+    def test_multiprocess_directory_sums_all_processes(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_MULTIPROC_DIR=directory):
+            # Another worker's flushed values
+            with open(os.path.join(directory, 'metrics_999999.json'), 'w') as f:
+                json.dump([['job_search_test_requests_total', [['view', 'home']], 4]], f)
+            self.requests.inc(2, view='home')
+            text = self.registry.render()
+            self.assertIn('job_search_test_requests_total{view="home"} 6', text)
+            self.assertTrue(os.path.exists(os.path.join(directory, f'metrics_{os.getpid()}.json')))
@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.models import Category, JobEntry, ResumeSubmissionStatus, Tag
+from jobs.testing import QueryBudgetTestMixin
+
+
+class MonthlyReportQueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    JOB_COUNT = 15
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='reporter', password='secret')
+        category = Category.objects.create(name='Engineering')
+        tags = [Tag.objects.create(name='remote'), Tag.objects.create(name='python')]
+        # Status dates may not precede the entry's creation
+        start = timezone.now() + timedelta(seconds=1)
+        for number in range(cls.JOB_COUNT):
+            job = JobEntry.objects.create(
+                user=cls.user, job_title=f'Developer {number}', employer='ACME',
+                job_url='https://example.com/job', category=category, status='applied',
+                # Every other entry is in the report only through its 'resume_sent' status
+                resume_submitted_date=start + timedelta(seconds=number) if number % 2 else None,
+            )
+            job.tags.set(tags)
+            ResumeSubmissionStatus.objects.create(
+                job_entry=job, status_type='resume_sent', date_time=start + timedelta(seconds=number)
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def test_api_monthly_report_within_budget(self):
+        response = self.assertViewQueryBudget(reverse('api_v1:monthly-report'))
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual(report['total_entries'], self.JOB_COUNT)
+        self.assertEqual([entry['job_title'] for entry in report['job_entries']],
+                         [f'Developer {number}' for number in range(self.JOB_COUNT)])
+        self.assertEqual(report['job_entries'][0]['category'], 'Engineering')
+        self.assertEqual(len(report['job_entries'][0]['tags']), 2)
+
+    def test_month_parameter(self):
+        now = timezone.now()
+        current = self.client.get(reverse('api_v1:monthly-report'), {'month': f'{now:%Y-%m}'}).json()
+        self.assertEqual((current['year'], current['month'], current['total_entries']),
+                         (now.year, now.month, self.JOB_COUNT))
+        earlier = self.client.get(reverse('api_v1:monthly-report'), {'month': f'{now.year - 1}-{now.month:02d}'})
+        self.assertEqual(earlier.json()['total_entries'], 0)
+        # The web views' ?year=&month= parameters work as well
+        other = self.client.get(reverse('api_v1:monthly-report'), {'year': now.year - 1, 'month': now.month})
+        self.assertEqual(other.json()['year'], now.year - 1)
@@ -0,0 +1,65 @@
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from jobs.db_routing import mark_recent_write, using_replica
+from jobs.models import JobEntry
+from jobs.testing import REPLICA_ALIAS, ReplicaTestMixin
+
+
+@skipUnless(REPLICA_ALIAS in settings.DATABASES, 'needs a SQLite primary or DATABASE_READ_URL')
+class ReadReplicaRoutingTests(ReplicaTestMixin, TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        # Recent-write markers live in the cache and outlive the flushed rows
+        cache.clear()
+        self.user = User.objects.create_user(username='reader', password='secret')
+        self.sync_replica()
+
+    def create_job(self, **fields):
+        return JobEntry.objects.create(user=self.user, job_title='Developer', employer='ACME',
+                                       job_url='https://example.com/job', **fields)
+
+    def test_reads_inside_using_replica_go_to_the_replica(self):
+        job = self.create_job()
+        cache.clear()
+        with using_replica(self.user) as alias:
+            self.assertEqual(alias, REPLICA_ALIAS)
+            self.assertFalse(JobEntry.objects.filter(pk=job.pk).exists())
+        self.sync_replica()
+        with using_replica(self.user):
+            self.assertEqual(JobEntry.objects.get(pk=job.pk)._state.db, REPLICA_ALIAS)
+
+    def test_reads_outside_using_replica_go_to_the_primary(self):
+        job = self.create_job()
+        self.assertEqual(JobEntry.objects.get(pk=job.pk)._state.db, 'default')
+
+    def test_writes_inside_using_replica_go_to_the_primary(self):
+        with using_replica(self.user):
+            job = self.create_job()
+        self.assertEqual(job._state.db, 'default')
+        self.assertTrue(JobEntry.objects.filter(pk=job.pk).exists())
+
+    def test_recent_writer_sticks_to_the_primary(self):
+        mark_recent_write(self.user)
+        with using_replica(self.user) as alias:
+            self.assertEqual(alias, 'default')
+        with using_replica(User(pk=self.user.pk + 1)) as alias:
+            self.assertEqual(alias, REPLICA_ALIAS)
+
+    def test_saving_a_job_marks_a_recent_write(self):
+        # The cache-invalidation signals pin the owner to the primary until the replica catches up
+        job = self.create_job()
+        with using_replica(self.user):
+            self.assertTrue(JobEntry.objects.filter(pk=job.pk).exists())
+
+    def test_statistics_view_reads_own_writes(self):
+        self.client.force_login(self.user)
+        self.create_job(status='applied')
+        response = self.client.get(reverse('api_v1:statistics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_jobs'], 1)
@@ -0,0 +1,54 @@
+from unittest import skipIf, skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+
+from jobs.models import JobEntry
+from jobs.search import SEARCH_INDEX_NAME, ensure_search_index, search_job_entries
+
+
+class SearchTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='searcher', password='secret')
+        for title, employer, email in (('Python Developer', 'ACME', 'jobs@acme.example'),
+                                       ('JavaScript Engineer', 'Initech', 'hr@gmail.example'),
+                                       ('Data Analyst', 'Globex', '')):
+            JobEntry.objects.create(user=cls.user, job_title=title, employer=employer,
+                                    job_url='https://example.com/job', contact_email=email,
+                                    contact_phone='+49 30 1234567' if employer == 'Globex' else '')
+
+    def search(self, query):
+        queryset = JobEntry.objects.filter(user=self.user)
+        return sorted(search_job_entries(queryset, query).values_list('employer', flat=True))
+
+    def test_empty_query_returns_everything(self):
+        self.assertEqual(self.search(''), ['ACME', 'Globex', 'Initech'])
+
+    def test_word_prefix(self):
+        self.assertEqual(self.search('dev'), ['ACME'])
+        self.assertEqual(self.search('DATA analyst'), ['Globex'])
+
+    def test_contact_fields_match_substrings(self):
+        self.assertEqual(self.search('gmail'), ['Initech'])
+        self.assertEqual(self.search('4567'), ['Globex'])
+
+
+@skipIf(connection.vendor == 'postgresql', 'substring search is the fallback of other databases')
+class SubstringSearchTests(SearchTestMixin, TestCase):
+    def test_matches_inside_words(self):
+        self.assertEqual(self.search('script'), ['Initech'])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'full-text search needs PostgreSQL')
+class FullTextSearchTests(SearchTestMixin, TestCase):
+    def test_matches_words_not_inner_substrings(self):
+        self.assertEqual(self.search('script'), [])
+        self.assertEqual(self.search('java'), ['Initech'])
+
+    def test_gin_index_exists(self):
+        ensure_search_index('default')
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, JobEntry._meta.db_table)
+        self.assertIn(SEARCH_INDEX_NAME, constraints)
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.caching import get_generation, user_namespace
+from jobs.models import JobEntry, Notification, ResumeSubmissionStatus
+
+
+def table_queries(context, table):
+    """SQL of the captured queries touching `table`"""
+    return [query['sql'] for query in context.captured_queries if f'"{table}"' in query['sql']]
+
+
+class NotificationUpsertTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='notified', password='secret')
+
+    def setUp(self):
+        self.job = JobEntry.objects.create(user=self.user, job_title='Developer', employer='ACME',
+                                           job_url='https://example.com/job',
+                                           interview_date=timezone.now() + timedelta(days=2))
+
+    def notifications(self):
+        return Notification.objects.filter(job_entry=self.job)
+
+    def test_new_date_creates_a_notification(self):
+        self.assertEqual(list(self.notifications().values_list('notification_type', flat=True)), ['interview'])
+
+    def test_unchanged_dates_skip_notification_queries(self):
+        self.job.notes = 'Called back'
+        with CaptureQueriesContext(connection) as context:
+            self.job.save()
+        self.assertEqual(table_queries(context, 'jobs_notification'), [])
+
+    def test_moved_date_updates_in_place_and_resets_is_read(self):
+        self.notifications().update(is_read=True)
+        self.job.interview_date += timedelta(days=1)
+        with CaptureQueriesContext(connection) as context:
+            self.job.save()
+        # One SELECT of the existing notifications and one UPDATE
+        self.assertEqual(len(table_queries(context, 'jobs_notification')), 2)
+        notification = self.notifications().get()
+        self.assertFalse(notification.is_read)
+        self.assertIn(self.job.interview_date.strftime('%Y-%m-%d %H:%M'), notification.message)
+
+    def test_cleared_date_deletes_the_notification(self):
+        self.job.interview_date = None
+        self.job.save()
+        self.assertFalse(self.notifications().exists())
+
+    def test_date_moved_into_the_past_deletes_the_notification(self):
+        self.job.interview_date = timezone.now() - timedelta(days=1)
+        self.job.save()
+        self.assertFalse(self.notifications().exists())
+
+
+class DeletionInvalidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='deleter', password='secret')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.job = JobEntry.objects.create(user=self.user, job_title='Developer', employer='ACME',
+                                           job_url='https://example.com/job')
+
+    def generation(self):
+        return get_generation(user_namespace(self.user))
+
+    def test_delete_all_notifications_is_one_query_and_one_bump(self):
+        for number in range(5):
+            Notification.objects.create(user=self.user, title=f'Notification {number}', message='Message')
+        generation = self.generation()
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(reverse('jobs:delete_all_notifications'))
+        self.assertEqual(len(table_queries(context, 'jobs_notification')), 1)
+        self.assertFalse(Notification.objects.filter(user=self.user).exists())
+        self.assertEqual(self.generation(), generation + 1)
+
+    def test_deleting_one_notification_invalidates(self):
+        notification = Notification.objects.create(user=self.user, title='Notification', message='Message')
+        generation = self.generation()
+        self.client.post(reverse('jobs:delete_notification', args=[notification.pk]))
+        self.assertGreater(self.generation(), generation)
+
+    def test_cascaded_statuses_do_not_look_up_their_entry(self):
+        start = timezone.now() + timedelta(seconds=1)
+        for number in range(5):
+            ResumeSubmissionStatus.objects.create(job_entry_id=self.job.pk, status_type='resume_sent',
+                                                  date_time=start + timedelta(seconds=number))
+        generation = self.generation()
+        with CaptureQueriesContext(connection) as context, self.captureOnCommitCallbacks(execute=True):
+            JobEntry.objects.get(pk=self.job.pk).delete()
+        # Loading the entry to delete, and one owner lookup for all statuses when the deletion commits
+        entry_lookups = [sql for sql in table_queries(context, 'jobs_jobentry') if sql.startswith('SELECT')]
+        self.assertLessEqual(len(entry_lookups), 2)
+        self.assertGreater(self.generation(), generation)
+
+    def test_deleting_a_status_invalidates_its_owner(self):
+        status = ResumeSubmissionStatus.objects.create(job_entry=self.job, status_type='resume_sent',
+                                                       date_time=timezone.now() + timedelta(seconds=1))
+        generation = self.generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            ResumeSubmissionStatus.objects.get(pk=status.pk).delete()
+        self.assertGreater(self.generation(), generation)
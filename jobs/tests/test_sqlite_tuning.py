@@ -0,0 +1,42 @@
+import os
+import tempfile
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connection, connections
+from django.test import SimpleTestCase
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite tuning')
+class SQLiteTuningTests(SimpleTestCase):
+    def setUp(self):
+        # A file database: in-memory test databases cannot use WAL
+        handle, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        for suffix in ('-wal', '-shm'):
+            self.addCleanup(lambda name=path + suffix: os.path.exists(name) and os.remove(name))
+        settings_dict = {**connections['default'].settings_dict, 'NAME': path}
+        self.wrapper = connections['default'].__class__(settings_dict, alias='sqlite_tuning')
+        self.addCleanup(self.wrapper.close)
+
+    def pragma(self, name):
+        with self.wrapper.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_to_new_connections(self):
+        self.assertEqual(self.pragma('journal_mode').upper(), settings.SQLITE_PRAGMAS['journal_mode'].upper())
+        # 1 = NORMAL, 2 = MEMORY
+        self.assertEqual(self.pragma('synchronous'), 1)
+        self.assertEqual(self.pragma('temp_store'), 2)
+        self.assertEqual(self.pragma('cache_size'), settings.SQLITE_PRAGMAS['cache_size'])
+        self.assertEqual(self.pragma('busy_timeout'), connections['default'].settings_dict['OPTIONS']['timeout'] * 1000)
+
+    def test_transactions_take_the_write_lock_up_front(self):
+        self.wrapper.ensure_connection()
+        self.assertEqual(self.wrapper.transaction_mode, 'IMMEDIATE')
+
+    def test_connections_are_reused(self):
+        self.assertEqual(connections['default'].settings_dict['CONN_MAX_AGE'], settings.DB_CONN_MAX_AGE)
+        self.assertTrue(connections['default'].settings_dict['CONN_HEALTH_CHECKS'])
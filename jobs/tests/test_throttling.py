@@ -0,0 +1,116 @@
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.throttling import SimpleRateThrottle
+
+from jobs.models import ThrottleCounter
+from jobs.throttling import SlidingWindowRateThrottle, throttle_scope
+
+
+class ClockThrottle(SlidingWindowRateThrottle):
+    """4 requests per minute for one client, at the time set in `now`"""
+    rate = '4/min'
+    now = 6000.0
+
+    def get_cache_key(self, request, view):
+        return 'throttle_test'
+
+    def timer(self):
+        return self.now
+
+
+def allowed(now, count):
+    """Send `count` requests at `now`; return how many passed and the last throttle"""
+    passed = 0
+    for _ in range(count):
+        throttle = ClockThrottle()
+        throttle.now = now
+        passed += throttle.allow_request(None, None)
+    return passed, throttle
+
+
+class SlidingWindowTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_limit_within_one_window(self):
+        passed, throttle = allowed(6000, 6)
+        self.assertEqual(passed, 4)
+        # Full on its own: wait for the next window
+        self.assertEqual(throttle.wait(), 60)
+
+    def test_previous_window_is_weighted_by_its_overlap(self):
+        allowed(6000, 4)
+        # 6 seconds into the next window 90% of the previous one still counts: 3.6 + 1 reaches 4
+        passed, throttle = allowed(6066, 3)
+        self.assertEqual(passed, 1)
+        # 4 * (1 - elapsed / 60) + 1 < 4 once more than 15 seconds have passed
+        self.assertAlmostEqual(throttle.wait(), 9)
+        passed, _ = allowed(6076, 1)
+        self.assertEqual(passed, 1)
+
+    def test_old_windows_do_not_count(self):
+        allowed(6000, 4)
+        passed, _ = allowed(6120, 5)
+        self.assertEqual(passed, 4)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                                       'LOCATION': tempfile.mkdtemp()}})
+class DatabaseCounterTests(SlidingWindowTests):
+    """File and db caches have no atomic incr(): the counters are kept in ThrottleCounter rows"""
+
+    def test_counters_are_rows(self):
+        allowed(6000, 3)
+        self.assertEqual(ThrottleCounter.objects.get(key='throttle_test_100').value, 3)
+        self.assertIsNone(cache.get('throttle_test_100'))
+
+    def test_expired_windows_are_deleted(self):
+        ThrottleCounter.objects.create(key='other_client_1', value=3, expires_at=timezone.now() - timedelta(1))
+        allowed(6000, 1)
+        self.assertEqual(list(ThrottleCounter.objects.values_list('key', flat=True)), ['throttle_test_100'])
+
+
+class ThrottledViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='throttled', password='secret')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        rates = mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {'statistics': '2/hour', 'pdf': '1/hour'})
+        rates.start()
+        self.addCleanup(rates.stop)
+
+    def test_api_scope_returns_429(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get(reverse('api_v1:statistics')).status_code, 200)
+        response = self.client.get(reverse('api_v1:statistics'))
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        # Other scopes have their own counters and rates
+        self.assertEqual(self.client.get(reverse('api_v1:monthly-report')).status_code, 200)
+
+    def test_scope_is_per_user(self):
+        for _ in range(3):
+            self.client.get(reverse('api_v1:statistics'))
+        self.client.force_login(User.objects.create_user(username='other', password='secret'))
+        self.assertEqual(self.client.get(reverse('api_v1:statistics')).status_code, 200)
+
+    def test_throttle_scope_decorator(self):
+        view = throttle_scope('pdf')(lambda request: HttpResponse('pdf'))
+        request = RequestFactory().get('/statistics/pdf/')
+        request.user = self.user
+        self.assertEqual(view(request).status_code, 200)
+        response = view(request)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertGreater(int(response['Retry-After']), 0)
@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from jobs.timing import LatencyHistogram, server_timing_header, timed, timing_scope, timing_stats
+
+
+class ServerTimingHeaderTests(SimpleTestCase):
+    def test_format(self):
+        header = server_timing_header(0.0125, {'db': 0.004, 'cache': 0.0, 'template': 0.002}, query_count=3)
+        self.assertEqual(header, 'db;dur=4.00;desc="3 queries", template;dur=2.00, total;dur=12.50')
+
+    def test_timed_adds_to_the_current_scope_only(self):
+        with timed('pdf'):
+            pass
+        with timing_scope() as timings:
+            with timed('pdf'):
+                pass
+        self.assertGreater(timings['pdf'], 0)
+        self.assertEqual(timings['db'], 0)
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.observe(value)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['mean_ms'], 50.5)
+        # Buckets are 25% apart
+        self.assertAlmostEqual(summary['p50_ms'], 50, delta=50 * 0.25)
+        self.assertAlmostEqual(summary['p99_ms'], 99, delta=99 * 0.25)
+
+
+class ServerTimingMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='member', password='secret')
+        cls.staff = User.objects.create_user(username='staff', password='secret', is_staff=True)
+
+    def setUp(self):
+        timing_stats.reset()
+        self.addCleanup(timing_stats.reset)
+
+    def test_header_for_staff(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('jobs:statistics'))
+        self.assertRegex(response['Server-Timing'], r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(response['Server-Timing'], r'template;dur=[\d.]+')
+        self.assertRegex(response['Server-Timing'], r'total;dur=[\d.]+$')
+
+    def test_no_header_for_other_users(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('jobs:statistics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response)
+
+    def test_requests_are_recorded_per_view(self):
+        self.client.force_login(self.user)
+        for _ in range(2):
+            self.client.get(reverse('jobs:statistics'))
+        stats = timing_stats.snapshot()['jobs:statistics']
+        self.assertEqual(stats['total']['count'], 2)
+        self.assertEqual(set(stats), {'total', 'db', 'cache', 'template', 'pdf'})
+
+    def test_timing_stats_are_staff_only(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(reverse('jobs:request_timing_stats')).status_code, 302)
+        self.client.force_login(self.staff)
+        self.client.get(reverse('jobs:statistics'))
+        response = self.client.get(reverse('jobs:request_timing_stats'))
+        self.assertIn('jobs:statistics', response.json()['views'])
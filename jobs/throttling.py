@@ -0,0 +1,156 @@
+"""
+Sliding window counter rate limits with O(1) state per client.
+
+DRF's throttles keep a list of request timestamps per client and rewrite the whole
+list on every request, so each check costs O(limit). They also keep it in whatever
+cache is configured, which is per process with LocMemCache. The throttles here keep
+two integer counters per client and scope: the current fixed window and the
+previous one. The request count over the last `duration` seconds is estimated by
+weighting the previous window by how much of it still overlaps:
+
+    previous * (1 - elapsed / duration) + current
+
+A check is one get_many() and one incr() on the default cache, which is atomic on
+Redis and memcached. The file and db backends implement incr() and add() as a read
+followed by a write, so concurrent requests would lose increments there. With those
+backends the counters live in database rows instead (ThrottleCounter), incremented
+atomically with F() expressions like the cache generations in jobs.caching.
+LocMemCache is atomic but per process: use a shared CACHE_BACKEND with several
+workers.
+
+Scopes and rates come from REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] as with DRF.
+API views opt into a scope with `throttle_scope`; plain Django views with the
+@throttle_scope() decorator. Both share the same counters for a scope.
+"""
+import math
+from datetime import timedelta
+from functools import wraps
+from types import SimpleNamespace
+
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import F
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.translation import gettext
+from rest_framework import throttling
+
+from .caching import NON_ATOMIC_BACKENDS
+
+
+class SlidingWindowRateThrottle(throttling.SimpleRateThrottle):
+    """SimpleRateThrottle counting requests in a sliding window (two counters per key)"""
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = f'{self.key}_{window}'
+        previous_key = f'{self.key}_{window - 1}'
+        counts = self._get_counts([previous_key, current_key])
+        previous = counts.get(previous_key, 0)
+        current = counts.get(current_key, 0)
+        elapsed = self.now - window * self.duration
+        previous_weight = 1 - elapsed / self.duration
+
+        if previous * previous_weight + current >= self.num_requests:
+            if current >= self.num_requests:
+                # Full on its own: wait for the next window
+                self._wait = self.duration - elapsed
+            else:
+                # Wait until enough of the previous window has slid out
+                self._wait = self.duration * (1 - (self.num_requests - current) / previous) - elapsed
+            return self.throttle_failure()
+
+        self._increment(current_key)
+        return True
+
+    def _atomic_cache(self):
+        """Whether the counters can be kept in the cache backend itself"""
+        return not isinstance(caches['default'], NON_ATOMIC_BACKENDS)
+
+    def _get_counts(self, keys):
+        """Return {key: count} for the windows `keys` that have requests"""
+        if self._atomic_cache():
+            return self.cache.get_many(keys)
+        from .models import ThrottleCounter
+        # Always the primary: a lagging replica would undercount
+        return dict(ThrottleCounter.objects.using(DEFAULT_DB_ALIAS).filter(
+            key__in=keys, expires_at__gt=timezone.now()
+        ).values_list('key', 'value'))
+
+    def _increment(self, key):
+        """Count a request in the window `key`; it is read again while it is the previous window"""
+        if not self._atomic_cache():
+            self._increment_row(key)
+            return
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # First request of the window (incr() raises for missing keys)
+            if not self.cache.add(key, 1, self.duration * 2):
+                self.cache.incr(key)
+
+    def _increment_row(self, key):
+        from .models import ThrottleCounter
+        counters = ThrottleCounter.objects.using(DEFAULT_DB_ALIAS)
+        if counters.filter(key=key).update(value=F('value') + 1):
+            return
+        now = timezone.now()
+        # First request of the window: drop the windows that have slid out, for all clients
+        counters.filter(expires_at__lte=now).delete()
+        try:
+            with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                counters.create(key=key, value=1, expires_at=now + timedelta(seconds=self.duration * 2))
+        except IntegrityError:
+            # Another request created it first
+            counters.filter(key=key).update(value=F('value') + 1)
+
+    def wait(self):
+        return max(getattr(self, '_wait', self.duration), 0)
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, SlidingWindowRateThrottle):
+    """Limits anonymous requests per IP address (scope 'anon')"""
+
+
+class UserRateThrottle(throttling.UserRateThrottle, SlidingWindowRateThrottle):
+    """Limits requests per user, or per IP address for anonymous requests (scope 'user')"""
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, SlidingWindowRateThrottle):
+    """Limits requests per user to views with a `throttle_scope`, by that scope's rate"""
+
+
+def throttle_scope(scope):
+    """
+    Decorator applying a throttle scope's rate to a plain Django view.
+
+    Args:
+        scope: Key in REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] (e.g. 'pdf')
+
+    Returns 429 Too Many Requests with a Retry-After header when the rate is exceeded.
+    """
+    def decorator(view_func):
+        view_scope = SimpleNamespace(throttle_scope=scope)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            throttle = ScopedRateThrottle()
+            if not throttle.allow_request(request, view_scope):
+                wait = math.ceil(throttle.wait())
+                response = HttpResponse(
+                    gettext('Too many requests. Please try again in %(seconds)d seconds.') % {'seconds': wait},
+                    status=429, content_type='text/plain; charset=utf-8'
+                )
+                response['Retry-After'] = str(wait)
+                return response
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,192 @@
+"""
+Request timing instrumentation.
+
+ServerTimingMiddleware opens a timing scope per request. Code inside it adds
+elapsed time to named categories with timed('<category>'):
+    db       - SQL queries (connection.execute_wrapper)
+    cache    - cache backend calls made through jobs.caching
+    template - template rendering (TimedDjangoTemplates backend)
+    pdf      - ReportLab document builds
+Categories can overlap (e.g. a lazy queryset evaluated while rendering counts
+as both db and template time).
+
+Per-request timings are sent as a Server-Timing header and aggregated in
+process into per-view latency histograms (timing_stats).
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.template.backends.django import DjangoTemplates
+
+
+TIMING_CATEGORIES = ('db', 'cache', 'template', 'pdf')
+
+# Histogram bucket upper bounds in milliseconds, roughly 25% apart (interpolated
+# percentiles are within a few percent), plus an overflow bucket
+LATENCY_BUCKETS_MS = tuple(round(0.5 * 1.25 ** i, 3) for i in range(50)) + (float('inf'),)
+
+_current_timings = ContextVar('jobs_request_timings', default=None)
+
+
+@contextmanager
+def timing_scope():
+    """Collect timed() measurements made inside the block into the yielded dict"""
+    timings = dict.fromkeys(TIMING_CATEGORIES, 0.0)
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def add_timing(category, seconds):
+    """Add elapsed seconds to a category of the current timing scope (no-op outside one)"""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings[category] = timings.get(category, 0.0) + seconds
+
+
+@contextmanager
+def timed(category):
+    """Measure the block and add its duration to `category` of the current request"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_timing(category, time.perf_counter() - started)
+
+
+class TimedCache:
+    """Proxy around a cache backend that times every call as 'cache'"""
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def __getattr__(self, name):
+        attribute = getattr(self._backend, name)
+        if not callable(attribute):
+            return attribute
+
+        def timed_call(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                add_timing('cache', time.perf_counter() - started)
+        return timed_call
+
+
+class _TimedTemplate:
+    """Template wrapper timing render() as 'template'"""
+
+    def __init__(self, template):
+        self._template = template
+
+    def __getattr__(self, name):
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        with timed('template'):
+            return self._template.render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Django template backend whose templates report their render time"""
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super().get_template(template_name))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds); not thread-safe on its own"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, fraction):
+        """Estimate a percentile by linear interpolation inside its bucket"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                if upper == float('inf'):
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-2]
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.sum / self.count, 2) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50), 2),
+            'p95_ms': round(self.percentile(0.95), 2),
+            'p99_ms': round(self.percentile(0.99), 2),
+        }
+
+
+class ViewTimingStats:
+    """Per-view histograms of total request time and of each timing category"""
+
+    def __init__(self):
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def record(self, view_name, total_seconds, timings):
+        with self._lock:
+            histograms = self._views.get(view_name)
+            if histograms is None:
+                histograms = self._views[view_name] = {
+                    name: LatencyHistogram() for name in ('total',) + TIMING_CATEGORIES
+                }
+            histograms['total'].observe(total_seconds * 1000)
+            for category in TIMING_CATEGORIES:
+                histograms[category].observe(timings.get(category, 0.0) * 1000)
+
+    def snapshot(self):
+        """{view_name: {'total': summary, 'db': summary, ...}}, slowest p95 first"""
+        with self._lock:
+            result = {
+                view_name: {name: histogram.summary() for name, histogram in histograms.items()}
+                for view_name, histograms in self._views.items()
+            }
+        return dict(sorted(result.items(), key=lambda item: item[1]['total']['p95_ms'], reverse=True))
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+timing_stats = ViewTimingStats()
+
+
+def server_timing_header(total_seconds, timings, query_count=None):
+    """Format request timings as a Server-Timing header value"""
+    metrics = []
+    for category in TIMING_CATEGORIES:
+        duration = timings.get(category, 0.0)
+        if duration:
+            metric = f'{category};dur={duration * 1000:.2f}'
+            if category == 'db' and query_count is not None:
+                metric += f';desc="{query_count} queries"'
+            metrics.append(metric)
+    metrics.append(f'total;dur={total_seconds * 1000:.2f}')
+    return ', '.join(metrics)
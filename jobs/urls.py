@@ -34,6 +34,8 @@ urlpatterns = [
     
     # Calendar
     path('calendar/', views.calendar_view, name='calendar'),
+    path('calendar.ics', views.calendar_feed, name='calendar_feed'),
+    path('calendar/feed/reset/', views.reset_calendar_feed, name='reset_calendar_feed'),
     
     # Templates
     path('templates/', views.job_templates, name='job_templates'),
@@ -68,5 +70,10 @@ urlpatterns = [
     path('tags/create/', views.create_tag, name='create_tag'),
     path('tags/<int:tag_id>/edit/', views.edit_tag, name='edit_tag'),
     path('tags/<int:tag_id>/delete/', views.delete_tag, name='delete_tag'),
+    
+    # Diagnostics (staff only)
+    path('diagnostics/cache/', views.cache_stats, name='cache_stats'),
+    path('diagnostics/timing/', views.request_timing_stats, name='request_timing_stats'),
+    path('metrics', views.prometheus_metrics, name='metrics'),
 ]
 
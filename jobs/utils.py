@@ -1,10 +1,12 @@
-from django.db.models import Count, Avg
+from django.db.models import Count, Avg, Q
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime, parse_date
 from django.utils.formats import date_format
-from django.utils.translation import gettext as translation_gettext
+from django.utils.translation import gettext as translation_gettext, get_language
 from datetime import timedelta
-from .models import JobEntry, ResumeSubmissionStatus
+from .models import JobEntry, JobEvent, ResumeSubmissionStatus, Notification
+from .caching import get_or_set_user_cache, tiered_cache, CHOICES_NAMESPACE
+from .async_db import gather_queries
 
 
 def sync_status_from_resume_status(job_entry, resume_status_type):
@@ -204,162 +206,221 @@ def get_user_display_name(user):
     return user.username
 
 
-def get_statistics_data(user_jobs):
+def get_unread_notifications_count(user):
     """
-    Calculate statistics for user's job entries.
-    Returns a dictionary with all statistics.
-    """
-    now = timezone.now()
-    week_ago = now - timedelta(days=7)
-    month_ago = now - timedelta(days=30)
-    year_ago = now - timedelta(days=365)
-    
-    # General statistics
-    total_jobs = user_jobs.count()
-    
-    # Statistics by category, priority, work type, source
-    category_stats = list(user_jobs.values('category__name').annotate(count=Count('id')).order_by('-count'))
-    priority_stats = list(user_jobs.values('priority').annotate(count=Count('id')).order_by('priority'))
-    work_type_stats = list(user_jobs.values('work_type').annotate(count=Count('id')).order_by('-count'))
-    source_stats = list(user_jobs.values('source').annotate(count=Count('id')).order_by('-count'))
+    Get count of user's unread notifications (cached per user data generation)
     
-    # Status statistics
+    Args:
+        user: User instance
+        
+    Returns:
+        int: Number of unread notifications
+    """
+    return get_or_set_user_cache(
+        user, 'notifications_count',
+        lambda: Notification.objects.filter(user=user, is_read=False).count()
+    )
+
+
+def _statistics_breakdowns(user_jobs, user, now):
+    """Totals and per-category/priority/work type/source/status/employer counts"""
     status_stats = user_jobs.values('status').annotate(count=Count('id')).order_by('status')
-    status_dict = {item['status']: item['count'] for item in status_stats}
-    
-    not_applied = status_dict.get('not_applied', 0)
-    applied = status_dict.get('applied', 0)
-    confirmed = status_dict.get('confirmed', 0)
-    response_received = status_dict.get('response_received', 0)
-    rejected = status_dict.get('rejected', 0)
-    accepted = status_dict.get('accepted', 0)
-    
-    # Flag-based statistics
-    resume_submitted_count = user_jobs.filter(resume_submitted=True).count()
-    application_confirmed_count = user_jobs.filter(application_confirmed=True).count()
-    response_received_count = user_jobs.filter(response_received=True).count()
-    rejection_received_count = user_jobs.filter(rejection_received=True).count()
-    
-    # Time-based statistics
-    jobs_last_week = user_jobs.filter(created_at__gte=week_ago).count()
-    jobs_last_month = user_jobs.filter(created_at__gte=month_ago).count()
-    jobs_last_year = user_jobs.filter(created_at__gte=year_ago).count()
-    
-    # Resume submission statistics
-    resumes_submitted_last_week = user_jobs.filter(
-        resume_submitted=True,
-        resume_submitted_date__gte=week_ago
-    ).count()
-    resumes_submitted_last_month = user_jobs.filter(
-        resume_submitted=True,
-        resume_submitted_date__gte=month_ago
-    ).count()
-    resumes_submitted_last_year = user_jobs.filter(
-        resume_submitted=True,
-        resume_submitted_date__gte=year_ago
-    ).count()
-    
-    # Response statistics
-    responses_last_week = user_jobs.filter(
-        response_received=True,
-        response_date__gte=week_ago
-    ).count()
-    responses_last_month = user_jobs.filter(
-        response_received=True,
-        response_date__gte=month_ago
-    ).count()
-    responses_last_year = user_jobs.filter(
-        response_received=True,
-        response_date__gte=year_ago
-    ).count()
-    
-    # Rejection statistics
-    rejections_last_week = user_jobs.filter(
-        rejection_received=True,
-        rejection_date__gte=week_ago
-    ).count()
-    rejections_last_month = user_jobs.filter(
-        rejection_received=True,
-        rejection_date__gte=month_ago
-    ).count()
-    rejections_last_year = user_jobs.filter(
-        rejection_received=True,
-        rejection_date__gte=year_ago
-    ).count()
-    
-    # Success and rejection rates
-    success_rate = round((accepted / resume_submitted_count) * 100, 1) if resume_submitted_count > 0 else 0
-    rejection_rate = round((rejection_received_count / resume_submitted_count) * 100, 1) if resume_submitted_count > 0 else 0
-    
-    # Top employers
-    top_employers = list(user_jobs.values('employer').annotate(
-        count=Count('id')
-    ).order_by('-count')[:10])
-    
-    # Monthly statistics (last 12 months)
-    monthly_stats = []
-    for i in range(11, -1, -1):
-        month_start = now - timedelta(days=30 * i)
-        month_end = month_start + timedelta(days=30)
-        month_jobs = user_jobs.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
+    return {
+        'total_jobs': user_jobs.count(),
+        'category_stats': list(user_jobs.values('category__name').annotate(count=Count('id')).order_by('-count')),
+        'priority_stats': list(user_jobs.values('priority').annotate(count=Count('id')).order_by('priority')),
+        'work_type_stats': list(user_jobs.values('work_type').annotate(count=Count('id')).order_by('-count')),
+        'source_stats': list(user_jobs.values('source').annotate(count=Count('id')).order_by('-count')),
+        'status_dict': {item['status']: item['count'] for item in status_stats},
+        'top_employers': list(user_jobs.values('employer').annotate(count=Count('id')).order_by('-count')[:10]),
+    }
+
+
+def _statistics_flags(user_jobs, user, now):
+    """Flag-based counts"""
+    return {
+        'resume_submitted_count': user_jobs.filter(resume_submitted=True).count(),
+        'application_confirmed_count': user_jobs.filter(application_confirmed=True).count(),
+        'response_received_count': user_jobs.filter(response_received=True).count(),
+        'rejection_received_count': user_jobs.filter(rejection_received=True).count(),
+    }
+
+
+def _statistics_periods(user_jobs, user, now):
+    """Created/submitted/response/rejection counts for the last week, month and year"""
+    periods = {
+        'last_week': now - timedelta(days=7),
+        'last_month': now - timedelta(days=30),
+        'last_year': now - timedelta(days=365),
+    }
+    data = {}
+    for period, since in periods.items():
+        data[f'jobs_{period}'] = user_jobs.filter(created_at__gte=since).count()
+    for period, since in periods.items():
+        data[f'resumes_submitted_{period}'] = user_jobs.filter(
+            resume_submitted=True,
+            resume_submitted_date__gte=since
+        ).count()
+    for period, since in periods.items():
+        data[f'responses_{period}'] = user_jobs.filter(
+            response_received=True,
+            response_date__gte=since
+        ).count()
+    for period, since in periods.items():
+        data[f'rejections_{period}'] = user_jobs.filter(
+            rejection_received=True,
+            rejection_date__gte=since
         ).count()
+    return data
+
+
+def _statistics_monthly(user_jobs, user, now):
+    """Entries created per 30-day month over the last 12 months"""
+    # One conditional aggregate instead of a COUNT query per month
+    month_starts = [now - timedelta(days=30 * i) for i in range(11, -1, -1)]
+    month_counts = user_jobs.aggregate(**{
+        f'month_{index}': Count('id', filter=Q(
+            created_at__gte=month_start,
+            created_at__lt=month_start + timedelta(days=30)
+        ))
+        for index, month_start in enumerate(month_starts)
+    })
+    monthly_stats = []
+    for index, month_start in enumerate(month_starts):
         monthly_stats.append({
             'month': month_start.strftime('%Y-%m'),
-            'count': month_jobs
+            'count': month_counts[f'month_{index}']
         })
-    
-    # Salary statistics
+    return {'monthly_stats': monthly_stats}
+
+
+def _statistics_salary(user_jobs, user, now):
+    """Average salary range of entries with a salary"""
     jobs_with_salary = user_jobs.exclude(salary_min__isnull=True)
-    avg_salary_min = jobs_with_salary.aggregate(avg=Avg('salary_min'))['avg'] or 0
-    avg_salary_max = jobs_with_salary.aggregate(avg=Avg('salary_max'))['avg'] or 0
+    return {
+        'avg_salary_min': jobs_with_salary.aggregate(avg=Avg('salary_min'))['avg'] or 0,
+        'avg_salary_max': jobs_with_salary.aggregate(avg=Avg('salary_max'))['avg'] or 0,
+    }
+
+
+def _statistics_upcoming(user_jobs, user, now):
+    """Upcoming interviews, follow-ups and deadlines"""
+    # One range scan of the JobEvent (user, at) index from the start of today
+    # (deadlines are stored at midnight and count for the whole day)
+    if user is not None:
+        events = JobEvent.objects.filter(user=user)
+    else:
+        events = JobEvent.objects.filter(job_entry__in=user_jobs)
+    today_start = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+    upcoming = events.filter(at__gte=today_start).aggregate(
+        interviews=Count('id', filter=Q(kind='interview', at__gte=now)),
+        follow_ups=Count('id', filter=Q(kind='follow_up', at__gte=now)),
+        deadlines=Count('id', filter=Q(kind='deadline')),
+    )
+    return {
+        'upcoming_interviews': upcoming['interviews'],
+        'upcoming_follow_ups': upcoming['follow_ups'],
+        'upcoming_deadlines': upcoming['deadlines'],
+    }
+
+
+# Independent parts of get_statistics_data: each takes (user_jobs, user, now) and
+# returns a dict; none reads another's result, so they can run in any order or concurrently
+STATISTICS_BLOCKS = (
+    _statistics_breakdowns,
+    _statistics_flags,
+    _statistics_periods,
+    _statistics_monthly,
+    _statistics_salary,
+    _statistics_upcoming,
+)
+
+
+def build_statistics_data(parts):
+    """
+    Combine the results of STATISTICS_BLOCKS into the statistics dictionary.
+
+    Args:
+        parts: Dictionaries returned by the blocks, in any order
+    """
+    values = {}
+    for part in parts:
+        values.update(part)
+    status_dict = values['status_dict']
+    accepted = status_dict.get('accepted', 0)
+    resume_submitted_count = values['resume_submitted_count']
+    rejection_received_count = values['rejection_received_count']
     
-    # Upcoming events
-    upcoming_interviews = user_jobs.filter(interview_date__gte=now).exclude(interview_date__isnull=True).count()
-    upcoming_follow_ups = user_jobs.filter(follow_up_date__gte=now).exclude(follow_up_date__isnull=True).count()
-    upcoming_deadlines = user_jobs.filter(application_deadline__gte=now.date()).exclude(application_deadline__isnull=True).count()
+    # Success and rejection rates
+    success_rate = round((accepted / resume_submitted_count) * 100, 1) if resume_submitted_count > 0 else 0
+    rejection_rate = round((rejection_received_count / resume_submitted_count) * 100, 1) if resume_submitted_count > 0 else 0
     
     return {
-        'total_jobs': total_jobs,
-        'not_applied': not_applied,
-        'applied': applied,
-        'confirmed': confirmed,
-        'response_received': response_received,
-        'rejected': rejected,
+        'total_jobs': values['total_jobs'],
+        'not_applied': status_dict.get('not_applied', 0),
+        'applied': status_dict.get('applied', 0),
+        'confirmed': status_dict.get('confirmed', 0),
+        'response_received': status_dict.get('response_received', 0),
+        'rejected': status_dict.get('rejected', 0),
         'accepted': accepted,
         'resume_submitted_count': resume_submitted_count,
-        'application_confirmed_count': application_confirmed_count,
-        'response_received_count': response_received_count,
+        'application_confirmed_count': values['application_confirmed_count'],
+        'response_received_count': values['response_received_count'],
         'rejection_received_count': rejection_received_count,
-        'jobs_last_week': jobs_last_week,
-        'jobs_last_month': jobs_last_month,
-        'jobs_last_year': jobs_last_year,
-        'resumes_submitted_last_week': resumes_submitted_last_week,
-        'resumes_submitted_last_month': resumes_submitted_last_month,
-        'resumes_submitted_last_year': resumes_submitted_last_year,
-        'responses_last_week': responses_last_week,
-        'responses_last_month': responses_last_month,
-        'responses_last_year': responses_last_year,
-        'rejections_last_week': rejections_last_week,
-        'rejections_last_month': rejections_last_month,
-        'rejections_last_year': rejections_last_year,
+        'jobs_last_week': values['jobs_last_week'],
+        'jobs_last_month': values['jobs_last_month'],
+        'jobs_last_year': values['jobs_last_year'],
+        'resumes_submitted_last_week': values['resumes_submitted_last_week'],
+        'resumes_submitted_last_month': values['resumes_submitted_last_month'],
+        'resumes_submitted_last_year': values['resumes_submitted_last_year'],
+        'responses_last_week': values['responses_last_week'],
+        'responses_last_month': values['responses_last_month'],
+        'responses_last_year': values['responses_last_year'],
+        'rejections_last_week': values['rejections_last_week'],
+        'rejections_last_month': values['rejections_last_month'],
+        'rejections_last_year': values['rejections_last_year'],
         'success_rate': success_rate,
         'rejection_rate': rejection_rate,
-        'top_employers': top_employers,
-        'monthly_stats': monthly_stats,
-        'category_stats': category_stats,
-        'priority_stats': priority_stats,
-        'work_type_stats': work_type_stats,
-        'source_stats': source_stats,
-        'avg_salary_min': round(avg_salary_min, 2),
-        'avg_salary_max': round(avg_salary_max, 2),
-        'upcoming_interviews': upcoming_interviews,
-        'upcoming_follow_ups': upcoming_follow_ups,
-        'upcoming_deadlines': upcoming_deadlines,
+        'top_employers': values['top_employers'],
+        'monthly_stats': values['monthly_stats'],
+        'category_stats': values['category_stats'],
+        'priority_stats': values['priority_stats'],
+        'work_type_stats': values['work_type_stats'],
+        'source_stats': values['source_stats'],
+        'avg_salary_min': round(values['avg_salary_min'], 2),
+        'avg_salary_max': round(values['avg_salary_max'], 2),
+        'upcoming_interviews': values['upcoming_interviews'],
+        'upcoming_follow_ups': values['upcoming_follow_ups'],
+        'upcoming_deadlines': values['upcoming_deadlines'],
     }
 
 
+def get_statistics_data(user_jobs, user=None):
+    """
+    Calculate statistics for user's job entries.
+    Returns a dictionary with all statistics.
+    
+    Args:
+        user_jobs: The user's JobEntry queryset
+        user: Owner of the entries; lets upcoming events use the JobEvent index directly
+    """
+    now = timezone.now()
+    return build_statistics_data(block(user_jobs, user, now) for block in STATISTICS_BLOCKS)
+
+
+async def aget_statistics_data(user_jobs, user=None):
+    """
+    Async get_statistics_data(): the statistics blocks run concurrently, each on its own connection.
+    
+    Args:
+        user_jobs: The user's JobEntry queryset
+        user: Owner of the entries
+    """
+    now = timezone.now()
+    parts = await gather_queries(*((block, user_jobs, user, now) for block in STATISTICS_BLOCKS))
+    return build_statistics_data(parts)
+
+
 def format_date_string(date_str):
     """Format date string to readable format"""
     if not date_str or date_str == 'None' or date_str == '':
@@ -383,7 +444,16 @@ def translate_choice_value(field_name, value):
     if not value or value == '' or value == 'None':
         return None
     
-    translations = {
+    translations = tiered_cache.get_or_set(
+        CHOICES_NAMESPACE, 'translations', _build_choice_translations,
+        timeout=3600, parts=(get_language() or 'en',)
+    )
+    return translations.get(field_name, {}).get(value, value)
+
+
+def _build_choice_translations():
+    """Build choice value translations for the active language"""
+    return {
         'status': {
             'not_applied': translation_gettext('Not Applied'),
             'applied': translation_gettext('Applied'),
@@ -417,8 +487,6 @@ def translate_choice_value(field_name, value):
             'other': translation_gettext('Other'),
         },
     }
-    
-    return translations.get(field_name, {}).get(value, value)
 
 
 def format_history_item(history_item):
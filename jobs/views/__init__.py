@@ -10,7 +10,7 @@ from .view_jobs import (
 from .view_statistics import (
     statistics, download_statistics_pdf, monthly_report, monthly_report_pdf
 )
-from .view_calendar import calendar_view
+from .view_calendar import calendar_view, calendar_feed, reset_calendar_feed
 from .view_templates import (
     job_templates, create_from_template, edit_template, delete_template
 )
@@ -23,6 +23,7 @@ from .view_categories import (
     categories_list, create_category, edit_category, delete_category
 )
 from .view_tags import tags_list, create_tag, edit_tag, delete_tag
+from .view_diagnostics import cache_stats, request_timing_stats, prometheus_metrics
 
 __all__ = [
     # Auth
@@ -33,7 +34,7 @@ __all__ = [
     # Statistics
     'statistics', 'download_statistics_pdf', 'monthly_report', 'monthly_report_pdf',
     # Calendar
-    'calendar_view',
+    'calendar_view', 'calendar_feed', 'reset_calendar_feed',
     # Templates
     'job_templates', 'create_from_template', 'edit_template', 'delete_template',
     # Attachments
@@ -46,5 +47,9 @@ __all__ = [
     'categories_list', 'create_category', 'edit_category', 'delete_category',
     # Tags
     'tags_list', 'create_tag', 'edit_tag', 'delete_tag',
+    # Diagnostics
+    'cache_stats',
+    'request_timing_stats',
+    'prometheus_metrics',
 ]
 
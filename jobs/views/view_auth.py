@@ -8,6 +8,7 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import login, authenticate
 from ..models import JobEntry
 from ..forms import UserRegistrationForm
+from ..caching import get_or_set_user_cache
 
 
 def register(request):
@@ -43,7 +44,7 @@ def dashboard(request):
     
     context = {
         'job_entries': job_entries,
-        'jobs_count': user_jobs.count(),
+        'jobs_count': get_or_set_user_cache(request.user, 'jobs_count', user_jobs.count),
     }
     return render(request, 'jobs/dashboard.html', context)
 
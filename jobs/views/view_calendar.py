@@ -1,41 +1,96 @@
+from datetime import datetime, time
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, JsonResponse, Http404, StreamingHttpResponse
 from django.db.models import Q
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext_lazy as _
-from ..models import JobEntry
+from django.views.decorators.http import condition, require_GET, require_POST
+from ..calendar_feed import (get_calendar_token, reset_calendar_token, resolve_calendar_token,
+                             feed_validators, iter_calendar_feed)
+from ..events import EVENT_FIELDS
+from ..models import JobEvent
+
 
+@login_required
 def calendar_view(request):
     """Calendar view with interviews, follow-ups, and deadlines"""
-    user_jobs = JobEntry.objects.filter(user=request.user).select_related('category').only(
-        'id', 'job_title', 'employer', 'interview_date', 'follow_up_date', 
-        'application_deadline', 'category__name', 'category__color'
-    )
-    
-    # Get all events (not just upcoming) for calendar display
     now = timezone.now()
-    today = now.date()
+    # Deadlines are stored at the start of their day, so today's still count
+    start_of_today = timezone.make_aware(datetime.combine(timezone.localdate(now), time.min))
     
-    # Optimize queries by using single queryset with conditional filtering
-    interviews = user_jobs.exclude(interview_date__isnull=True).order_by('interview_date')
-    follow_ups = user_jobs.exclude(follow_up_date__isnull=True).order_by('follow_up_date')
-    deadlines = user_jobs.exclude(application_deadline__isnull=True).order_by('application_deadline')
-    
-    # Also get upcoming for the list view (evaluate querysets only when needed)
-    upcoming_interviews = interviews.filter(interview_date__gte=now)
-    upcoming_follow_ups = follow_ups.filter(follow_up_date__gte=now)
-    upcoming_deadlines = deadlines.filter(application_deadline__gte=today)
+    # Upcoming events for the lists below the calendar, in one scan of the (user, at)
+    # index; the calendar itself loads the visible range from the calendar API
+    upcoming = {kind: [] for kind in EVENT_FIELDS}
+    events = JobEvent.objects.filter(user=request.user, at__gte=start_of_today).select_related('job_entry').only(
+        'kind', 'at', 'job_entry__id', 'job_entry__job_title', 'job_entry__employer',
+        'job_entry__interview_date', 'job_entry__follow_up_date', 'job_entry__application_deadline'
+    ).order_by('at', 'job_entry_id')
+    for event in events:
+        if event.kind == 'deadline' or event.at >= now:
+            upcoming[event.kind].append(event.job_entry)
     
     context = {
-        'interviews': upcoming_interviews,
-        'follow_ups': upcoming_follow_ups,
-        'deadlines': upcoming_deadlines,
-        # For calendar
-        'all_interviews': interviews,
-        'all_follow_ups': follow_ups,
-        'all_deadlines': deadlines,
+        'interviews': upcoming['interview'],
+        'follow_ups': upcoming['follow_up'],
+        'deadlines': upcoming['deadline'],
+        'feed_url': request.build_absolute_uri(
+            reverse('jobs:calendar_feed') + f'?token={get_calendar_token(request.user)}'
+        ),
     }
     return render(request, 'jobs/calendar.html', context)
 
+
+def _feed_validators(request):
+    """Cached validators of the requested feed; None for an unknown token (the view answers 404)"""
+    if not hasattr(request, '_calendar_feed_user_id'):
+        request._calendar_feed_user_id = resolve_calendar_token(request.GET.get('token', ''))
+    if request._calendar_feed_user_id is None:
+        return None
+    return feed_validators(request._calendar_feed_user_id)
+
+
+def _feed_etag(request):
+    validators = _feed_validators(request)
+    return validators['etag'] if validators else None
+
+
+def _feed_last_modified(request):
+    validators = _feed_validators(request)
+    return validators['last_modified'] if validators else None
+
+
+@require_GET
+@condition(etag_func=_feed_etag, last_modified_func=_feed_last_modified)
+def calendar_feed(request):
+    """
+    ICS feed of the user's interviews, follow-ups and deadlines, authenticated by its token.
+    
+    Unchanged feeds are answered with 304 Not Modified by the condition decorator
+    from cached validators, without database queries.
+    """
+    user_id = request._calendar_feed_user_id
+    if user_id is None:
+        raise Http404
+    base_url = request.build_absolute_uri('/').rstrip('/')
+    response = StreamingHttpResponse(
+        iter_calendar_feed(user_id, base_url, str(_('Job Search'))),
+        content_type='text/calendar; charset=utf-8'
+    )
+    response['Content-Disposition'] = 'inline; filename="calendar.ics"'
+    # The token is in the URL - keep the feed out of shared caches
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@login_required
+@require_POST
+def reset_calendar_feed(request):
+    """Replace the feed token, revoking the old subscription URL"""
+    reset_calendar_token(request.user)
+    messages.success(request, _('A new calendar feed URL was created. The old URL no longer works.'))
+    return redirect('jobs:calendar')
@@ -7,14 +7,11 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from ..models import Category
 from ..forms import CategoryForm
+from ..caching import get_all_categories
 
 def categories_list(request):
     """List all categories"""
-    from django.core.cache import cache
-    categories = cache.get('all_categories')
-    if categories is None:
-        categories = list(Category.objects.only('id', 'name', 'color').order_by('name'))
-        cache.set('all_categories', categories, 3600)
+    categories = get_all_categories()
     return render(request, 'jobs/categories.html', {'categories': categories})
 
 
@@ -25,10 +22,7 @@ def create_category(request):
     if request.method == 'POST':
         form = CategoryForm(request.POST)
         if form.is_valid():
-            form.save()
-            # Invalidate cache
-            from django.core.cache import cache
-            cache.delete('all_categories')
+            form.save()  # Cache is invalidated by the post_save signal
             messages.success(request, _('Category created successfully!'))
             return redirect('jobs:categories_list')
     else:
@@ -44,10 +38,7 @@ def edit_category(request, category_id):
     if request.method == 'POST':
         form = CategoryForm(request.POST, instance=category)
         if form.is_valid():
-            form.save()
-            # Invalidate cache
-            from django.core.cache import cache
-            cache.delete('all_categories')
+            form.save()  # Cache is invalidated by the post_save signal
             messages.success(request, _('Category updated successfully!'))
             return redirect('jobs:categories_list')
     else:
@@ -62,10 +53,7 @@ def delete_category(request, category_id):
     category = get_object_or_404(Category, id=category_id)
     if request.method == 'POST':
         category_name = category.name
-        category.delete()
-        # Invalidate cache
-        from django.core.cache import cache
-        cache.delete('all_categories')
+        category.delete()  # Cache is invalidated by the post_delete signal
         messages.success(request, _('Category "%(name)s" deleted successfully!') % {'name': category_name})
         return redirect('jobs:categories_list')
     return render(request, 'jobs/delete_category.html', {'category': category})
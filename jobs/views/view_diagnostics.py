@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.utils.crypto import constant_time_compare
+from ..caching import tiered_cache
+from ..timing import timing_stats
+from ..metrics import render_metrics
+
+
+@staff_member_required
+def cache_stats(request):
+    """Hit and miss counters of the two-tier cache in this process (staff only)"""
+    return JsonResponse({'tiered_cache': tiered_cache.stats()})
+
+
+@staff_member_required
+def request_timing_stats(request):
+    """Per-view latency percentiles (total, db, cache, template, pdf) in this process (staff only)"""
+    return JsonResponse({'views': timing_stats.snapshot()})
+
+
+def prometheus_metrics(request):
+    """Application metrics in Prometheus text format (bearer METRICS_TOKEN or staff session)"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorization = request.headers.get('Authorization', '')
+    if not (token and constant_time_compare(authorization, f'Bearer {token}')) and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
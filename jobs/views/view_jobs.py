@@ -2,12 +2,16 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
-from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from ..models import JobEntry, Category, Tag, ResumeSubmissionStatus
+from ..models import JobEntry, ResumeSubmissionStatus
 from ..forms import JobEntryForm, ResumeSubmissionStatusForm
 from ..pdf_generator import generate_job_pdf
+from ..caching import get_all_categories, get_all_tags
+from ..search import search_job_entries
+from ..db_routing import using_replica
+from ..query_budget import query_budget
+from ..throttling import throttle_scope
 from ..utils import format_history_item, sync_status_from_resume_status, sync_resume_status_from_flags, sync_resume_status_from_general_status
 
 
@@ -27,6 +31,7 @@ def create_job(request):
 
 
 @login_required
+@query_budget(max_queries=20)
 
 def job_list(request):
     """List all user's job entries with advanced search and filters"""
@@ -35,15 +40,8 @@ def job_list(request):
     # Advanced search
     search_query = request.GET.get('search', '')
     if search_query:
-        job_entries = job_entries.filter(
-            Q(job_title__icontains=search_query) |
-            Q(employer__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(address__icontains=search_query) |
-            Q(notes__icontains=search_query) |
-            Q(contact_email__icontains=search_query) |
-            Q(contact_phone__icontains=search_query)
-        )
+        # Full-text search on PostgreSQL, icontains elsewhere
+        job_entries = search_job_entries(job_entries, search_query)
     
     # Filters
     status_filter = request.GET.get('status', '')
@@ -89,16 +87,8 @@ def job_list(request):
         job_entries = job_entries.order_by(sort_by)
     
     # Get filter options (cached as they rarely change)
-    from django.core.cache import cache
-    categories = cache.get('all_categories')
-    if categories is None:
-        categories = list(Category.objects.only('id', 'name', 'color').order_by('name'))
-        cache.set('all_categories', categories, 3600)  # Cache for 1 hour
-    
-    tags = cache.get('all_tags')
-    if tags is None:
-        tags = list(Tag.objects.only('id', 'name').order_by('name'))
-        cache.set('all_tags', tags, 3600)  # Cache for 1 hour
+    categories = get_all_categories()
+    tags = get_all_tags()
     
     context = {
         'job_entries': job_entries,
@@ -117,6 +107,7 @@ def job_list(request):
 
 
 @login_required
+@query_budget(max_queries=20)
 
 def job_detail(request, job_id):
     """Job entry detail view"""
@@ -444,16 +435,18 @@ def delete_job(request, job_id):
 
 
 @login_required
-
+@throttle_scope('pdf')
 def download_job_pdf(request, job_id):
     """Download PDF file with job entry information"""
-    job_entry = get_object_or_404(JobEntry, id=job_id, user=request.user)
+    with using_replica(request.user):
+        job_entry = get_object_or_404(JobEntry, id=job_id, user=request.user)
     
     try:
         # Get current user language
         from django.utils.translation import get_language
         language_code = get_language() or 'ru'
         # Note: generate_job_pdf doesn't use username, but we keep it for consistency
+        # (related data is read from the same database as job_entry)
         pdf_buffer = generate_job_pdf(job_entry, language_code)
         response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
         filename = f"vacancy_{job_entry.id}_{job_entry.job_title[:50]}.pdf"
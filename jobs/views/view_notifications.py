@@ -6,6 +6,8 @@ from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from ..models import Notification
+from ..caching import bump_user_generation
+from ..utils import get_unread_notifications_count
 
 def notifications(request):
     """User notifications"""
@@ -69,13 +71,12 @@ def notifications(request):
     # Mark as read if viewing
     if request.GET.get('mark_read'):
         Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
-        # Invalidate cache
-        from django.core.cache import cache
-        cache.delete(f'notifications_count_{request.user.id}')
+        # Invalidate cache (queryset update() does not send signals)
+        bump_user_generation(request.user)
         
         # Return JSON response for AJAX requests or redirect for regular requests
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            unread_count = Notification.objects.filter(user=request.user, is_read=False).count()
+            unread_count = get_unread_notifications_count(request.user)
             return JsonResponse({'success': True, 'unread_count': unread_count})
         
         messages.success(request, _('All notifications marked as read!'))
@@ -94,15 +95,11 @@ def mark_notification_read(request, notification_id):
     """Mark notification as read"""
     notification = get_object_or_404(Notification, id=notification_id, user=request.user)
     notification.is_read = True
-    notification.save()
-    
-    # Invalidate cache
-    from django.core.cache import cache
-    cache.delete(f'notifications_count_{request.user.id}')
+    notification.save()  # Cache is invalidated by the post_save signal
     
     # Return JSON response for AJAX requests or redirect for regular requests
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        unread_count = Notification.objects.filter(user=request.user, is_read=False).count()
+        unread_count = get_unread_notifications_count(request.user)
         return JsonResponse({'success': True, 'unread_count': unread_count})
     return redirect('jobs:notifications')
 
@@ -115,13 +112,12 @@ def delete_notification(request, notification_id):
     
     if request.method == 'POST':
         notification.delete()
-        # Invalidate cache
-        from django.core.cache import cache
-        cache.delete(f'notifications_count_{request.user.id}')
+        # Notification deletions send no cache-invalidating signal (see jobs.signals)
+        bump_user_generation(request.user)
         
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             # AJAX request
-            unread_count = Notification.objects.filter(user=request.user, is_read=False).count()
+            unread_count = get_unread_notifications_count(request.user)
             return JsonResponse({'success': True, 'unread_count': unread_count})
         else:
             messages.success(request, _('Notification deleted successfully!'))
@@ -135,10 +131,9 @@ def delete_notification(request, notification_id):
 def delete_all_notifications(request):
     """Delete all notifications for the user"""
     if request.method == 'POST':
+        # A single DELETE query; invalidate the cache once for all rows
         deleted_count = Notification.objects.filter(user=request.user).delete()[0]
-        # Invalidate cache
-        from django.core.cache import cache
-        cache.delete(f'notifications_count_{request.user.id}')
+        bump_user_generation(request.user)
         
         messages.success(request, _('%(count)s notification(s) deleted successfully!') % {'count': deleted_count})
         return redirect('jobs:notifications')
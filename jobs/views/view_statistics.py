@@ -8,9 +8,14 @@ from django.utils.translation import gettext_lazy as _
 from ..models import JobEntry
 from ..pdf_generator import generate_statistics_pdf, generate_monthly_report_pdf
 from ..utils import get_statistics_data, get_user_display_name
+from ..caching import cached_user_compute
+from ..db_routing import using_replica
+from ..query_budget import query_budget
+from ..throttling import throttle_scope
 
 
 @login_required
+@query_budget(max_queries=40)
 def statistics(request):
     """Complete statistics for job entries with advanced analytics"""
     user_jobs = JobEntry.objects.filter(user=request.user).select_related('category').only(
@@ -18,16 +23,22 @@ def statistics(request):
         'created_at', 'resume_submitted_date', 'response_date', 'rejection_date',
         'employer', 'category__name'
     )
-    context = get_statistics_data(user_jobs)
+    with using_replica(request.user):
+        context = cached_user_compute(
+            request.user, 'statistics', lambda: get_statistics_data(user_jobs, request.user)
+        )
     return render(request, 'jobs/statistics.html', context)
 
 
 @login_required
-
+@throttle_scope('pdf')
 def download_statistics_pdf(request):
     """Download PDF file with statistics"""
     user_jobs = JobEntry.objects.filter(user=request.user)
-    statistics_data = get_statistics_data(user_jobs)
+    with using_replica(request.user):
+        statistics_data = cached_user_compute(
+            request.user, 'statistics', lambda: get_statistics_data(user_jobs, request.user)
+        )
     
     try:
         # Get current user language
@@ -46,7 +57,23 @@ def download_statistics_pdf(request):
 
 
 def _get_monthly_report_job_entries(user, year, month):
-    """Helper function to get filtered and sorted job entries for monthly report"""
+    """Helper function to get filtered and sorted job entries for monthly report (cached per user)"""
+    # Entries keep their replica alias, so related lookups made later also read from it
+    with using_replica(user):
+        return cached_user_compute(
+            user, 'monthly_report_entries',
+            lambda: _query_monthly_report_job_entries(user, year, month),
+            parts=(year, month)
+        )
+
+
+def _monthly_report_id_queries(user, year, month):
+    """
+    The two independent ID queries behind the monthly report.
+    
+    Returns:
+        tuple: (ids by resume_submitted_date, ids by 'resume_sent' status) querysets
+    """
     from datetime import datetime
     from calendar import monthrange
     
@@ -62,65 +89,75 @@ def _get_monthly_report_job_entries(user, year, month):
     # Exclude entries with status='not_applied' as they don't have submitted documents
     
     # Get IDs from both querysets to avoid union issues
-    entries_by_date_ids = set(JobEntry.objects.filter(
+    entries_by_date_ids = JobEntry.objects.filter(
         user=user,
         resume_submitted_date__gte=first_day,
         resume_submitted_date__lte=last_day
-    ).exclude(resume_submitted_date__isnull=True).exclude(status='not_applied').values_list('id', flat=True))
+    ).exclude(resume_submitted_date__isnull=True).exclude(status='not_applied').values_list('id', flat=True)
     
-    entries_by_status_ids = set(JobEntry.objects.filter(
+    entries_by_status_ids = JobEntry.objects.filter(
         user=user,
         resume_statuses__status_type='resume_sent',
         resume_statuses__date_time__gte=first_day,
         resume_statuses__date_time__lte=last_day
-    ).exclude(status='not_applied').values_list('id', flat=True))
+    ).exclude(status='not_applied').values_list('id', flat=True)
     
-    # Combine IDs and get all job entries
-    all_ids = entries_by_date_ids | entries_by_status_ids
+    return entries_by_date_ids, entries_by_status_ids
+
+
+def _query_monthly_report_job_entries(user, year, month, all_ids=None):
+    """
+    Query, filter and sort job entries for monthly report
+    
+    Args:
+        all_ids: IDs from _monthly_report_id_queries() when already loaded (e.g. concurrently)
+    """
+    if all_ids is None:
+        # Combine IDs and get all job entries
+        entries_by_date_ids, entries_by_status_ids = _monthly_report_id_queries(user, year, month)
+        all_ids = set(entries_by_date_ids) | set(entries_by_status_ids)
     
-    # Get job entries with prefetch for performance
+    # Get job entries with prefetch for performance (the report serializes category and tags)
     # Additional filter: exclude entries that don't have any resume submission evidence
     job_entries = list(JobEntry.objects.filter(
         id__in=all_ids
-    ).prefetch_related('resume_statuses', 'history').exclude(
+    ).select_related('category').prefetch_related('resume_statuses', 'history', 'tags').exclude(
         status='not_applied'
     ))
     
     # Final filter: ensure each entry has evidence of document submission
     # Either has resume_submitted_date OR has ResumeSubmissionStatus with 'resume_sent'
+    # (filtered in Python: .filter() on the relation would bypass the prefetch, one query per entry)
     filtered_entries = []
     for job in job_entries:
-        has_resume_submitted_date = job.resume_submitted_date is not None
-        has_resume_sent_status = job.resume_statuses.filter(status_type='resume_sent').exists()
-        
-        if has_resume_submitted_date or has_resume_sent_status:
-            filtered_entries.append(job)
-    
-    job_entries = filtered_entries
+        resume_sent_dates = [
+            resume_status.date_time for resume_status in job.resume_statuses.all()
+            if resume_status.status_type == 'resume_sent'
+        ]
+        if job.resume_submitted_date is not None or resume_sent_dates:
+            filtered_entries.append((job, resume_sent_dates))
     
-    # Sort by date: use resume_submitted_date if available, otherwise use date from ResumeSubmissionStatus
-    def get_sort_date(job):
+    # Sort by date: use resume_submitted_date if available, otherwise the earliest 'resume_sent' status
+    def get_sort_date(entry):
+        job, resume_sent_dates = entry
         if job.resume_submitted_date:
             return job.resume_submitted_date
-        # Try to get date from ResumeSubmissionStatus
-        try:
-            resume_status = job.resume_statuses.filter(status_type='resume_sent').order_by('date_time').first()
-            if resume_status:
-                return resume_status.date_time
-        except Exception:
-            pass
+        if resume_sent_dates:
+            return min(resume_sent_dates)
         # Fallback to created_at
         return job.created_at or timezone.now()
     
-    job_entries.sort(key=get_sort_date)
-    return job_entries
+    return [job for job, _ in sorted(filtered_entries, key=get_sort_date)]
 
 
 
 def _parse_year_month(request):
-    """Helper function to parse year and month from request"""
+    """Helper function to parse year and month from request (?year=&month= or ?month=YYYY-MM)"""
     year = request.GET.get('year')
     month = request.GET.get('month')
+    if not year and month and '-' in month:
+        # API style: a single ?month=YYYY-MM parameter
+        year, month = month.split('-', 1)
     
     # If not provided, use current month
     if not year or not month:
@@ -142,6 +179,7 @@ def _parse_year_month(request):
 
 
 @login_required
+@query_budget(max_queries=30)
 
 def monthly_report(request):
     """Display monthly report HTML page"""
@@ -300,7 +338,7 @@ def monthly_report(request):
 
 
 @login_required
-
+@throttle_scope('pdf')
 def monthly_report_pdf(request):
     """Generate monthly report PDF"""
     year, month = _parse_year_month(request)
@@ -7,14 +7,11 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from ..models import Tag
 from ..forms import TagForm
+from ..caching import get_all_tags
 
 def tags_list(request):
     """List all tags"""
-    from django.core.cache import cache
-    tags = cache.get('all_tags')
-    if tags is None:
-        tags = list(Tag.objects.only('id', 'name').order_by('name'))
-        cache.set('all_tags', tags, 3600)
+    tags = get_all_tags()
     return render(request, 'jobs/tags.html', {'tags': tags})
 
 